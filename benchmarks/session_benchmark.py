@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+HTTP session mode benchmark for Bulk IPO Manager
+
+Sends the same number of profile reads through MeroShareClient with each
+session mode (shared, thread, pool) and worker count, against a local mock
+backend. Every combination runs in a fresh interpreter so settings and
+connection pools start clean. Reports throughput, latency percentiles, CPU
+time per request and how many sessions were opened.
+
+Results are printed as JSON; pass --output to append them to a JSON-lines
+file so the numbers can be tracked across commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils.mock_server import MockMeroShareServer
+
+MODES = ("shared", "thread", "pool")
+
+RUN_SNIPPET = """
+import json, sys, time
+from concurrent.futures import ThreadPoolExecutor
+from src.api.meroshare_client import MeroShareClient
+from src.models.user import User
+from src.utils.capacity_simulator import percentile
+
+workers, total = int(sys.argv[1]), int(sys.argv[2])
+client = MeroShareClient()
+token = client.authenticate(User(1, "bench", "secret", "crn", 1234))
+assert token, "authentication against mock server failed"
+
+latencies = []
+
+def call(_):
+    started = time.perf_counter()
+    ok = client.get_personal_details(token) is not None
+    latencies.append(time.perf_counter() - started)
+    return ok
+
+cpu = time.process_time()
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers=workers) as executor:
+    succeeded = sum(executor.map(call, range(total)))
+    sessions = len(client.session_pool)
+elapsed = time.perf_counter() - started
+cpu = time.process_time() - cpu
+
+latencies.sort()
+print(json.dumps({
+    "requests": total,
+    "failed": total - succeeded,
+    "seconds": round(elapsed, 3),
+    "requests_per_second": round(total / elapsed, 1),
+    "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+    "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    "cpu_ms_per_request": round(cpu / total * 1000, 3),
+    "sessions": sessions,
+}))
+"""
+
+
+def run(mode: str, workers: int, requests: int, env: dict) -> dict:
+    """Run one mode/worker combination in a fresh interpreter"""
+    env = dict(
+        env,
+        IPO_SESSION_MODE=mode,
+        IPO_MAX_CONCURRENT=str(workers),
+        IPO_RESPONSE_CACHE="false",
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", RUN_SNIPPET, str(workers), str(requests)],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def git_revision() -> str:
+    """Current commit, if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--workers",
+        default="2,8,32,128",
+        help="Comma-separated worker counts (default: 2,8,32,128)",
+    )
+    parser.add_argument(
+        "--modes", default=",".join(MODES), help="Comma-separated session modes"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Requests per combination"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.005,
+        help="Mock backend latency per request in seconds",
+    )
+    parser.add_argument("--output", help="Append results to this JSON-lines file")
+    args = parser.parse_args()
+
+    workers = [int(count) for count in args.workers.split(",")]
+    modes = args.modes.split(",")
+    results = []
+    with MockMeroShareServer(latency=args.latency) as server:
+        env = dict(os.environ, IPO_API_BASE_URL=server.base_url)
+        for count in workers:
+            for mode in modes:
+                row = {"mode": mode, "workers": count}
+                row.update(run(mode, count, args.requests, env))
+                results.append(row)
+                print(
+                    f"{mode:>6} x{count:<4} {row['requests_per_second']:>8.1f} req/s  "
+                    f"p50 {row['p50_ms']:>7.2f} ms  p99 {row['p99_ms']:>8.2f} ms  "
+                    f"cpu {row['cpu_ms_per_request']:.3f} ms/req  "
+                    f"sessions {row['sessions']}",
+                    file=sys.stderr,
+                )
+
+    result = {
+        "benchmark": "sessions",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "latency": args.latency,
+        "results": results,
+    }
+
+    print(json.dumps(result, indent=2))
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
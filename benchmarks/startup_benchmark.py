@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for Bulk IPO Manager
+
+Measures, in fresh interpreter processes:
+  * import time of main.py
+  * time to first request: imports, service construction and one
+    authentication round trip against a local mock backend
+
+Results are printed as JSON; pass --output to append them to a JSON-lines
+file so the numbers can be tracked across commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils.mock_server import MockMeroShareServer
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+FIRST_REQUEST_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+from src.services.application_service import ApplicationService
+from src.models.user import User
+service = ApplicationService()
+token = service.client.authenticate(User(1, "bench", "secret", "crn", 1234))
+assert token, "authentication against mock server failed"
+print(time.perf_counter() - start)
+"""
+
+
+def run_snippet(snippet: str, env: dict) -> float:
+    """Run a snippet in a fresh interpreter and return its reported time"""
+    output = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def git_revision() -> str:
+    """Current commit, if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions per metric")
+    parser.add_argument("--output", help="Append results to this JSON-lines file")
+    args = parser.parse_args()
+
+    with MockMeroShareServer() as server:
+        env = dict(os.environ, IPO_API_BASE_URL=server.base_url)
+
+        import_times = [run_snippet(IMPORT_SNIPPET, env) for _ in range(args.runs)]
+        first_request_times = [
+            run_snippet(FIRST_REQUEST_SNIPPET, env) for _ in range(args.runs)
+        ]
+
+    result = {
+        "benchmark": "startup",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "runs": args.runs,
+        "import_seconds": round(statistics.median(import_times), 4),
+        "first_request_seconds": round(statistics.median(first_request_times), 4),
+    }
+
+    print(json.dumps(result, indent=2))
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
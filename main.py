@@ -5,6 +5,7 @@ Main entry point for Bulk IPO Manager v2.0
 
 import sys
 import json
+import argparse
 from pathlib import Path
 
 # Add src to Python path
@@ -12,12 +13,11 @@ src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from src.utils.logger import setup_logging
-from src.services.account_service import AccountService
-from src.services.ipo_service import IPOService
-from src.services.application_service import ApplicationService
 from src.config.settings import get_settings
 from src.config.constants import UIConstants
-from src.utils.capital_lookup import CapitalLookup
+
+# Services (and with them requests) are imported inside the functions that
+# use them so the menu and cron-triggered runs start without paying for them.
 
 
 def display_results(result):
@@ -31,6 +31,17 @@ def display_results(result):
     print(f"{UIConstants.FAILED_EMOJI} Failed: {stats['failed']}")
     print(f"📈 Success Rate: {stats['success_rate']}%")
     print(f"⏱️ Duration: {stats['duration_seconds']} seconds")
+    transfer = result.transfer
+    if transfer.get("per_account", {}).get("accounts"):
+        total = transfer["total"]
+        print(
+            f"📦 Transfer: {(total['sent'] + total['received']) / 1024:.1f} KB, "
+            f"{transfer['per_account']['average_bytes'] / 1024:.1f} KB per account"
+        )
+    if stats["stuck_attempts"]:
+        print(
+            f"{UIConstants.WARNING_EMOJI} Stuck attempts reassigned: {stats['stuck_attempts']}"
+        )
 
     if stats["failed"] > 0:
         print(f"\n{UIConstants.WARNING_EMOJI} Error Summary:")
@@ -44,9 +55,39 @@ def display_results(result):
 
     print(f"\n💾 Results saved to: {settings.results_path}")
 
+    if settings.SAVE_HISTORY:
+        from src.storage.results_store import ResultsStore
+
+        store = ResultsStore(settings.history_path)
+        try:
+            run_id = store.save_result(result)
+        finally:
+            store.close()
+        print(f"🗄️ Run #{run_id} added to history: {settings.history_path}")
+
+
+def display_reconciliation(result, summary, results_path=None):
+    """Display reconciliation outcome and save the corrected results"""
+    print(f"\n🔎 Reconciliation against applied-issue reports")
+    print("=" * 60)
+    print(f"{UIConstants.SUCCESS_EMOJI} Verified: {summary['verified']}")
+    print(f"{UIConstants.WARNING_EMOJI} Mismatched: {summary['mismatched']}")
+    print(f"{UIConstants.PENDING_EMOJI} Unverified: {summary['unverified']}")
+
+    for app in result.mismatched_applications:
+        print(f"  • {app.user_name}: now {app.status} {app.error_message}".rstrip())
+
+    results_path = results_path or get_settings().results_path
+    with open(results_path, "w") as f:
+        json.dump(result.to_dict(), f, indent=2)
+
+    print(f"\n💾 Reconciled results saved to: {results_path}")
+
 
 def capital_lookup_menu():
     """Interactive capital lookup menu"""
+    from src.utils.capital_lookup import CapitalLookup
+
     try:
         lookup = CapitalLookup("capitals.json")
     except FileNotFoundError:
@@ -165,6 +206,10 @@ def show_account_setup_guide():
 
 def run_bulk_ipo_application():
     """Run the bulk IPO application"""
+    from src.services.account_service import AccountService
+    from src.services.ipo_service import IPOService
+    from src.services.application_service import ApplicationService
+
     try:
         # Initialize services
         account_service = AccountService()
@@ -184,10 +229,9 @@ def run_bulk_ipo_application():
 
         print(f"{UIConstants.SUCCESS_EMOJI} Loaded {len(accounts)} accounts")
 
-        # Get available IPOs from first account
+        # Get available IPOs from a sample of accounts
         print(f"\n{UIConstants.INFO_EMOJI} Fetching available IPOs...")
-        sample_user = accounts[0]
-        available_ipos = ipo_service.get_available_ipos(sample_user)
+        available_ipos = ipo_service.get_available_ipos_for_accounts(accounts)
 
         if not available_ipos:
             print(f"{UIConstants.ERROR_EMOJI} No IPOs available for application!")
@@ -249,12 +293,26 @@ def run_bulk_ipo_application():
                 if confirm == "y":
                     # Process bulk applications
                     result = application_service.process_bulk_applications(
-                        accounts, company_id, kitta
+                        accounts,
+                        company_id,
+                        kitta,
+                        ipo_service.close_deadline(selected_ipo),
                     )
 
                     # Display results
                     display_results(result)
 
+                    verify = (
+                        input("\n🔎 Verify against MeroShare applied-issue reports? (y/N): ")
+                        .lower()
+                        .strip()
+                    )
+                    if verify == "y":
+                        summary = application_service.reconciliation.reconcile(
+                            result, accounts
+                        )
+                        display_reconciliation(result, summary)
+
                     # Ask about retrying failed applications
                     if result.failed > 0:
                         settings = get_settings()
@@ -297,12 +355,603 @@ def run_bulk_ipo_application():
         traceback.print_exc()
 
 
-def main():
-    """Main application entry point"""
-    # Setup logging
-    setup_logging()
+def run_coordinator(args):
+    """Queue applications and wait for workers to drain the queue"""
+    from src.services.account_service import AccountService
+    from src.services.coordinator_service import CoordinatorService
+
+    account_service = AccountService()
+    coordinator = CoordinatorService(args.queue)
+
+    accounts = account_service.load_accounts(args.accounts)
+    if not accounts:
+        print(f"{UIConstants.ERROR_EMOJI} No accounts loaded. Please check accounts.txt")
+        return
+
+    added = coordinator.enqueue(accounts, args.company_id, args.kitta)
+    print(
+        f"{UIConstants.INFO_EMOJI} Queued {added} new tasks "
+        f"({len(accounts)} accounts) in {coordinator.queue_path}"
+    )
+
+    processes = coordinator.start_local_workers(args.workers, args.accounts)
+    if args.workers:
+        print(f"⚙️ Started {args.workers} local workers")
+    else:
+        print(f"{UIConstants.PENDING_EMOJI} Waiting for external workers...")
+
+    result = coordinator.wait_for_completion(args.company_id, processes)
+    display_results(result)
+
+
+def run_worker(args):
+    """Process queued applications until the queue is drained"""
+    from src.services.account_service import AccountService
+    from src.services.coordinator_service import CoordinatorService
+
+    accounts = AccountService().load_accounts(args.accounts)
+    completed = CoordinatorService(args.queue).run_worker(accounts)
+    print(f"{UIConstants.SUCCESS_EMOJI} Worker finished {completed} tasks")
+
+
+def run_replay(args):
+    """Replay recorded traffic through the bulk pipeline offline"""
+    from src.api.cassette import Cassette
+    from src.api.meroshare_client import MeroShareClient
+    from src.config.constants import APIEndpoints
+    from src.services.application_service import ApplicationService
+
+    cassette = Cassette(args.cassette, mode="replay", latency_scale=args.latency_scale)
+    MeroShareClient.transport = cassette
+
+    applies = [
+        interaction["request"]
+        for interaction in cassette.interactions
+        if interaction["template"] == APIEndpoints.APPLY_SHARE
+    ]
+    company_id = args.company_id or (applies[0]["companyShareId"] if applies else None)
+    kitta = args.kitta or (applies[0]["appliedKitta"] if applies else None)
+    if company_id is None or kitta is None:
+        print(f"{UIConstants.ERROR_EMOJI} No apply request recorded; pass --company-id and --kitta")
+        sys.exit(2)
+
+    users = cassette.replay_users()
+    result = ApplicationService().process_bulk_applications(users, company_id, kitta)
+    stats = result.get_statistics()
+    print(
+        f"\n{UIConstants.INFO_EMOJI} Replayed {stats['total_accounts']} accounts in "
+        f"{stats['duration_seconds']}s ({stats['successful']} successful)"
+    )
+
+    recorded = cassette.recorded_calls_per_account()
+    for account, count in sorted(cassette.calls.items()):
+        print(f"  • {account}: {count} calls (recorded {recorded.get(account, 0)})")
+
+    try:
+        cassette.assert_calls_per_account(args.max_calls_per_account)
+    except AssertionError as e:
+        print(f"{UIConstants.ERROR_EMOJI} {e}")
+        sys.exit(1)
+
+    print(f"{UIConstants.SUCCESS_EMOJI} Call budget respected")
+
+
+def run_reconcile(args):
+    """Verify a saved results file against each account's applied-issue report"""
+    from src.models.application_result import ApplicationResult
+    from src.services.account_service import AccountService
+    from src.services.reconciliation_service import ReconciliationService
+
+    settings = get_settings()
+    results_path = Path(args.results) if args.results else settings.results_path
+    if not results_path.exists():
+        print(f"{UIConstants.ERROR_EMOJI} No results file at {results_path}")
+        sys.exit(1)
+
+    with open(results_path, "r") as f:
+        result = ApplicationResult.from_dict(json.load(f))
+
+    accounts = AccountService().load_accounts(args.accounts)
+    print(
+        f"{UIConstants.INFO_EMOJI} Reconciling {result.total_accounts} applications "
+        f"across {len(accounts)} accounts..."
+    )
+    summary = ReconciliationService().reconcile(result, accounts)
+    display_reconciliation(result, summary, results_path)
+
+
+def run_simulate(args):
+    """Estimate run time for given settings from recorded latencies"""
+    from collections import Counter
+    from src.utils.capacity_simulator import (
+        CapacitySimulator,
+        LatencyProfile,
+        SimulationConfig,
+    )
+
+    settings = get_settings()
+    profile = LatencyProfile.from_cassettes(args.profile, args.default_latency)
+
+    dp_sizes = None
+    if args.accounts:
+        from src.services.account_service import AccountService
+
+        users = AccountService().load_accounts(args.accounts)
+        dp_sizes = list(Counter(user.client_id for user in users).values())
+
+    config = SimulationConfig(
+        accounts=args.count,
+        concurrency=args.concurrency or settings.MAX_CONCURRENT_REQUESTS,
+        rate_limit_delay=(
+            args.rate_limit if args.rate_limit is not None else settings.RATE_LIMIT_DELAY
+        ),
+        dp_count=args.dps,
+        dp_sizes=dp_sizes,
+        dp_max_concurrent=(
+            args.dp_cap if args.dp_cap is not None else settings.DP_MAX_CONCURRENT
+        ),
+        in_run_retries=(
+            args.retries if args.retries is not None else settings.IN_RUN_RETRIES
+        ),
+        retry_delay=settings.RETRY_DELAY,
+        exponential_backoff=settings.EXPONENTIAL_BACKOFF,
+        prefilter=settings.ELIGIBILITY_PREFILTER,
+    )
+    report = CapacitySimulator(profile, seed=args.seed).run(config, args.runs)
+
+    if args.json:
+        print(json.dumps({"profile": profile.summary(), **report.to_dict()}, indent=2))
+        return
+
+    accounts = sum(dp_sizes) if dp_sizes else config.accounts
+    print(f"\n{UIConstants.INFO_EMOJI} Simulated {report.runs} runs of {accounts} accounts")
+    print("=" * 60)
+    print(f"⚙️ Concurrency {config.concurrency}, rate limit {config.rate_limit_delay}s, "
+          f"DP cap {config.dp_max_concurrent or 'none'}, retries {config.in_run_retries}")
+    print(f"⏱️ Expected completion: {report.completion_seconds}s "
+          f"(p95 {report.completion_p95_seconds}s)")
+    print(f"👤 Account finish time: p50 {report.account_p50_seconds}s, "
+          f"p99 {report.account_p99_seconds}s")
+    print(f"📈 Success rate: {report.success_rate}%")
+    print(f"🚧 Bottleneck: {report.bottleneck}")
+    for name, seconds in sorted(report.bounds.items(), key=lambda item: -item[1]):
+        print(f"  • {name}: {seconds}s")
+    print("⏳ Time spent per endpoint:")
+    for template, share in report.endpoint_share.items():
+        print(f"  • {template}: {share}%")
+
+
+def run_watch(args):
+    """Poll for new issues and apply to them by rule until interrupted"""
+    from src.services.account_service import AccountService
+    from src.services.watch_service import WatchService, load_rules
+
+    settings = get_settings()
+    rules, open_times = load_rules(Path(args.rules))
+    accounts = AccountService().load_accounts(args.accounts)
+    if not accounts:
+        print(f"{UIConstants.ERROR_EMOJI} No accounts loaded")
+        sys.exit(1)
+
+    watcher = WatchService(rules, open_times)
+    print(f"\n👀 Watching for new issues with {len(rules)} rules, {len(accounts)} accounts")
+    print(f"{UIConstants.INFO_EMOJI} Opening times: {', '.join(f'{h:02d}:{m:02d}' for h, m in watcher.open_times)} "
+          f"(every {settings.WATCH_FAST_INTERVAL}s within {settings.WATCH_FAST_WINDOW} min, "
+          f"{settings.WATCH_SLOW_INTERVAL}s otherwise)")
+
+    def on_result(result, issue, rule):
+        display_results(result)
+
+    if args.once:
+        watcher.poll(accounts, on_result)
+        return
+
+    try:
+        watcher.run(accounts, on_result)
+    except KeyboardInterrupt:
+        watcher.stop()
+        print(f"\n{UIConstants.WARNING_EMOJI} Watch stopped")
+
+
+def parse_release_time(value):
+    """Parse --at as local time: HH:MM[:SS[.ffffff]] today, or an ISO datetime"""
+    from datetime import datetime
+
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+    for fmt in ("%H:%M:%S.%f", "%H:%M:%S", "%H:%M"):
+        try:
+            clock = datetime.strptime(value, fmt).time()
+        except ValueError:
+            continue
+        return datetime.combine(datetime.now().date(), clock).timestamp()
+    raise argparse.ArgumentTypeError(f"invalid time: {value}")
+
+
+def run_schedule(args):
+    """Prepare applications ahead of a fixed opening time and fire them at T-0"""
+    import time
+    from src.services.account_service import AccountService
+    from src.services.application_service import ApplicationService
+
+    settings = get_settings()
+    accounts = AccountService().load_accounts(args.accounts)
+    if not accounts:
+        print(f"{UIConstants.ERROR_EMOJI} No accounts loaded")
+        sys.exit(1)
+
+    release_at = args.at
+    if release_at <= time.time():
+        print(f"{UIConstants.ERROR_EMOJI} Release time is in the past")
+        sys.exit(2)
+
+    prepare_at = release_at - settings.RELEASE_PREPARE_LEAD
+    if prepare_at > time.time():
+        print(f"{UIConstants.PENDING_EMOJI} Waiting {prepare_at - time.time():.0f}s "
+              f"to prepare ({settings.RELEASE_PREPARE_LEAD}s before release)...")
+        while time.time() < prepare_at:
+            time.sleep(min(prepare_at - time.time(), 1.0))
+
+    result, report = ApplicationService().process_scheduled_applications(
+        accounts, args.company_id, args.kitta, release_at
+    )
+    display_results(result)
+
+    release = report.to_dict()
+    print(f"\n⏱️ Release jitter ({len(report.first_wave)} sent at T-0)")
+    print("=" * 60)
+    print(f"🕒 Clock offset: {release['offset_seconds'] * 1000:+.1f} ms "
+          f"(±{(release['offset_uncertainty'] or 0) * 1000:.1f} ms from "
+          f"{release['clock_samples']} samples, RTT {(release['rtt_seconds'] or 0) * 1000:.1f} ms)")
+    print(f"🎯 Jitter: p50 {release['jitter_p50_ms']} ms, p95 {release['jitter_p95_ms']} ms, "
+          f"max {release['jitter_max_ms']} ms")
+    print(f"📤 Last apply sent {release['last_release_ms']} ms after release")
+
+
+def run_verify_credentials(args):
+    """Log every account in concurrently and report rejected credentials"""
+    from collections import Counter
+    from src.services.account_service import AccountService
+    from src.services.credential_service import CredentialService
+
+    accounts = AccountService().load_accounts(args.accounts)
+    print(f"\n🔐 Verifying credentials for {len(accounts)} accounts...")
+    checks = CredentialService().verify_all(accounts, args.include_quarantined)
+
+    if args.json:
+        print(json.dumps(checks, indent=2))
+        return
+
+    counts = Counter(check["status"] for check in checks)
+    print(f"{UIConstants.SUCCESS_EMOJI} OK: {counts['ok']}")
+    print(f"{UIConstants.FAILED_EMOJI} Rejected: {counts['rejected']}")
+    print(f"🔒 Quarantined: {counts['quarantined']}")
+    print(f"{UIConstants.WARNING_EMOJI} Errors: {counts['error']}")
+
+    failing = [check for check in checks if check["status"] != "ok"]
+    if failing:
+        print()
+        print_table(failing, ["user_name", "client_id", "status", "http_status", "failure_streak"])
+    if counts["rejected"] or counts["quarantined"]:
+        sys.exit(1)
+
+
+def print_table(rows, columns):
+    """Print query rows as an aligned text table"""
+    if not rows:
+        print(f"{UIConstants.INFO_EMOJI} No history recorded yet")
+        return
+
+    cells = [[str(row[column]) for column in columns] for row in rows]
+    widths = [
+        max(len(column), *(len(line[i]) for line in cells))
+        for i, column in enumerate(columns)
+    ]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for line in cells:
+        print("  ".join(cell.ljust(width) for cell, width in zip(line, widths)))
+
+
+def run_history(args):
+    """Show aggregates from the results history database"""
+    from src.storage.results_store import ResultsStore
 
-    # Get settings
+    settings = get_settings()
+    path = Path(args.db) if args.db else settings.history_path
+    if not path.exists():
+        print(f"{UIConstants.ERROR_EMOJI} No history database at {path}")
+        sys.exit(1)
+
+    store = ResultsStore(path)
+    try:
+        if args.report == "accounts":
+            rows = store.account_success_rates(args.user_id, args.username, args.limit)
+            columns = ["user_id", "user_name", "total", "successful", "success_rate"]
+        elif args.report == "issues":
+            rows = store.issue_summary(args.company_id, args.limit)
+            columns = [
+                "company_id", "company_name", "runs", "total",
+                "successful", "success_rate", "avg_seconds", "max_seconds",
+            ]
+        elif args.report == "latency":
+            if not args.company_id:
+                print(f"{UIConstants.ERROR_EMOJI} latency report needs --company-id")
+                sys.exit(2)
+            rows = store.latency_trend(args.company_id)
+            columns = ["run_id", "started_at", "total", "avg_seconds", "max_seconds"]
+        else:
+            rows = store.error_summary(args.company_id, args.limit)
+            columns = ["count", "error_message"]
+    finally:
+        store.close()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows, columns)
+
+
+def run_soak(args):
+    """Apply over and over against a local stand-in and check resource growth"""
+    import logging
+    import tempfile
+    from src.services.application_service import ApplicationService
+    from src.utils.logger import set_console_level
+    from src.utils.mock_server import MockServerProcess
+    from src.utils.soak import SoakTest, SoakThresholds, synthetic_users
+
+    settings = get_settings()
+    thresholds = SoakThresholds.from_settings(settings)
+    for field in ("rss_mb", "fds", "threads", "objects"):
+        value = getattr(args, f"max_{field}")
+        if value is not None:
+            setattr(thresholds, field, value)
+
+    with MockServerProcess(latency=args.latency) as server, \
+            tempfile.TemporaryDirectory() as scratch:
+        # Point this process at the stand-in and keep synthetic accounts
+        # out of the real credential health store
+        settings.API_BASE_URL = server.base_url
+        settings.CREDENTIAL_HEALTH_FILE = str(Path(scratch) / "credential_health.db")
+        settings.SHOW_PROGRESS_BAR = False
+        settings.RATE_LIMIT_DELAY = args.rate_limit
+        if args.concurrency:
+            settings.MAX_CONCURRENT_REQUESTS = args.concurrency
+        # Runs follow each other far faster than real issues do, so scale
+        # the eligibility cache lifetime down with them
+        settings.ELIGIBILITY_TTL = args.eligibility_ttl
+
+        users = synthetic_users(args.accounts, args.dps)
+        duration = args.hours * 3600 if args.hours else None
+        print(f"\n🧪 Soak test: {args.applications} applications over {len(users)} accounts"
+              f"{f' or {args.hours}h' if duration else ''}, "
+              f"concurrency {settings.MAX_CONCURRENT_REQUESTS}")
+        print(f"{UIConstants.INFO_EMOJI} Stand-in backend at {server.base_url}")
+        print("=" * 60)
+
+        def on_sample(sample):
+            rss = f"{sample.rss_bytes / (1024 * 1024):.1f} MB" if sample.rss_bytes else "n/a"
+            print(f"[{sample.elapsed:>8.0f}s] {sample.applications:>7} applied  "
+                  f"rss {rss}  fds {sample.open_fds}  threads {sample.threads}  "
+                  f"objects {sample.gc_objects}")
+
+        soak = SoakTest(
+            ApplicationService(),
+            users,
+            sample_every=args.sample_every,
+            output=args.output,
+        )
+        # Keep the terminal to one line per sample; INFO still goes to the log file
+        console = set_console_level(logging.WARNING)
+        try:
+            report = soak.run(args.applications, duration, args.warmup, on_sample)
+        finally:
+            if console is not None:
+                set_console_level(console)
+
+    growth = report.growth()
+    print("=" * 60)
+    print(f"📈 Growth after {report.warmup} warm-up applications: "
+          + ", ".join(f"{name} {value}" for name, value in growth.items()))
+    if args.output:
+        print(f"💾 Samples written to {args.output}")
+
+    violations = report.violations(thresholds)
+    if violations:
+        for violation in violations:
+            print(f"{UIConstants.ERROR_EMOJI} {violation}")
+        sys.exit(1)
+    print(f"{UIConstants.SUCCESS_EMOJI} Resources stable within thresholds")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Bulk IPO Manager")
+    parser.add_argument(
+        "--record-cassette",
+        metavar="PATH",
+        help="Record all API traffic (redacted) to a cassette file",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sample"],
+        help="Profile the bulk phase; reports go next to the results file",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=0.005,
+        metavar="SECONDS",
+        help="Sampling interval for --profile sample",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Take tracemalloc snapshots before and after the bulk phase",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Serve OpenMetrics at http://127.0.0.1:PORT/metrics during the run",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    coordinator = subparsers.add_parser(
+        "coordinator", help="Queue applications and supervise workers"
+    )
+    coordinator.add_argument("--company-id", type=int, required=True)
+    coordinator.add_argument("--kitta", type=int, required=True)
+    coordinator.add_argument(
+        "--workers", type=int, default=0, help="Local worker processes to start"
+    )
+    coordinator.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+    coordinator.add_argument("--queue", help="Work queue database path")
+
+    worker = subparsers.add_parser("worker", help="Process queued applications")
+    worker.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+    worker.add_argument("--queue", help="Work queue database path")
+
+    replay = subparsers.add_parser(
+        "replay", help="Replay a recorded cassette and check the call budget"
+    )
+    replay.add_argument("cassette", help="Cassette file written by --record-cassette")
+    replay.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiply recorded latencies (0 disables sleeping)",
+    )
+    replay.add_argument(
+        "--max-calls-per-account",
+        type=int,
+        help="Call budget per account (default: calls recorded per account)",
+    )
+    replay.add_argument("--company-id", type=int, help="Override recorded company ID")
+    replay.add_argument("--kitta", type=int, help="Override recorded kitta")
+
+    reconcile = subparsers.add_parser(
+        "reconcile", help="Verify saved results against applied-issue reports"
+    )
+    reconcile.add_argument("--results", help="Results file (default: ipo_results.json)")
+    reconcile.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+
+    simulate = subparsers.add_parser(
+        "simulate", help="Estimate run time offline from recorded latencies"
+    )
+    simulate.add_argument(
+        "profile", nargs="*", help="Cassettes to take per-endpoint latency from"
+    )
+    simulate.add_argument("--count", type=int, default=800, help="Number of accounts")
+    simulate.add_argument(
+        "--accounts", help="Accounts file to take the per-DP split from"
+    )
+    simulate.add_argument("--dps", type=int, default=1, help="Number of DPs")
+    simulate.add_argument("--concurrency", type=int, help="MAX_CONCURRENT_REQUESTS")
+    simulate.add_argument("--rate-limit", type=float, help="RATE_LIMIT_DELAY")
+    simulate.add_argument("--dp-cap", type=int, help="DP_MAX_CONCURRENT")
+    simulate.add_argument("--retries", type=int, help="IN_RUN_RETRIES")
+    simulate.add_argument(
+        "--default-latency",
+        type=float,
+        default=0.3,
+        help="Latency for endpoints without samples",
+    )
+    simulate.add_argument("--runs", type=int, default=20, help="Simulated runs")
+    simulate.add_argument("--seed", type=int, help="Random seed")
+    simulate.add_argument("--json", action="store_true", help="Print report as JSON")
+
+    watch = subparsers.add_parser(
+        "watch", help="Poll for new issues and auto-apply by rule"
+    )
+    watch.add_argument("--rules", required=True, help="Watch rules JSON file")
+    watch.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+    watch.add_argument(
+        "--once", action="store_true", help="Poll once, apply, and exit"
+    )
+
+    schedule = subparsers.add_parser(
+        "schedule", help="Prepare applications and send them at an opening time"
+    )
+    schedule.add_argument("--company-id", type=int, required=True)
+    schedule.add_argument("--kitta", type=int, required=True)
+    schedule.add_argument(
+        "--at",
+        type=parse_release_time,
+        required=True,
+        help="Opening time on the server clock, local time zone (e.g. 10:00:00)",
+    )
+    schedule.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+
+    verify = subparsers.add_parser(
+        "verify-credentials", help="Check every account can log in"
+    )
+    verify.add_argument("--accounts", help="Accounts file (default: accounts.txt)")
+    verify.add_argument(
+        "--include-quarantined",
+        action="store_true",
+        help="Also retry quarantined accounts whose line is unchanged",
+    )
+    verify.add_argument("--json", action="store_true", help="Print results as JSON")
+
+    history = subparsers.add_parser(
+        "history", help="Query success rates and latency across past runs"
+    )
+    history.add_argument(
+        "report", choices=["accounts", "issues", "latency", "errors"]
+    )
+    history.add_argument("--company-id", type=int, help="Restrict to one issue")
+    history.add_argument("--user-id", help="Restrict to one DP (client ID)")
+    history.add_argument("--username", help="Restrict to one account")
+    history.add_argument("--limit", type=int, default=50, help="Maximum rows")
+    history.add_argument("--db", help="History database path")
+    history.add_argument("--json", action="store_true", help="Print rows as JSON")
+
+    soak = subparsers.add_parser(
+        "soak", help="Run applications for hours against a local stand-in"
+    )
+    soak.add_argument(
+        "--applications", type=int, default=100000, help="Applications to attempt"
+    )
+    soak.add_argument("--hours", type=float, help="Stop after this long instead")
+    soak.add_argument("--accounts", type=int, default=200, help="Synthetic accounts")
+    soak.add_argument("--dps", type=int, default=5, help="Client IDs to spread them over")
+    soak.add_argument("--concurrency", type=int, help="MAX_CONCURRENT_REQUESTS")
+    soak.add_argument(
+        "--rate-limit", type=float, default=0.0, help="RATE_LIMIT_DELAY (default: 0)"
+    )
+    soak.add_argument(
+        "--latency", type=float, default=0.0, help="Stand-in latency per request"
+    )
+    soak.add_argument(
+        "--eligibility-ttl",
+        type=int,
+        default=30,
+        metavar="SECONDS",
+        help="ELIGIBILITY_TTL during the soak (default: 30)",
+    )
+    soak.add_argument(
+        "--warmup",
+        type=int,
+        help="Applications before the baseline sample (default: 10%% of the total)",
+    )
+    soak.add_argument(
+        "--sample-every", type=int, default=1, metavar="RUNS", help="Bulk runs per sample"
+    )
+    soak.add_argument("--output", help="Append samples to this JSON-lines file")
+    soak.add_argument("--max-rss-mb", type=float, help="SOAK_MAX_RSS_GROWTH_MB")
+    soak.add_argument("--max-fds", type=int, help="SOAK_MAX_FD_GROWTH")
+    soak.add_argument("--max-threads", type=int, help="SOAK_MAX_THREAD_GROWTH")
+    soak.add_argument("--max-objects", type=int, help="SOAK_MAX_OBJECT_GROWTH")
+
+    return parser.parse_args(argv)
+
+
+def run_interactive(args):
+    """Run the interactive main menu"""
     settings = get_settings()
 
     print(f"\n{UIConstants.ROCKET_EMOJI} {settings.APP_NAME} v{settings.VERSION}")
@@ -333,5 +982,68 @@ def main():
             traceback.print_exc()
 
 
+COMMANDS = {
+    "coordinator": run_coordinator,
+    "worker": run_worker,
+    "replay": run_replay,
+    "reconcile": run_reconcile,
+    "simulate": run_simulate,
+    "history": run_history,
+    "watch": run_watch,
+    "verify-credentials": run_verify_credentials,
+    "schedule": run_schedule,
+    "soak": run_soak,
+}
+
+
+def main():
+    """Main application entry point"""
+    args = parse_args()
+
+    # Setup logging
+    setup_logging()
+
+    cassette = None
+    if args.record_cassette:
+        from src.api.cassette import Cassette
+        from src.api.meroshare_client import MeroShareClient
+
+        cassette = Cassette(args.record_cassette, mode="record")
+        MeroShareClient.transport = cassette
+
+    metrics_server = None
+    metrics_port = args.metrics_port or get_settings().METRICS_PORT
+    if metrics_port:
+        from src.utils.metrics import MetricsServer
+
+        metrics_server = MetricsServer(metrics_port, get_settings().METRICS_HOST)
+        metrics_server.start()
+        print(f"📡 Metrics at {metrics_server.url}")
+
+    profiler = None
+    if args.profile or args.trace_memory:
+        from src.utils import profiling
+
+        profiler = profiling.ProfileSession(
+            get_settings().results_path.parent,
+            mode=args.profile,
+            trace_memory=args.trace_memory,
+            interval=args.profile_interval,
+        )
+        profiling.install(profiler)
+
+    try:
+        COMMANDS.get(args.command, run_interactive)(args)
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
+        if profiler is not None:
+            for report in profiler.reports:
+                print(f"🔬 Profile report: {report}")
+        if cassette is not None:
+            cassette.save()
+            print(f"\n💾 Recorded {len(cassette.interactions)} requests to {cassette.path}")
+
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,13 @@
 """API package for external service communication"""
 
 from .meroshare_client import MeroShareClient
+from .token_store import TokenStore, AccountSession
+from .client_registry import get_client, reset_client
 
-__all__ = ["MeroShareClient"]
+__all__ = [
+    "MeroShareClient",
+    "TokenStore",
+    "AccountSession",
+    "get_client",
+    "reset_client",
+]
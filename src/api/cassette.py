@@ -0,0 +1,305 @@
+"""
+Record/replay transport for deterministic, offline performance checks
+"""
+
+import json
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..config.constants import APIEndpoints
+from ..models.user import User
+
+# Request body fields that are never written to a cassette
+REDACTED_FIELDS = ("password", "transactionPIN", "crnNumber")
+REDACTED = "***"
+
+# Fields naming an account's depository or bank identifiers; their values
+# are replaced with stable aliases (``demat-1`` ...) wherever they appear:
+# in paths, request bodies and response bodies
+IDENTIFIER_FIELDS = ("demat", "boid", "accountNumber", "clientCode")
+
+# Personal details dropped from recorded bodies
+PERSONAL_FIELDS = (
+    "name",
+    "username",
+    "email",
+    "contact",
+    "mobile",
+    "phone",
+    "address",
+    "dob",
+    "citizenCode",
+    "citizenNumber",
+)
+
+
+class CassetteMiss(requests.RequestException):
+    """Raised on replay when a request has no recorded counterpart"""
+
+
+class Cassette:
+    """
+    Transport hook that records request/response pairs or replays them
+
+    Install with ``MeroShareClient.transport = cassette``. While recording,
+    passwords, PINs and CRNs are redacted, usernames are replaced with
+    stable aliases (``account-1`` ...) and tokens with ``token-<alias>``.
+    Demat, BOID and bank account numbers are replaced with aliases of
+    their own in paths and in request and response bodies, and names and
+    contact details are redacted from response bodies. Each interaction
+    keeps its elapsed time so replay can reproduce the original (or scaled)
+    latency.
+
+    On replay, responses are matched per account and endpoint template in
+    recorded order; a request with no recorded counterpart raises
+    CassetteMiss, which the client reports like a network error. Calls per
+    account are counted so tests can assert that a change did not add round
+    trips.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str = "record",
+        latency_scale: float = 1.0,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError("mode must be 'record' or 'replay'")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+
+        self.interactions: List[Dict] = []
+        self.accounts: Dict[str, int] = {}
+        self._aliases: Dict[str, str] = {}
+        self._tokens: Dict[str, str] = {}
+        self._identifiers: Dict[str, str] = {}
+        self._pending: Dict[tuple, Deque[Dict]] = defaultdict(deque)
+        self.calls: Counter = Counter()
+        self.misses: List[str] = []
+
+        if mode == "replay":
+            self._load()
+
+    # Recording --------------------------------------------------------
+
+    def send(
+        self,
+        send: Callable,
+        method: str,
+        url: str,
+        template: str,
+        headers: Dict,
+        payload: Optional[Dict] = None,
+    ) -> requests.Response:
+        """Transport hook entry point (see MeroShareClient.transport)"""
+        if self.mode == "replay":
+            return self._replay(method, template, headers, payload)
+
+        started = time.perf_counter()
+        response = send(method, url, template, headers, payload)
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            account = self._account_for(template, headers, payload)
+            token = response.headers.get("Authorization")
+            if template == APIEndpoints.AUTH and token:
+                self._tokens[token.strip()] = account
+
+            self.interactions.append(
+                {
+                    "account": account,
+                    "method": method,
+                    "template": template,
+                    "path": self._scrub_path(urlparse(url).path),
+                    "request": self._scrub(self._redact(payload)),
+                    "status": response.status_code,
+                    "headers": {"Authorization": f"token-{account}"} if token else {},
+                    "body": self._scrub_body(response.text),
+                    "elapsed": round(elapsed, 6),
+                }
+            )
+        return response
+
+    def _account_for(
+        self, template: str, headers: Dict, payload: Optional[Dict]
+    ) -> str:
+        """Alias of the account a request belongs to"""
+        if template == APIEndpoints.AUTH:
+            username = (payload or {}).get("username", "")
+            if username not in self._aliases:
+                alias = f"account-{len(self._aliases) + 1}"
+                self._aliases[username] = alias
+                self.accounts[alias] = (payload or {}).get("clientId", 1)
+            return self._aliases[username]
+        return self._tokens.get(headers.get("Authorization", ""), "unknown")
+
+    @staticmethod
+    def _redact(payload: Optional[Dict]) -> Optional[Dict]:
+        if not isinstance(payload, dict):
+            return payload
+        redacted = dict(payload)
+        for field in REDACTED_FIELDS:
+            if field in redacted:
+                redacted[field] = REDACTED
+        if "username" in redacted:
+            redacted["username"] = REDACTED
+        return redacted
+
+    def _alias_identifier(self, field: str, value) -> str:
+        """Stable alias for an identifier value; caller holds the lock"""
+        key = str(value)
+        if key not in self._identifiers:
+            count = sum(
+                alias.startswith(f"{field}-") for alias in self._identifiers.values()
+            )
+            self._identifiers[key] = f"{field}-{count + 1}"
+        return self._identifiers[key]
+
+    def _scrub(self, data):
+        """Alias identifiers and redact personal details in decoded JSON"""
+        if isinstance(data, list):
+            return [self._scrub(item) for item in data]
+        if isinstance(data, str):
+            if data in self._identifiers:
+                return self._identifiers[data]
+            return self._aliases.get(data, data)
+        if not isinstance(data, dict):
+            return data
+
+        scrubbed = {}
+        for field, value in data.items():
+            if isinstance(value, (dict, list)):
+                scrubbed[field] = self._scrub(value)
+            elif field in IDENTIFIER_FIELDS and value not in (None, ""):
+                scrubbed[field] = self._alias_identifier(field, value)
+            elif field in PERSONAL_FIELDS and value not in (None, ""):
+                scrubbed[field] = REDACTED
+            else:
+                scrubbed[field] = self._scrub(value)
+        return scrubbed
+
+    def _scrub_body(self, text: str) -> str:
+        """Scrub a response body; bodies that are not JSON are kept as is"""
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return text
+        return json.dumps(self._scrub(data))
+
+    def _scrub_path(self, path: str) -> str:
+        """Replace identifiers seen so far in path segments with their aliases"""
+        return "/".join(
+            self._identifiers.get(segment, segment) for segment in path.split("/")
+        )
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette file"""
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "recorded_at": datetime.now().isoformat(),
+                "accounts": self.accounts,
+                "interactions": self.interactions,
+            }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    # Replay -----------------------------------------------------------
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        self.accounts = data.get("accounts", {})
+        self.interactions = data.get("interactions", [])
+        for interaction in self.interactions:
+            key = (
+                interaction["account"],
+                interaction["method"],
+                interaction["template"],
+            )
+            self._pending[key].append(interaction)
+
+    def replay_users(self) -> List[User]:
+        """Synthetic users matching the recorded account aliases"""
+        return [
+            User(
+                client_id=int(client_id),
+                username=alias,
+                password="replay",
+                crn="replay",
+                pin=1,
+            )
+            for alias, client_id in self.accounts.items()
+        ]
+
+    def _replay(
+        self, method: str, template: str, headers: Dict, payload: Optional[Dict]
+    ) -> requests.Response:
+        if template == APIEndpoints.AUTH:
+            account = (payload or {}).get("username", "")
+        else:
+            account = headers.get("Authorization", "").replace("token-", "", 1)
+
+        with self._lock:
+            self.calls[account] += 1
+            pending = self._pending.get((account, method, template))
+            interaction = pending.popleft() if pending else None
+            if interaction is None:
+                self.misses.append(f"{account} {method} {template}")
+
+        if interaction is None:
+            raise CassetteMiss(f"No recorded response for {method} {template}")
+
+        if self.latency_scale > 0:
+            time.sleep(interaction["elapsed"] * self.latency_scale)
+
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+        response._content = interaction["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        return response
+
+    def recorded_calls_per_account(self) -> Counter:
+        """Number of recorded interactions for each account"""
+        return Counter(interaction["account"] for interaction in self.interactions)
+
+    def assert_calls_per_account(self, max_calls: Optional[int] = None) -> None:
+        """
+        Fail if replay needed more calls than allowed
+
+        Args:
+            max_calls: Maximum calls per account; defaults to the number of
+                calls recorded for that account
+
+        Raises:
+            AssertionError: listing every account over budget and every miss
+        """
+        recorded = self.recorded_calls_per_account()
+        problems = []
+
+        for account, count in sorted(self.calls.items()):
+            limit = max_calls if max_calls is not None else recorded.get(account, 0)
+            if count > limit:
+                problems.append(f"{account}: {count} calls (limit {limit})")
+
+        problems.extend(f"unrecorded request: {miss}" for miss in self.misses)
+
+        if problems:
+            raise AssertionError(
+                "Call budget exceeded on replay:\n  " + "\n  ".join(problems)
+            )
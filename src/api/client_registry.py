@@ -0,0 +1,40 @@
+"""
+Process-wide shared MeroShare client
+"""
+
+import os
+import threading
+from typing import Optional
+
+from .meroshare_client import MeroShareClient
+
+_client: Optional[MeroShareClient] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> MeroShareClient:
+    """
+    Get the client shared by every service in this process (singleton)
+
+    Sharing one client shares its HTTP connection pool, token store,
+    response cache and clock estimate, so a service created later starts
+    warm. The client is safe to use from any thread.
+    """
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            # A forked child must not reuse the parent's sockets
+            if _client is None or _client_pid != os.getpid():
+                _client = MeroShareClient()
+                _client_pid = os.getpid()
+    return _client
+
+
+def reset_client() -> None:
+    """Drop the shared client; the next get_client() builds a fresh one"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
@@ -2,26 +2,123 @@
 MeroShare API client with improved error handling
 """
 
+import copy
+import json
+import time
 import requests
-from typing import Optional, Dict
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Tuple
 import logging
 
 from ..models.user import User
 from ..config.settings import get_settings
-from ..config.constants import APIEndpoints, HTTPStatus
+from ..config.constants import APIEndpoints, HTTPStatus, CachePolicy, HedgePolicy
+from .token_store import TokenStore
+from .session_pool import SessionPool
+from .response_cache import ResponseCache, SingleFlight
+from ..utils.metrics import REGISTRY
+from ..utils.host_rate_limiter import get_host_rate_limiter
+from ..utils.clock_skew import ClockSkewEstimator
+from ..utils.deadline import DeadlineExceeded, current_deadline
+from ..utils.transfer_stats import TransferStats
+from ..utils.hedging import HedgeBudget, Hedger
+from ..utils.release_scheduler import mark_send
+
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "ipo_http_requests_in_flight", "Requests currently in flight", ["endpoint"]
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "ipo_http_requests",
+    "Completed requests by endpoint and status code",
+    ["endpoint", "method", "code"],
+)
+HTTP_LATENCY = REGISTRY.histogram(
+    "ipo_http_request_duration_seconds", "Request latency", ["endpoint"]
+)
+
+
+# Search filters the web client sends with every applicable-issue query,
+# minus the display aliases it adds for its table headers; they are not
+# filter criteria, so sending them only makes each request bigger.
+APPLICABLE_ISSUE_FILTERS = [
+    {"key": "companyIssue.companyISIN.script"},
+    {"key": "companyIssue.companyISIN.company.name"},
+    {"key": "companyIssue.assignedToClient.name", "value": ""},
+]
+APPLICABLE_ISSUE_DATE_FILTERS = [
+    {"key": "minIssueOpenDate", "condition": "", "value": ""},
+    {"key": "maxIssueCloseDate", "condition": "", "value": ""},
+]
+
+
+def _header_bytes(headers) -> int:
+    """Size of a header block on the wire"""
+    return sum(len(name) + len(str(value)) + 4 for name, value in headers.items()) + 2
 
 
 class MeroShareClient:
     """Clean API client for MeroShare operations"""
 
+    # Optional transport hook (see api.cassette.Cassette); every request goes
+    # through transport.send(send, method, url, template, headers, payload).
+    # Set it on the class to affect all clients or on one instance.
+    transport = None
+
     def __init__(self):
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.timeout = self.settings.REQUEST_TIMEOUT
+        concurrency = max(
+            self.settings.CONNECTION_POOL_SIZE,
+            self.settings.MAX_CONCURRENT_REQUESTS,
+            # a scheduled release sends this many requests at once
+            self.settings.RELEASE_CONCURRENCY,
+        )
+        self.session_pool = SessionPool(
+            self._new_session, self.settings.SESSION_MODE, concurrency
+        )
+        self.tokens = TokenStore(self.settings.TOKEN_TTL)
+        self.response_cache = ResponseCache(self.settings.RESPONSE_CACHE_SIZE)
+        self._inflight = SingleFlight()
+        self.rate_limiter = get_host_rate_limiter()
+        self.clock = ClockSkewEstimator()
+        self.transfer = TransferStats()
+        self.hedger = None
+        if self.settings.HEDGE_REQUESTS:
+            self.hedger = Hedger(
+                HedgeBudget(self.settings.HEDGE_BUDGET),
+                min_samples=self.settings.HEDGE_MIN_SAMPLES,
+                # a primary and a hedge for every request sent at once
+                max_workers=2 * concurrency,
+            )
+
+    @property
+    def session(self) -> requests.Session:
+        """The shared HTTP session, created on first use"""
+        return self.session_pool.shared
+
+    def _new_session(self, connections: int) -> requests.Session:
+        """Session keeping up to connections keep-alive connections"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # requests' default also offers br/zstd when those packages happen
+        # to be installed; keep it predictable
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session_pool.close()
 
     def authenticate(self, user: User) -> Optional[str]:
         """Authenticate user and return token"""
+        return self.authenticate_with_status(user)[0]
+
+    def authenticate_with_status(
+        self, user: User
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """Authenticate user; returns (token, HTTP status or None on network error)"""
         url = f"{self.settings.API_BASE_URL}{APIEndpoints.AUTH}"
 
         payload = {
@@ -33,83 +130,138 @@ class MeroShareClient:
         headers = {"Accept": "application/json", "Content-Type": "application/json"}
 
         try:
-            response = self.session.post(url, json=payload, headers=headers)
+            response = self._send("POST", url, APIEndpoints.AUTH, headers, payload)
 
             if response.status_code == HTTPStatus.OK:
                 token = response.headers.get("Authorization", "").strip()
                 if token:
-                    self.logger.debug(f"Successfully authenticated {user.username}")
-                    return token
+                    self.logger.debug("Successfully authenticated %s", user.username)
+                    return token, response.status_code
 
-            self.logger.error(f"Authentication failed for {user.username}")
-            return None
+            self.logger.error(
+                "Authentication failed for %s (HTTP %s)",
+                user.username,
+                response.status_code,
+            )
+            return None, response.status_code
 
         except requests.RequestException as e:
-            self.logger.error(f"Network error during authentication: {e}")
-            return None
+            self.logger.error("Network error during authentication: %s", e)
+            return None, None
 
     def get_personal_details(self, token: str) -> Optional[Dict]:
         """Get user's personal details"""
         return self._make_authenticated_request(
-            endpoint=APIEndpoints.OWN_DETAIL, token=token, method="GET"
+            endpoint=APIEndpoints.OWN_DETAIL,
+            token=token,
+            method="GET",
+            template=APIEndpoints.OWN_DETAIL,
         )
 
     def get_client_boid_details(self, token: str, demat: str) -> Optional[Dict]:
         """Get client BOID details"""
         endpoint = APIEndpoints.MY_DETAIL.format(demat=demat)
         return self._make_authenticated_request(
-            endpoint=endpoint, token=token, method="GET"
+            endpoint=endpoint,
+            token=token,
+            method="GET",
+            template=APIEndpoints.MY_DETAIL,
+        )
+
+    def get_applicable_ipos(
+        self, token: str, page: int = 1, size: int = 10, use_cache: bool = True
+    ) -> Optional[Dict]:
+        """Get one page of applicable IPOs (use_cache=False forces a fetch)"""
+        payload = {
+            "filterFieldParams": APPLICABLE_ISSUE_FILTERS,
+            "page": page,
+            "size": size,
+            "searchRoleViewConstants": "VIEW_APPLICABLE_SHARE",
+            "filterDateParams": APPLICABLE_ISSUE_DATE_FILTERS,
+        }
+
+        return self._make_authenticated_request(
+            endpoint=APIEndpoints.APPLICABLE_ISSUES,
+            token=token,
+            method="POST",
+            payload=payload,
+            template=APIEndpoints.APPLICABLE_ISSUES,
+            use_cache=use_cache,
+        )
+
+    def get_share_criteria(
+        self, token: str, demat: str, company_share_id: int
+    ) -> Optional[Dict]:
+        """Get share criteria (eligibility) of an account for an issue"""
+        endpoint = APIEndpoints.SHARE_CRITERIA.format(
+            demat=demat, companyShareId=company_share_id
+        )
+        return self._make_authenticated_request(
+            endpoint=endpoint,
+            token=token,
+            method="GET",
+            template=APIEndpoints.SHARE_CRITERIA,
         )
 
-    def get_applicable_ipos(self, token: str) -> Optional[Dict]:
-        """Get applicable IPOs"""
+    def get_application_report(
+        self, token: str, page: int = 1, size: int = 200
+    ) -> Optional[Dict]:
+        """Get one page of the account's applied-issue report"""
         payload = {
             "filterFieldParams": [
-                {"key": "companyIssue.companyISIN.script", "alias": "Scrip"},
                 {
-                    "key": "companyIssue.companyISIN.company.name",
-                    "alias": "Company Name",
+                    "key": "companyShare.companyIssue.companyISIN.script",
+                    "alias": "Scrip",
                 },
                 {
-                    "key": "companyIssue.assignedToClient.name",
-                    "value": "",
-                    "alias": "Issue Manager",
+                    "key": "companyShare.companyIssue.companyISIN.company.name",
+                    "alias": "Company Name",
                 },
             ],
-            "page": 1,
-            "size": 10,
-            "searchRoleViewConstants": "VIEW_APPLICABLE_SHARE",
+            "page": page,
+            "size": size,
+            "searchRoleViewConstants": "VIEW_APPLICANT_FORM_COMPLETE",
             "filterDateParams": [
-                {"key": "minIssueOpenDate", "condition": "", "alias": "", "value": ""},
-                {"key": "maxIssueCloseDate", "condition": "", "alias": "", "value": ""},
+                {"key": "appliedDate", "condition": "", "alias": "", "value": ""},
+                {"key": "appliedDate", "condition": "", "alias": "", "value": ""},
             ],
         }
 
         return self._make_authenticated_request(
-            endpoint=APIEndpoints.APPLICABLE_ISSUES,
+            endpoint=APIEndpoints.APPLICATION_REPORT,
             token=token,
             method="POST",
             payload=payload,
+            template=APIEndpoints.APPLICATION_REPORT,
         )
 
     def get_bank_details(self, token: str, bank_code: str) -> Optional[Dict]:
         """Get bank details"""
         endpoint = APIEndpoints.BANK_REQUEST.format(bankCode=bank_code)
         return self._make_authenticated_request(
-            endpoint=endpoint, token=token, method="GET"
+            endpoint=endpoint,
+            token=token,
+            method="GET",
+            template=APIEndpoints.BANK_REQUEST,
         )
 
     def get_bank_list(self, token: str) -> Optional[Dict]:
         """Get list of banks"""
         return self._make_authenticated_request(
-            endpoint=APIEndpoints.BANK_LIST, token=token, method="GET"
+            endpoint=APIEndpoints.BANK_LIST,
+            token=token,
+            method="GET",
+            template=APIEndpoints.BANK_LIST,
         )
 
     def get_bank_detail(self, token: str, bank_id: str) -> Optional[Dict]:
         """Get specific bank details"""
         endpoint = APIEndpoints.BANK_DETAIL.format(bankId=bank_id)
         result = self._make_authenticated_request(
-            endpoint=endpoint, token=token, method="GET"
+            endpoint=endpoint,
+            token=token,
+            method="GET",
+            template=APIEndpoints.BANK_DETAIL,
         )
 
         # Handle case where API returns a list instead of a dictionary
@@ -124,16 +276,90 @@ class MeroShareClient:
             token=token,
             method="POST",
             payload=application_data,
+            template=APIEndpoints.APPLY_SHARE,
         )
 
+    def warm_connection(self) -> None:
+        """
+        Make sure the calling thread has an open keep-alive connection
+
+        Sends one cheap unauthenticated GET and ignores the answer, so a
+        request sent right after does not pay for TCP and TLS setup.
+        Does nothing when a transport hook (e.g. a cassette) is installed.
+        """
+        if self.transport is not None:
+            return
+        url = f"{self.settings.API_BASE_URL}{APIEndpoints.WARMUP}"
+        try:
+            response = self._send("GET", url, APIEndpoints.WARMUP, {})
+            response.content  # read the body so the connection is reusable
+        except requests.RequestException as e:
+            self.logger.warning("Could not open a connection ahead of time: %s", e)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Get response cache and request coalescing counters"""
+        return {
+            "hits": self.response_cache.hits,
+            "misses": self.response_cache.misses,
+            "coalesced": self._inflight.coalesced,
+            "entries": len(self.response_cache),
+        }
+
     def _make_authenticated_request(
         self,
         endpoint: str,
         token: str,
         method: str = "GET",
         payload: Optional[Dict] = None,
+        template: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Optional[Dict]:
+        """
+        Make authenticated request to API
+
+        Requests whose endpoint template is listed in CachePolicy.TTL are
+        served from the response cache when possible, and concurrent
+        identical requests (same endpoint, payload and token) share a single
+        in-flight call. Callers always receive their own copy of the data.
+        """
+        ttl = None
+        if use_cache and self.settings.RESPONSE_CACHE:
+            ttl = CachePolicy.TTL.get(template)
+        if ttl is None:
+            return self._send_authenticated_request(
+                endpoint, token, method, payload, template
+            )
+
+        key = (
+            method.upper(),
+            endpoint,
+            json.dumps(payload, sort_keys=True) if payload is not None else None,
+            token,
+        )
+        found, cached = self.response_cache.get(key)
+        if found:
+            return copy.deepcopy(cached)
+
+        def fetch():
+            result = self._send_authenticated_request(
+                endpoint, token, method, payload, template
+            )
+            if result is not None:
+                self.response_cache.put(key, copy.deepcopy(result), ttl)
+            return result
+
+        result, shared = self._inflight.do(key, fetch)
+        return copy.deepcopy(result) if shared else result
+
+    def _send_authenticated_request(
+        self,
+        endpoint: str,
+        token: str,
+        method: str = "GET",
+        payload: Optional[Dict] = None,
+        template: Optional[str] = None,
     ) -> Optional[Dict]:
-        """Make authenticated request to API"""
+        """Send an authenticated request without caching"""
         url = f"{self.settings.API_BASE_URL}{endpoint}"
 
         headers = {
@@ -143,12 +369,13 @@ class MeroShareClient:
         }
 
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, headers=headers)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=payload, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            response = self._send(
+                method.upper(), url, template or endpoint, headers, payload
+            )
+
+            self.logger.debug(
+                "%s %s -> %s", method.upper(), endpoint, response.status_code
+            )
 
             if response.status_code in [
                 HTTPStatus.OK,
@@ -158,12 +385,130 @@ class MeroShareClient:
                 return response.json()
             else:
                 error_msg = self._extract_error_message(response)
-                self.logger.warning(f"API request failed: {error_msg}")
+                self.logger.warning("API request failed: %s", error_msg)
                 return None
 
         except requests.RequestException as e:
-            self.logger.error(f"Network error in API request: {e}")
+            self.logger.error("Network error in API request: %s", e)
+            return None
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        headers: Dict,
+        payload: Optional[Dict] = None,
+    ) -> requests.Response:
+        """Send a request, hedged if it is a slow idempotent read"""
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceeded("Run deadline reached")
+
+        HTTP_IN_FLIGHT.inc(template)
+        started = time.perf_counter()
+        code = "error"
+        try:
+            if (
+                self.hedger is not None
+                and self.transport is None
+                and method == "GET"
+                and template in HedgePolicy.ENDPOINTS
+            ):
+                response = self.hedger.call(
+                    template,
+                    lambda: self._exchange(method, url, template, headers, payload),
+                )
+            else:
+                response = self._exchange(method, url, template, headers, payload)
+            code = str(response.status_code)
+            return response
+        finally:
+            HTTP_IN_FLIGHT.dec(template)
+            HTTP_LATENCY.observe(time.perf_counter() - started, template)
+            HTTP_REQUESTS.inc(template, method, code)
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        headers: Dict,
+        payload: Optional[Dict] = None,
+    ) -> requests.Response:
+        """Send one HTTP request through the transport hook, if any"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        mark_send()
+        sent_at = time.time()
+        if self.transport is not None:
+            response = self.transport.send(
+                self._send_direct, method, url, template, headers, payload
+            )
+        else:
+            response = self._send_direct(method, url, template, headers, payload)
+        self._record_transfer(method, url, template, headers, payload, response)
+        date = response.headers.get("Date")
+        if date:
+            self.clock.observe(sent_at, time.time(), date)
+        return response
+
+    def _send_direct(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        headers: Dict,
+        payload: Optional[Dict] = None,
+    ) -> requests.Response:
+        """Send a request on the HTTP session"""
+        # requests has no session-wide timeout; without one a stalled
+        # connection blocks the calling worker forever
+        timeout = (self.settings.CONNECT_TIMEOUT, self.settings.REQUEST_TIMEOUT)
+        deadline = current_deadline()
+        if deadline is not None:
+            timeout = deadline.timeout(*timeout)
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        with self.session_pool.session() as session:
+            if method == "GET":
+                return session.get(url, headers=headers, timeout=timeout)
+            return session.post(
+                url, data=self._encode(payload), headers=headers, timeout=timeout
+            )
+
+    @staticmethod
+    def _encode(payload: Optional[Dict]) -> Optional[bytes]:
+        """Compact JSON body (no spaces after separators)"""
+        if payload is None:
             return None
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    def _record_transfer(
+        self,
+        method: str,
+        url: str,
+        template: str,
+        headers: Dict,
+        payload: Optional[Dict],
+        response: requests.Response,
+    ) -> None:
+        """Count the bytes of one exchange (headers approximated)"""
+        request = response.request
+        if request is not None:
+            body = request.body or b""
+            headers = request.headers
+        else:
+            # Replayed responses never went through the session
+            body = self._encode(payload) or b""
+        sent = len(method) + len(url) + 12 + _header_bytes(headers) + len(body)
+
+        decoded = len(response.content)
+        tell = getattr(response.raw, "tell", None)
+        wire = tell() if callable(tell) else decoded
+        received = 17 + _header_bytes(response.headers) + wire
+        self.transfer.record(template, sent, received, decoded)
 
     def _extract_error_message(self, response: requests.Response) -> str:
         """Extract error message from response"""
@@ -0,0 +1,111 @@
+"""
+How worker threads get a requests.Session: shared, per thread or pooled
+"""
+
+import queue
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import requests
+
+
+class SessionPool:
+    """
+    Hands out HTTP sessions to the threads sending requests
+
+    Modes:
+        shared: one session (and connection pool) for every thread
+        thread: one session per thread, kept for the thread's lifetime
+        pool: sessions are checked out per request and checked back in,
+            at most ``size`` at once; callers beyond that wait
+
+    In the thread and pool modes each session holds its own keep-alive
+    connection, so threads never touch another session's cookie jar or
+    adapter pool. ``factory(connections)`` builds a session whose adapter
+    keeps up to ``connections`` connections alive.
+    """
+
+    SHARED = "shared"
+    THREAD = "thread"
+    POOL = "pool"
+    MODES = (SHARED, THREAD, POOL)
+
+    def __init__(
+        self,
+        factory: Callable[[int], requests.Session],
+        mode: str = SHARED,
+        size: int = 10,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown session mode: {mode}")
+        self.factory = factory
+        self.mode = mode
+        self.size = size
+
+        self._lock = threading.Lock()
+        self._shared: Optional[requests.Session] = None
+        self._local = threading.local()
+        # Every live session, weakly: a thread's session goes when it exits
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._idle: "queue.LifoQueue[requests.Session]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """Session for one request from the calling thread"""
+        if self.mode == self.SHARED:
+            yield self.shared
+        elif self.mode == self.THREAD:
+            yield self._thread_session()
+        else:
+            self._slots.acquire()
+            try:
+                try:
+                    session = self._idle.get_nowait()
+                except queue.Empty:
+                    session = self._create(1)
+                try:
+                    yield session
+                finally:
+                    self._idle.put(session)
+            finally:
+                self._slots.release()
+
+    @property
+    def shared(self) -> requests.Session:
+        """The shared session, created on first use"""
+        if self._shared is None:
+            with self._lock:
+                if self._shared is None:
+                    self._shared = self.factory(self.size)
+                    self._sessions.add(self._shared)
+        return self._shared
+
+    def close(self) -> None:
+        """Close every session; later requests create new ones"""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions = weakref.WeakSet()
+            self._shared = None
+            self._local = threading.local()
+            self._idle = queue.LifoQueue()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _thread_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._create(1)
+        return session
+
+    def _create(self, connections: int) -> requests.Session:
+        session = self.factory(connections)
+        with self._lock:
+            self._sessions.add(session)
+        return session
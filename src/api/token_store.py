@@ -0,0 +1,65 @@
+"""
+Thread-safe cache of authenticated account sessions
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from ..models.user import User
+
+
+@dataclass
+class AccountSession:
+    """Token and profile data cached for one account"""
+
+    token: str
+    personal_details: Optional[Dict] = None
+    client_boid: Optional[Dict] = None
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class TokenStore:
+    """Cache of account sessions keyed by (client_id, username) with a TTL"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[int, str], AccountSession] = {}
+
+    @staticmethod
+    def _key(user: User) -> Tuple[int, str]:
+        return (user.client_id, user.username)
+
+    def get(self, user: User) -> Optional[AccountSession]:
+        """Get a session that is still within its TTL"""
+        with self._lock:
+            session = self._sessions.get(self._key(user))
+            if session is None:
+                return None
+            if time.monotonic() - session.created_at >= self.ttl:
+                del self._sessions[self._key(user)]
+                return None
+            return session
+
+    def put(self, user: User, token: str) -> AccountSession:
+        """Store a freshly issued token, replacing any previous session"""
+        session = AccountSession(token=token)
+        with self._lock:
+            self._sessions[self._key(user)] = session
+        return session
+
+    def invalidate(self, user: User) -> None:
+        """Forget the session for an account"""
+        with self._lock:
+            self._sessions.pop(self._key(user), None)
+
+    def clear(self) -> None:
+        """Forget all sessions"""
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
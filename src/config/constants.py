@@ -11,6 +11,49 @@ class ApplicationStatus:
     RETRYING = "retrying"
 
 
+# Work Queue Task States
+class TaskState:
+    QUEUED = "queued"
+    LEASED = "leased"
+    APPLYING = "applying"
+    DONE = "done"
+
+
+# Share Criteria statuses that mark an account as not eligible
+class EligibilityStatus:
+    INELIGIBLE = ("CAN_NOT_APPLY", "CANNOT_APPLY", "NOT_ELIGIBLE", "INELIGIBLE")
+
+
+# Applied-issue report statuses that mean the application did not go through
+class ApplicantFormStatus:
+    REJECTED = ("REJECTED", "CANCELLED", "TRANSACTION_FAILED", "BLOCK_FAILED")
+
+
+# Application Pipeline Events
+class EventType:
+    SUBMITTED = "submitted"
+    STARTED = "started"
+    STAGE_DONE = "stage_done"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    RETRYING = "retrying"
+
+
+# Application Pipeline Stages (in call order)
+class ApplicationStage:
+    AUTH = "auth"
+    PROFILE = "profile"
+    BOID = "boid"
+    BANK = "bank"
+    PREPARE = "prepare"
+    APPLY = "apply"
+
+    ORDER = [AUTH, PROFILE, BOID, BANK, PREPARE, APPLY]
+
+    # Most requests each stage sends; sizes the watchdog's stage deadlines
+    REQUESTS = {AUTH: 1, PROFILE: 1, BOID: 1, BANK: 1, PREPARE: 3, APPLY: 1}
+
+
 # API Endpoints
 class APIEndpoints:
     AUTH = "/meroShare/auth/"
@@ -22,6 +65,37 @@ class APIEndpoints:
     SHARE_CRITERIA = "/shareCriteria/boid/{demat}/{companyShareId}"
     APPLY_SHARE = "/meroShare/applicantForm/share/apply/"
     MY_DETAIL = "/meroShareView/myDetail/{demat}"
+    APPLICATION_REPORT = "/meroShare/applicantForm/active/search/"
+    # Any cheap request will do to open a connection; the answer is ignored
+    WARMUP = "/"
+
+
+# Response cache policy: only idempotent reads listed here are coalesced and
+# cached, keyed by endpoint, payload and token. Authentication and
+# APPLY_SHARE must never be cached.
+class CachePolicy:
+    TTL = {
+        APIEndpoints.OWN_DETAIL: 300,
+        APIEndpoints.MY_DETAIL: 300,
+        APIEndpoints.BANK_LIST: 300,
+        APIEndpoints.BANK_DETAIL: 300,
+        APIEndpoints.BANK_REQUEST: 300,
+        APIEndpoints.SHARE_CRITERIA: 300,
+        APIEndpoints.APPLICABLE_ISSUES: 30,
+    }
+
+
+# Reads that may be sent twice when slow (see utils.hedging). Never add
+# APPLY_SHARE: a duplicate apply is not harmless.
+class HedgePolicy:
+    ENDPOINTS = frozenset(
+        {
+            APIEndpoints.OWN_DETAIL,
+            APIEndpoints.MY_DETAIL,
+            APIEndpoints.BANK_REQUEST,
+            APIEndpoints.BANK_DETAIL,
+        }
+    )
 
 
 # HTTP Status Codes
@@ -29,11 +103,17 @@ class HTTPStatus:
     OK = 200
     CREATED = 201
     CONFLICT = 409
+    BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
+    LOCKED = 423
     NOT_FOUND = 404
     INTERNAL_SERVER_ERROR = 500
 
+    # Login responses meaning the credentials themselves are bad (wrong or
+    # expired password, locked account); retrying them only risks lockouts
+    AUTH_HARD_FAILURES = (BAD_REQUEST, UNAUTHORIZED, FORBIDDEN, LOCKED)
+
 
 # UI Constants
 class UIConstants:
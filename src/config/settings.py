@@ -3,10 +3,13 @@ Application settings and configuration management
 """
 
 import os
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from dataclasses import dataclass
 
+from .constants import ApplicationStage
+
 
 @dataclass
 class Settings:
@@ -21,15 +24,39 @@ class Settings:
     ACCOUNTS_FILE: str = "accounts.txt"
     RESULTS_FILE: str = "ipo_results.json"
     LOG_DIR: str = "logs"
+    QUEUE_FILE: str = "work_queue.db"
+    HISTORY_FILE: str = "ipo_history.db"
+    WATCH_STATE_FILE: str = "watch_state.json"
+    CREDENTIAL_HEALTH_FILE: str = "credential_health.db"
 
     # API Settings
     API_BASE_URL: str = "https://webbackend.cdsc.com.np/api"
-    REQUEST_TIMEOUT: int = 30
+    REQUEST_TIMEOUT: int = 30  # read timeout per request
+    CONNECT_TIMEOUT: float = 5.0
     CONNECTION_POOL_SIZE: int = 10
+    SESSION_MODE: str = "shared"  # shared, thread or pool (see SessionPool)
+    TOKEN_TTL: int = 300
+    QUARANTINE_AFTER: int = 3  # rejected logins in a row; 0 disables tracking
+    VERIFY_CONCURRENCY: int = 16
+    RESPONSE_CACHE: bool = True
+    RESPONSE_CACHE_SIZE: int = 1024
+    HEDGE_REQUESTS: bool = False  # resend slow profile reads after their p95
+    HEDGE_BUDGET: float = 0.05  # at most this fraction of extra requests
+    HEDGE_MIN_SAMPLES: int = 20  # latencies needed before hedging an endpoint
 
     # Concurrency Settings
     MAX_CONCURRENT_REQUESTS: int = 2
     RATE_LIMIT_DELAY: float = 1.5
+    DP_MAX_CONCURRENT: int = 0  # per client_id; 0 means no cap
+    HOST_RATE_LIMIT: float = 0.0  # requests/second across all processes; 0 = off
+    HOST_RATE_BURST: float = 0.0  # 0 means one second's worth
+    HOST_RATE_FILE: str = ""  # default: bulk_ipo_rate_budget in the temp dir
+
+    # Scheduled Release Settings
+    RELEASE_CONCURRENCY: int = 16  # apply requests sent together at T-0
+    RELEASE_LEAD_MS: float = 0.0  # send this much before the target
+    RELEASE_PREPARE_LEAD: int = 60  # seconds before T-0 to start preparing
+    RELEASE_WARM_LEAD: float = 2.0  # open connections this early; 0 = off
 
     # Retry Settings
     MAX_RETRY_ATTEMPTS: int = 3
@@ -37,15 +64,61 @@ class Settings:
     EXPONENTIAL_BACKOFF: bool = True
     AUTO_RETRY_FAILED: bool = True
     AUTO_RETRY_DELAY: int = 10
+    IN_RUN_RETRIES: int = 0
+    RUN_DEADLINE: int = 0  # seconds a bulk run may take; 0 means no limit
+
+    # Watchdog Settings
+    WATCHDOG: bool = True  # requeue accounts stuck past their stage deadline
+    STAGE_DEADLINE_SLACK: float = 10.0  # seconds on top of a stage's timeouts
+    WATCHDOG_INTERVAL: float = 1.0
+
+    # Eligibility Settings
+    ELIGIBILITY_PREFILTER: bool = True
+    ELIGIBILITY_TTL: int = 3600
+
+    # Issue Catalog Settings
+    CATALOG_TTL: int = 60
+    CATALOG_PAGE_SIZE: int = 50
+    CATALOG_PROBE_ACCOUNTS: int = 1
+
+    # Coordinator Settings
+    LEASE_TIMEOUT: int = 300
+    WORKER_POLL_INTERVAL: float = 2.0
+
+    # Reconciliation Settings
+    RECONCILE_CONCURRENCY: int = 16
+    REPORT_PAGE_SIZE: int = 200
+
+    # Watch Mode Settings
+    WATCH_OPEN_TIMES: str = "10:00"  # comma-separated HH:MM, local time
+    WATCH_FAST_WINDOW: int = 15  # minutes either side of an opening time
+    WATCH_FAST_INTERVAL: float = 5.0
+    WATCH_SLOW_INTERVAL: float = 300.0
+
+    # Monitoring Settings
+    METRICS_PORT: int = 0  # 0 disables the /metrics endpoint
+    METRICS_HOST: str = "127.0.0.1"
+
+    # Soak Test Settings (growth allowed after warm-up)
+    SOAK_MAX_RSS_GROWTH_MB: float = 64.0
+    SOAK_MAX_FD_GROWTH: int = 8
+    SOAK_MAX_THREAD_GROWTH: int = 4
+    SOAK_MAX_OBJECT_GROWTH: int = 50000
 
     # UI Settings
     SHOW_PROGRESS_BAR: bool = True
     COLORED_OUTPUT: bool = True
     DETAILED_LOGGING: bool = True
 
+    # Logging Settings
+    LOG_LEVEL: str = "INFO"
+    LOG_JSON: bool = False
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
+
     # Advanced Settings
     SAVE_DETAILED_LOGS: bool = True
     BACKUP_RESULTS: bool = True
+    SAVE_HISTORY: bool = True
     CLEANUP_OLD_LOGS: bool = True
     MAX_LOG_FILES: int = 10
 
@@ -53,36 +126,189 @@ class Settings:
         """Load environment variables and validate settings"""
         self._load_from_env()
         self._validate_settings()
-        self._ensure_directories()
 
     def _load_from_env(self):
         """Load settings from environment variables"""
+        self.API_BASE_URL = os.getenv("IPO_API_BASE_URL", self.API_BASE_URL)
         self.MAX_CONCURRENT_REQUESTS = int(
             os.getenv("IPO_MAX_CONCURRENT", self.MAX_CONCURRENT_REQUESTS)
         )
         self.RATE_LIMIT_DELAY = float(
             os.getenv("IPO_RATE_LIMIT_DELAY", self.RATE_LIMIT_DELAY)
         )
+        self.DP_MAX_CONCURRENT = int(
+            os.getenv("IPO_DP_MAX_CONCURRENT", self.DP_MAX_CONCURRENT)
+        )
+        self.IN_RUN_RETRIES = int(os.getenv("IPO_IN_RUN_RETRIES", self.IN_RUN_RETRIES))
+        self.RUN_DEADLINE = int(os.getenv("IPO_RUN_DEADLINE", self.RUN_DEADLINE))
         self.MAX_RETRY_ATTEMPTS = int(
             os.getenv("IPO_MAX_RETRIES", self.MAX_RETRY_ATTEMPTS)
         )
         self.DETAILED_LOGGING = (
             os.getenv("IPO_DETAILED_LOGGING", "true").lower() == "true"
         )
+        self.LOG_LEVEL = os.getenv("IPO_LOG_LEVEL", self.LOG_LEVEL).upper()
+        self.LOG_JSON = os.getenv("IPO_LOG_JSON", "false").lower() == "true"
+        self.LOG_DEBUG_SAMPLE_RATE = float(
+            os.getenv("IPO_LOG_DEBUG_SAMPLE", self.LOG_DEBUG_SAMPLE_RATE)
+        )
+        self.TOKEN_TTL = int(os.getenv("IPO_TOKEN_TTL", self.TOKEN_TTL))
+        self.REQUEST_TIMEOUT = int(
+            os.getenv("IPO_REQUEST_TIMEOUT", self.REQUEST_TIMEOUT)
+        )
+        self.CONNECT_TIMEOUT = float(
+            os.getenv("IPO_CONNECT_TIMEOUT", self.CONNECT_TIMEOUT)
+        )
+        self.WATCHDOG = os.getenv("IPO_WATCHDOG", "true").lower() == "true"
+        self.STAGE_DEADLINE_SLACK = float(
+            os.getenv("IPO_STAGE_DEADLINE_SLACK", self.STAGE_DEADLINE_SLACK)
+        )
+        self.CONNECTION_POOL_SIZE = int(
+            os.getenv("IPO_CONNECTION_POOL_SIZE", self.CONNECTION_POOL_SIZE)
+        )
+        self.HOST_RATE_LIMIT = float(
+            os.getenv("IPO_HOST_RATE_LIMIT", self.HOST_RATE_LIMIT)
+        )
+        self.HOST_RATE_BURST = float(
+            os.getenv("IPO_HOST_RATE_BURST", self.HOST_RATE_BURST)
+        )
+        self.HOST_RATE_FILE = os.getenv("IPO_HOST_RATE_FILE", self.HOST_RATE_FILE)
+        self.RELEASE_CONCURRENCY = int(
+            os.getenv("IPO_RELEASE_CONCURRENCY", self.RELEASE_CONCURRENCY)
+        )
+        self.RELEASE_LEAD_MS = float(
+            os.getenv("IPO_RELEASE_LEAD_MS", self.RELEASE_LEAD_MS)
+        )
+        self.RELEASE_PREPARE_LEAD = int(
+            os.getenv("IPO_RELEASE_PREPARE_LEAD", self.RELEASE_PREPARE_LEAD)
+        )
+        self.RELEASE_WARM_LEAD = float(
+            os.getenv("IPO_RELEASE_WARM_LEAD", self.RELEASE_WARM_LEAD)
+        )
+        self.QUARANTINE_AFTER = int(
+            os.getenv("IPO_QUARANTINE_AFTER", self.QUARANTINE_AFTER)
+        )
+        self.VERIFY_CONCURRENCY = int(
+            os.getenv("IPO_VERIFY_CONCURRENCY", self.VERIFY_CONCURRENCY)
+        )
+        self.CREDENTIAL_HEALTH_FILE = os.getenv(
+            "IPO_CREDENTIAL_HEALTH_FILE", self.CREDENTIAL_HEALTH_FILE
+        )
+        self.SESSION_MODE = os.getenv("IPO_SESSION_MODE", self.SESSION_MODE).lower()
+        self.HEDGE_REQUESTS = os.getenv("IPO_HEDGE_REQUESTS", "false").lower() == "true"
+        self.HEDGE_BUDGET = float(os.getenv("IPO_HEDGE_BUDGET", self.HEDGE_BUDGET))
+        self.RESPONSE_CACHE = os.getenv("IPO_RESPONSE_CACHE", "true").lower() == "true"
+        self.ELIGIBILITY_PREFILTER = (
+            os.getenv("IPO_ELIGIBILITY_PREFILTER", "true").lower() == "true"
+        )
+        self.CATALOG_TTL = int(os.getenv("IPO_CATALOG_TTL", self.CATALOG_TTL))
+        self.CATALOG_PROBE_ACCOUNTS = int(
+            os.getenv("IPO_CATALOG_PROBE_ACCOUNTS", self.CATALOG_PROBE_ACCOUNTS)
+        )
+        self.RECONCILE_CONCURRENCY = int(
+            os.getenv("IPO_RECONCILE_CONCURRENCY", self.RECONCILE_CONCURRENCY)
+        )
+        self.METRICS_PORT = int(os.getenv("IPO_METRICS_PORT", self.METRICS_PORT))
+        self.METRICS_HOST = os.getenv("IPO_METRICS_HOST", self.METRICS_HOST)
+        self.HISTORY_FILE = os.getenv("IPO_HISTORY_FILE", self.HISTORY_FILE)
+        self.WATCH_STATE_FILE = os.getenv("IPO_WATCH_STATE_FILE", self.WATCH_STATE_FILE)
+        self.WATCH_OPEN_TIMES = os.getenv("IPO_WATCH_OPEN_TIMES", self.WATCH_OPEN_TIMES)
+        self.WATCH_FAST_WINDOW = int(
+            os.getenv("IPO_WATCH_FAST_WINDOW", self.WATCH_FAST_WINDOW)
+        )
+        self.WATCH_FAST_INTERVAL = float(
+            os.getenv("IPO_WATCH_FAST_INTERVAL", self.WATCH_FAST_INTERVAL)
+        )
+        self.WATCH_SLOW_INTERVAL = float(
+            os.getenv("IPO_WATCH_SLOW_INTERVAL", self.WATCH_SLOW_INTERVAL)
+        )
+        self.SAVE_HISTORY = os.getenv("IPO_SAVE_HISTORY", "true").lower() == "true"
+        self.QUEUE_FILE = os.getenv("IPO_QUEUE_FILE", self.QUEUE_FILE)
+        self.LEASE_TIMEOUT = int(os.getenv("IPO_LEASE_TIMEOUT", self.LEASE_TIMEOUT))
+        self.SOAK_MAX_RSS_GROWTH_MB = float(
+            os.getenv("IPO_SOAK_MAX_RSS_GROWTH_MB", self.SOAK_MAX_RSS_GROWTH_MB)
+        )
+        self.SOAK_MAX_FD_GROWTH = int(
+            os.getenv("IPO_SOAK_MAX_FD_GROWTH", self.SOAK_MAX_FD_GROWTH)
+        )
+        self.SOAK_MAX_THREAD_GROWTH = int(
+            os.getenv("IPO_SOAK_MAX_THREAD_GROWTH", self.SOAK_MAX_THREAD_GROWTH)
+        )
+        self.SOAK_MAX_OBJECT_GROWTH = int(
+            os.getenv("IPO_SOAK_MAX_OBJECT_GROWTH", self.SOAK_MAX_OBJECT_GROWTH)
+        )
 
     def _validate_settings(self):
         """Validate configuration values"""
         if self.MAX_CONCURRENT_REQUESTS < 1:
             raise ValueError("MAX_CONCURRENT_REQUESTS must be at least 1")
+        if self.RECONCILE_CONCURRENCY < 1:
+            raise ValueError("RECONCILE_CONCURRENCY must be at least 1")
+        if self.DP_MAX_CONCURRENT < 0:
+            raise ValueError("DP_MAX_CONCURRENT cannot be negative")
+        if self.IN_RUN_RETRIES < 0:
+            raise ValueError("IN_RUN_RETRIES cannot be negative")
+        if self.RUN_DEADLINE < 0:
+            raise ValueError("RUN_DEADLINE cannot be negative")
+        if self.REQUEST_TIMEOUT <= 0 or self.CONNECT_TIMEOUT <= 0:
+            raise ValueError("REQUEST_TIMEOUT and CONNECT_TIMEOUT must be positive")
+        if self.STAGE_DEADLINE_SLACK < 0:
+            raise ValueError("STAGE_DEADLINE_SLACK cannot be negative")
+        if self.WATCHDOG_INTERVAL <= 0:
+            raise ValueError("WATCHDOG_INTERVAL must be positive")
         if self.RATE_LIMIT_DELAY < 0:
             raise ValueError("RATE_LIMIT_DELAY cannot be negative")
         if self.MAX_RETRY_ATTEMPTS < 0:
             raise ValueError("MAX_RETRY_ATTEMPTS cannot be negative")
+        if self.LOG_LEVEL not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            raise ValueError(f"Unknown LOG_LEVEL: {self.LOG_LEVEL}")
+        if not 0.0 <= self.LOG_DEBUG_SAMPLE_RATE <= 1.0:
+            raise ValueError("LOG_DEBUG_SAMPLE_RATE must be between 0 and 1")
+        if self.CATALOG_PROBE_ACCOUNTS < 1:
+            raise ValueError("CATALOG_PROBE_ACCOUNTS must be at least 1")
+        if self.WATCH_FAST_INTERVAL <= 0 or self.WATCH_SLOW_INTERVAL <= 0:
+            raise ValueError("Watch polling intervals must be positive")
+        if self.WATCH_FAST_WINDOW < 0:
+            raise ValueError("WATCH_FAST_WINDOW cannot be negative")
+        if self.HOST_RATE_LIMIT < 0 or self.HOST_RATE_BURST < 0:
+            raise ValueError("HOST_RATE_LIMIT and HOST_RATE_BURST cannot be negative")
+        if self.RELEASE_CONCURRENCY < 1:
+            raise ValueError("RELEASE_CONCURRENCY must be at least 1")
+        if self.RELEASE_PREPARE_LEAD < 0:
+            raise ValueError("RELEASE_PREPARE_LEAD cannot be negative")
+        if self.RELEASE_WARM_LEAD < 0:
+            raise ValueError("RELEASE_WARM_LEAD cannot be negative")
+        if self.SESSION_MODE not in ("shared", "thread", "pool"):
+            raise ValueError(f"Unknown SESSION_MODE: {self.SESSION_MODE}")
+        if not 0.0 <= self.HEDGE_BUDGET <= 1.0:
+            raise ValueError("HEDGE_BUDGET must be between 0 and 1")
+        if self.HEDGE_MIN_SAMPLES < 1:
+            raise ValueError("HEDGE_MIN_SAMPLES must be at least 1")
+        if self.QUARANTINE_AFTER < 0:
+            raise ValueError("QUARANTINE_AFTER cannot be negative")
+        if self.VERIFY_CONCURRENCY < 1:
+            raise ValueError("VERIFY_CONCURRENCY must be at least 1")
+        if self.LEASE_TIMEOUT < 1:
+            raise ValueError("LEASE_TIMEOUT must be at least 1 second")
+        if (
+            min(
+                self.SOAK_MAX_RSS_GROWTH_MB,
+                self.SOAK_MAX_FD_GROWTH,
+                self.SOAK_MAX_THREAD_GROWTH,
+                self.SOAK_MAX_OBJECT_GROWTH,
+            )
+            < 0
+        ):
+            raise ValueError("Soak growth thresholds cannot be negative")
 
-    def _ensure_directories(self):
-        """Ensure required directories exist"""
-        log_dir = self.BASE_DIR / self.LOG_DIR
-        log_dir.mkdir(exist_ok=True)
+    @property
+    def stage_deadlines(self) -> Dict[str, float]:
+        """Seconds each application stage may take before the watchdog acts"""
+        per_request = self.CONNECT_TIMEOUT + self.REQUEST_TIMEOUT
+        return {
+            stage: requests * per_request + self.STAGE_DEADLINE_SLACK
+            for stage, requests in ApplicationStage.REQUESTS.items()
+        }
 
     @property
     def accounts_path(self) -> Path:
@@ -94,6 +320,33 @@ class Settings:
         """Get full path to results file"""
         return self.BASE_DIR / self.RESULTS_FILE
 
+    @property
+    def history_path(self) -> Path:
+        """Get full path to results history database"""
+        return self.BASE_DIR / self.HISTORY_FILE
+
+    @property
+    def watch_state_path(self) -> Path:
+        """Get full path to watch mode state file"""
+        return self.BASE_DIR / self.WATCH_STATE_FILE
+
+    @property
+    def credential_health_path(self) -> Path:
+        """Get full path to credential health database"""
+        return self.BASE_DIR / self.CREDENTIAL_HEALTH_FILE
+
+    @property
+    def host_rate_path(self) -> Path:
+        """Get full path to the host-wide rate budget file"""
+        if self.HOST_RATE_FILE:
+            return Path(self.HOST_RATE_FILE)
+        return Path(tempfile.gettempdir()) / "bulk_ipo_rate_budget"
+
+    @property
+    def queue_path(self) -> Path:
+        """Get full path to work queue database"""
+        return self.BASE_DIR / self.QUEUE_FILE
+
     @property
     def log_dir_path(self) -> Path:
         """Get full path to log directory"""
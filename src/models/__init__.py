@@ -3,5 +3,6 @@
 from .user import User
 from .ipo_application import IPOApplication
 from .application_result import ApplicationResult
+from .watch_rule import WatchRule
 
-__all__ = ["User", "IPOApplication", "ApplicationResult"]
+__all__ = ["User", "IPOApplication", "ApplicationResult", "WatchRule"]
@@ -16,6 +16,10 @@ class ApplicationResult:
     applications: List[IPOApplication] = field(default_factory=list)
     started_at: datetime = field(default_factory=datetime.now)
     completed_at: datetime = field(default_factory=datetime.now)
+    # Attempts the watchdog abandoned past their stage deadline
+    tail_events: List[Dict[str, Any]] = field(default_factory=list)
+    # Bytes on the wire per endpoint and account (see TransferStats.since)
+    transfer: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def total_accounts(self) -> int:
@@ -59,6 +63,11 @@ class ApplicationResult:
         """Get list of failed applications"""
         return [app for app in self.applications if app.is_failed]
 
+    @property
+    def mismatched_applications(self) -> List[IPOApplication]:
+        """Get list of applications corrected by reconciliation"""
+        return [app for app in self.applications if app.mismatch]
+
     @property
     def retryable_applications(self) -> List[IPOApplication]:
         """Get list of applications that can be retried"""
@@ -89,6 +98,9 @@ class ApplicationResult:
             "successful": self.successful,
             "failed": self.failed,
             "pending": self.pending,
+            "verified": len([app for app in self.applications if app.verified]),
+            "mismatched": len(self.mismatched_applications),
+            "stuck_attempts": len(self.tail_events),
             "success_rate": round(self.success_rate, 2),
             "duration_seconds": round(self.duration, 2),
             "error_summary": self.get_error_summary(),
@@ -101,4 +113,25 @@ class ApplicationResult:
         return {
             "statistics": self.get_statistics(),
             "applications": [app.to_dict() for app in self.applications],
+            "tail_events": list(self.tail_events),
+            "transfer": self.transfer,
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ApplicationResult":
+        """Create ApplicationResult from a serialized dictionary"""
+        statistics = data.get("statistics", {})
+        result = cls(
+            applications=[
+                IPOApplication.from_dict(app) for app in data.get("applications", [])
+            ],
+            tail_events=list(data.get("tail_events", [])),
+            transfer=data.get("transfer", {}),
+        )
+
+        if statistics.get("started_at"):
+            result.started_at = datetime.fromisoformat(statistics["started_at"])
+        if statistics.get("completed_at"):
+            result.completed_at = datetime.fromisoformat(statistics["completed_at"])
+
+        return result
@@ -21,6 +21,9 @@ class IPOApplication:
     status: str = ApplicationStatus.PENDING
     error_message: str = ""
     attempts: int = 0
+    duration_seconds: float = 0.0
+    verified: bool = False
+    mismatch: bool = False
     last_attempt: Optional[datetime] = None
     created_at: datetime = field(default_factory=datetime.now)
 
@@ -69,6 +72,26 @@ class IPOApplication:
         self.attempts += 1
         self.last_attempt = datetime.now()
 
+    def mark_reconciled(self, applied: bool, detail: str = ""):
+        """
+        Set the status from the applied-issue report
+
+        Flags a mismatch when the report disagrees with the recorded
+        outcome (e.g. a timeout that actually went through).
+
+        Args:
+            applied: Whether the report shows a valid application
+            detail: Report status or reason, used as error message if not applied
+        """
+        self.mismatch = applied != self.is_successful
+        self.verified = True
+        if applied:
+            self.status = ApplicationStatus.SUCCESS
+            self.error_message = ""
+        elif self.mismatch or not self.error_message:
+            self.status = ApplicationStatus.FAILED
+            self.error_message = detail or "Not found in applied-issue report"
+
     def increment_attempts(self):
         """Increment attempt counter"""
         self.attempts += 1
@@ -105,8 +128,37 @@ class IPOApplication:
             "status": self.status,
             "error_message": self.error_message,
             "attempts": self.attempts,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "verified": self.verified,
+            "mismatch": self.mismatch,
             "last_attempt": (
                 self.last_attempt.isoformat() if self.last_attempt else None
             ),
             "created_at": self.created_at.isoformat(),
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IPOApplication":
+        """Create IPOApplication from a serialized dictionary"""
+        last_attempt = data.get("last_attempt")
+        created_at = data.get("created_at")
+
+        return cls(
+            user_id=str(data["user_id"]),
+            user_name=data["user_name"],
+            company_id=int(data["company_id"]),
+            kitta_amount=int(data["kitta_amount"]),
+            company_name=data.get("company_name", ""),
+            status=data.get("status", ApplicationStatus.PENDING),
+            error_message=data.get("error_message", ""),
+            attempts=data.get("attempts", 0),
+            duration_seconds=data.get("duration_seconds", 0.0),
+            verified=data.get("verified", False),
+            mismatch=data.get("mismatch", False),
+            last_attempt=(
+                datetime.fromisoformat(last_attempt) if last_attempt else None
+            ),
+            created_at=(
+                datetime.fromisoformat(created_at) if created_at else datetime.now()
+            ),
+        )
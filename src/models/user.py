@@ -2,6 +2,7 @@
 User model with validation
 """
 
+import hashlib
 from dataclasses import dataclass
 
 
@@ -41,6 +42,12 @@ class User:
         """Get display name for the user"""
         return f"{self.username} ({self.client_id})"
 
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the credentials as written in accounts.txt"""
+        line = f"{self.client_id},{self.username},{self.password},{self.crn},{self.pin}"
+        return hashlib.sha256(line.encode("utf-8")).hexdigest()[:16]
+
     def to_dict(self) -> dict:
         """Convert user to dictionary"""
         return {
@@ -0,0 +1,87 @@
+"""
+Watch rule model: which new issues to apply for, with which accounts
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .user import User
+
+
+@dataclass
+class WatchRule:
+    """Rule matching new issues to an account group and kitta amount"""
+
+    name: str
+    kitta: int
+    share_type: str = "IPO"
+    share_group: Optional[str] = None
+    scrips: List[str] = field(default_factory=list)
+    client_ids: List[int] = field(default_factory=list)
+    usernames: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Validate rule data"""
+        self._validate()
+
+    def _validate(self):
+        """Validate rule fields"""
+        if not self.name or not isinstance(self.name, str):
+            raise ValueError("name must be a non-empty string")
+
+        if not isinstance(self.kitta, int) or self.kitta <= 0:
+            raise ValueError("kitta must be a positive integer")
+
+        if not self.share_type or not isinstance(self.share_type, str):
+            raise ValueError("share_type must be a non-empty string")
+
+    def matches(self, issue: Dict) -> bool:
+        """Check whether an applicable issue falls under this rule"""
+        if issue.get("shareTypeName", "").upper() != self.share_type.upper():
+            return False
+
+        if self.share_group and (
+            issue.get("shareGroupName", "").upper() != self.share_group.upper()
+        ):
+            return False
+
+        if self.scrips and (
+            issue.get("scrip", "").upper() not in {s.upper() for s in self.scrips}
+        ):
+            return False
+
+        return True
+
+    def select(self, users: List[User]) -> List[User]:
+        """Accounts in this rule's group (all accounts when unrestricted)"""
+        return [
+            user
+            for user in users
+            if (not self.client_ids or user.client_id in self.client_ids)
+            and (not self.usernames or user.username in self.usernames)
+        ]
+
+    def to_dict(self) -> Dict:
+        """Convert rule to dictionary"""
+        return {
+            "name": self.name,
+            "kitta": self.kitta,
+            "share_type": self.share_type,
+            "share_group": self.share_group,
+            "scrips": self.scrips,
+            "client_ids": self.client_ids,
+            "usernames": self.usernames,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WatchRule":
+        """Create WatchRule from a rules file entry"""
+        return cls(
+            name=data["name"],
+            kitta=int(data["kitta"]),
+            share_type=data.get("share_type", "IPO"),
+            share_group=data.get("share_group"),
+            scrips=list(data.get("scrips", [])),
+            client_ids=[int(client_id) for client_id in data.get("client_ids", [])],
+            usernames=list(data.get("usernames", [])),
+        )
@@ -3,5 +3,23 @@
 from .account_service import AccountService
 from .ipo_service import IPOService
 from .application_service import ApplicationService
+from .coordinator_service import CoordinatorService
+from .issue_catalog_service import IssueCatalogService
+from .session_service import AccountSessionService
+from .eligibility_service import EligibilityService
+from .reconciliation_service import ReconciliationService
+from .watch_service import WatchService
+from .credential_service import CredentialService
 
-__all__ = ["AccountService", "IPOService", "ApplicationService"]
+__all__ = [
+    "AccountService",
+    "IPOService",
+    "ApplicationService",
+    "CoordinatorService",
+    "IssueCatalogService",
+    "AccountSessionService",
+    "EligibilityService",
+    "ReconciliationService",
+    "WatchService",
+    "CredentialService",
+]
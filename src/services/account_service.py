@@ -54,14 +54,14 @@ class AccountService:
                         user = User.from_csv_line(line)
                         accounts.append(user)
                     except ValueError as e:
-                        self.logger.warning(f"Skipping invalid line {line_num}: {e}")
+                        self.logger.warning("Skipping invalid line %s: %s", line_num, e)
                         continue
 
-            self.logger.info(f"Successfully loaded {len(accounts)} accounts")
+            self.logger.info("Successfully loaded %s accounts", len(accounts))
             return accounts
 
         except Exception as e:
-            self.logger.error(f"Error reading accounts file: {e}")
+            self.logger.error("Error reading accounts file: %s", e)
             raise
 
     def validate_accounts(self, accounts: List[User]) -> List[User]:
@@ -81,7 +81,7 @@ class AccountService:
                 # User validation happens in __post_init__
                 valid_accounts.append(account)
             except ValueError as e:
-                self.logger.warning(f"Invalid account {account.username}: {e}")
+                self.logger.warning("Invalid account %s: %s", account.username, e)
                 continue
 
         return valid_accounts
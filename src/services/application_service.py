@@ -2,29 +2,79 @@
 Application service for bulk IPO processing
 """
 
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict
+from datetime import datetime
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import logging
 
 from ..models.user import User
 from ..models.ipo_application import IPOApplication
 from ..models.application_result import ApplicationResult
 from ..api.meroshare_client import MeroShareClient
+from ..api.client_registry import get_client
 from ..config.settings import get_settings
-from ..config.constants import UIConstants
+from ..config.constants import ApplicationStage, EventType, UIConstants
+from ..utils.events import EventBus
+from ..utils.dashboard import ProgressDashboard
+from ..utils.fair_scheduler import FairScheduler
+from ..utils.profiling import profile_phase
+from ..utils.metrics import REGISTRY
+from ..utils.release_scheduler import ReleaseReport, ReleaseScheduler
+from ..utils.watchdog import Attempt, Watchdog
+from ..utils.deadline import Deadline, deadline_scope
+from ..utils.transfer_stats import account_scope
+from .session_service import AccountSessionService
+from .eligibility_service import EligibilityService
+from .reconciliation_service import ReconciliationService
+
+APPLICATIONS = REGISTRY.counter(
+    "ipo_applications",
+    "Finished applications by outcome and error",
+    ["outcome", "error"],
+)
+WORKERS = REGISTRY.gauge("ipo_workers", "Apply workers in the current run")
+WORKERS_BUSY = REGISTRY.gauge("ipo_workers_busy", "Apply workers running an account")
+STUCK_ATTEMPTS = REGISTRY.counter(
+    "ipo_stuck_attempts",
+    "Attempts abandoned by the watchdog, by the stage they were stuck in",
+    ["stage"],
+)
+DEADLINE_DROPPED = REGISTRY.counter(
+    "ipo_deadline_dropped",
+    "First attempts and retries skipped because the run deadline was near",
+    ["kind"],
+)
+SCHEDULER_WAIT = REGISTRY.counter(
+    "ipo_scheduler_wait_seconds",
+    "Time workers waited for work, rate limit or per-DP cap",
+)
 
 
 class ApplicationService:
     """Service for processing bulk IPO applications"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        events: Optional[EventBus] = None,
+        client: Optional[MeroShareClient] = None,
+    ):
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
-        self.client = MeroShareClient()
+        self.client = client or get_client()
+        self.events = events or EventBus()
+        self.sessions = AccountSessionService(self.client)
+        self.eligibility = EligibilityService(self.client, self.sessions)
+        self.reconciliation = ReconciliationService(self.client, self.sessions)
 
     def process_bulk_applications(
-        self, users: List[User], company_id: int, kitta_amount: int
+        self,
+        users: List[User],
+        company_id: int,
+        kitta_amount: int,
+        deadline: Optional[Deadline] = None,
     ) -> ApplicationResult:
         """
         Process IPO applications for multiple users concurrently
@@ -33,11 +83,18 @@ class ApplicationService:
             users: List of User objects
             company_id: Company ID for IPO
             kitta_amount: Number of kittas to apply
+            deadline: When the run must be over, e.g. the issue's closing
+                time; the earlier of this and RUN_DEADLINE applies
 
         Returns:
             ApplicationResult with processing results
         """
         result = ApplicationResult()
+        transfer_before = self.client.transfer.snapshot()
+        if self.settings.RUN_DEADLINE:
+            deadline = Deadline.earliest(
+                deadline, Deadline.after(self.settings.RUN_DEADLINE)
+            )
 
         print(
             f"\n{UIConstants.ROCKET_EMOJI} Starting bulk IPO application for {len(users)} accounts..."
@@ -46,57 +103,557 @@ class ApplicationService:
             f"{UIConstants.INFO_EMOJI} Company ID: {company_id}, Kittas: {kitta_amount}"
         )
         print(f"⚙️ Max concurrent: {self.settings.MAX_CONCURRENT_REQUESTS}")
+        if deadline is not None:
+            print(f"⏳ Deadline in {deadline.remaining():.0f} seconds")
         print("-" * 60)
 
+        with profile_phase("bulk"), deadline_scope(deadline):
+            users = self._skip_quarantined(users, company_id, kitta_amount, result)
+            if self.settings.ELIGIBILITY_PREFILTER:
+                users = self._prefilter_eligible(
+                    users, company_id, kitta_amount, result
+                )
+
+            dashboard = None
+            if self.settings.SHOW_PROGRESS_BAR:
+                dashboard = ProgressDashboard(
+                    self.events, total=len(users), colored=self.settings.COLORED_OUTPUT
+                )
+                dashboard.start()
+
+            try:
+                self._run_bulk(users, company_id, kitta_amount, result, deadline)
+            finally:
+                if dashboard is not None:
+                    dashboard.stop()
+
+        result.mark_completed()
+        result.transfer = self.client.transfer.since(transfer_before)
+        self.logger.info("Response cache: %s", self.client.cache_stats())
+        self.logger.info("Transfer: %s", result.transfer["total"])
+        return result
+
+    def process_scheduled_applications(
+        self,
+        users: List[User],
+        company_id: int,
+        kitta_amount: int,
+        release_at: float,
+    ) -> Tuple[ApplicationResult, ReleaseReport]:
+        """
+        Prepare every application now and send them all at a fixed time
+
+        Args:
+            users: List of User objects
+            company_id: Company ID for IPO
+            kitta_amount: Number of kittas to apply
+            release_at: Target server time (epoch seconds) for the first
+                apply request
+
+        Returns:
+            Tuple of (ApplicationResult, ReleaseReport with the achieved jitter)
+        """
+        result = ApplicationResult()
+        users = self._skip_quarantined(users, company_id, kitta_amount, result)
+
+        print(
+            f"\n{UIConstants.ROCKET_EMOJI} Preparing {len(users)} applications "
+            f"for release at {datetime.fromtimestamp(release_at):%H:%M:%S.%f}"
+        )
         with ThreadPoolExecutor(
             max_workers=self.settings.MAX_CONCURRENT_REQUESTS
         ) as executor:
-            # Submit all tasks
-            future_to_user = {
-                executor.submit(
-                    self._apply_ipo_for_user, user, company_id, kitta_amount
-                ): user
-                for user in users
-            }
-
-            # Process results as they complete
-            for i, future in enumerate(as_completed(future_to_user), 1):
-                user = future_to_user[future]
+            prepared = list(
+                executor.map(
+                    lambda user: self._prepare_scheduled(
+                        user, company_id, kitta_amount
+                    ),
+                    users,
+                )
+            )
+
+        ready = []
+        for user, application, started, data in prepared:
+            if data is None:
+                self._finish_scheduled(user, application, started, result)
+            else:
+                ready.append((user, application, started, data))
+
+        print(
+            f"{UIConstants.INFO_EMOJI} {len(ready)} prepared; clock offset "
+            f"{self.client.clock.offset * 1000:+.1f} ms "
+            f"(±{(self.client.clock.uncertainty or 0) * 1000:.1f} ms, "
+            f"{self.client.clock.samples} samples)"
+        )
+
+        def fire(item) -> None:
+            user, application, started, (token, data) = item
+            try:
+                with account_scope(user.username):
+                    self._submit_application(user, application, token, data)
+            except Exception as e:
+                application.mark_failed(str(e))
+                self.logger.error("Error applying IPO for %s: %s", user.username, e)
+            application.increment_attempts()
+            self._finish_scheduled(user, application, started, result)
+
+        # Prepare ran MAX_CONCURRENT_REQUESTS connections, possibly a minute
+        # ago; open one per release worker just before T-0 instead
+        release = ReleaseScheduler(
+            self.client.clock,
+            workers=self.settings.RELEASE_CONCURRENCY,
+            lead=self.settings.RELEASE_LEAD_MS / 1000,
+            warm=(
+                self.client.warm_connection if self.settings.RELEASE_WARM_LEAD else None
+            ),
+            warm_lead=self.settings.RELEASE_WARM_LEAD,
+        )
+        report = release.run(release_at, ready, fire)
+
+        result.mark_completed()
+        return result, report
+
+    def _prepare_scheduled(self, user: User, company_id: int, kitta_amount: int):
+        """Prepare one scheduled application; data is None on failure"""
+        application = IPOApplication(
+            user_id=str(user.client_id),
+            user_name=user.username,
+            company_id=company_id,
+            kitta_amount=kitta_amount,
+        )
+        self.events.emit(EventType.STARTED, user.username)
+        started = time.perf_counter()
+        with account_scope(user.username):
+            try:
+                data = self._prepare_for_user(
+                    user, company_id, kitta_amount, application
+                )
+            except Exception as e:
+                application.mark_failed(str(e))
+                self.logger.error("Error preparing %s: %s", user.username, e)
+                data = None
+        return user, application, started, data
+
+    def _finish_scheduled(
+        self,
+        user: User,
+        application: IPOApplication,
+        started: float,
+        result: ApplicationResult,
+    ) -> None:
+        """Record a scheduled application's outcome"""
+        application.duration_seconds += time.perf_counter() - started
+        if not application.is_successful:
+            self.sessions.invalidate(user)
+        result.add_application(application)
+        self._emit_outcome(application)
+
+    def _skip_quarantined(
+        self,
+        users: List[User],
+        company_id: int,
+        kitta_amount: int,
+        result: ApplicationResult,
+    ) -> List[User]:
+        """Drop accounts whose credentials keep being rejected"""
+        if self.sessions.health is None:
+            return users
+
+        usable, quarantined = self.sessions.health.partition(users)
+        for user in quarantined:
+            application = IPOApplication(
+                user_id=str(user.client_id),
+                user_name=user.username,
+                company_id=company_id,
+                kitta_amount=kitta_amount,
+            )
+            application.mark_failed(
+                "Quarantined: login rejected repeatedly, update accounts.txt"
+            )
+            result.add_application(application)
+
+        if quarantined:
+            print(
+                f"{UIConstants.WARNING_EMOJI} Skipping {len(quarantined)} quarantined "
+                "accounts (run 'verify-credentials' after fixing them)"
+            )
+        return usable
+
+    def _prefilter_eligible(
+        self,
+        users: List[User],
+        company_id: int,
+        kitta_amount: int,
+        result: ApplicationResult,
+    ) -> List[User]:
+        """Drop ineligible accounts, recording them as failed applications"""
+        eligible, ineligible = self.eligibility.partition(users, company_id)
+
+        for user, reason in ineligible:
+            application = IPOApplication(
+                user_id=str(user.client_id),
+                user_name=user.username,
+                company_id=company_id,
+                kitta_amount=kitta_amount,
+            )
+            application.mark_failed(f"Not eligible: {reason}")
+            result.add_application(application)
+
+        if ineligible:
+            print(
+                f"{UIConstants.WARNING_EMOJI} Skipping {len(ineligible)} ineligible accounts"
+            )
+        return eligible
+
+    def _run_bulk(
+        self,
+        users: List[User],
+        company_id: int,
+        kitta_amount: int,
+        result: ApplicationResult,
+        deadline: Optional[Deadline] = None,
+    ) -> None:
+        """
+        Run the application chain for all users and collect results
+
+        Work is scheduled fairly across DPs (client_id): groups are served
+        round-robin, optionally capped at DP_MAX_CONCURRENT in flight each,
+        and dispatches are spaced by RATE_LIMIT_DELAY. With IN_RUN_RETRIES
+        set, failed accounts go to a separate retry lane that only runs when
+        no first attempt is waiting.
+
+        With WATCHDOG on, an account stuck in one stage past its deadline is
+        abandoned: a replacement worker takes its slot, the account goes back
+        to the retry lane and the event is kept in result.tail_events. The
+        abandoned thread keeps running, but it can no longer claim the apply
+        request, so only one attempt per account ever sends it. An account
+        stuck after claiming the apply is not requeued, since its request
+        may still land; it is failed with an unknown status for reconcile to
+        verify.
+
+        With a deadline, every request's timeout is cut to the time left, a
+        retry is only queued if it can finish in time at the average attempt
+        duration so far, and retries wait while the time left is needed for
+        accounts not yet attempted. Accounts not started by the deadline are
+        recorded as failed.
+        """
+        workers = self.settings.MAX_CONCURRENT_REQUESTS
+        timing = {"total": 0.0, "count": 0}
+
+        def expected_attempt() -> float:
+            """Average duration of an attempt in this run"""
+            return timing["total"] / timing["count"] if timing["count"] else 0.0
+
+        def fits(delay: float) -> bool:
+            return deadline is None or deadline.fits(delay + expected_attempt())
+
+        def admit_retry(first_queued: int) -> bool:
+            # Keep enough time for the queued first attempts, then a retry
+            needed = (first_queued / workers + 1) * expected_attempt()
+            return deadline is None or deadline.fits(needed)
+
+        scheduler = FairScheduler(
+            key=lambda user: user.client_id,
+            per_key_limit=self.settings.DP_MAX_CONCURRENT,
+            min_interval=self.settings.RATE_LIMIT_DELAY,
+            admit_retry=admit_retry,
+        )
+        for user in users:
+            scheduler.put(user)
+            self.events.emit(EventType.SUBMITTED, user.username)
+
+        previous: Dict[str, IPOApplication] = {}
+        tries: Dict[str, int] = {}
+        stuck: Dict[str, int] = {}
+        lock = threading.Lock()
+        threads: List[threading.Thread] = []
+        abandoned: Set[threading.Thread] = set()
+        errors: List[BaseException] = []
+
+        def record(user: User, application: IPOApplication) -> None:
+            with lock:
+                timing["total"] += application.duration_seconds
+                timing["count"] += 1
+            tries[user.username] = tries.get(user.username, 0) + 1
+            earlier = previous.pop(user.username, None)
+            if earlier is not None:
+                application.attempts += earlier.attempts
+                application.duration_seconds += earlier.duration_seconds
+
+            retry = (
+                application.is_failed
+                and tries[user.username] <= self.settings.IN_RUN_RETRIES
+            )
+            if retry and not fits(self._retry_delay(tries[user.username])):
+                retry = False
+                DEADLINE_DROPPED.inc("retry")
+                self.logger.info(
+                    "Not retrying %s: it would finish after the deadline",
+                    user.username,
+                )
+            if retry:
+                previous[user.username] = application
+                scheduler.put(
+                    user,
+                    FairScheduler.RETRY,
+                    delay=self._retry_delay(tries[user.username]),
+                )
+                self.events.emit(
+                    EventType.RETRYING,
+                    user.username,
+                    message=application.error_message,
+                )
+            else:
+                result.add_application(application)
+                self._emit_outcome(application)
+
+        def skip(user: User) -> None:
+            """Record an account the deadline left no time to (re)attempt"""
+            application = previous.pop(user.username, None)
+            if application is None:
+                application = IPOApplication(
+                    user_id=str(user.client_id),
+                    user_name=user.username,
+                    company_id=company_id,
+                    kitta_amount=kitta_amount,
+                )
+                application.mark_failed("Deadline reached: not attempted")
+                DEADLINE_DROPPED.inc("first")
+            else:
+                DEADLINE_DROPPED.inc("retry")
+            result.add_application(application)
+            self._emit_outcome(application)
+
+        def worker():
+            while True:
+                waited = time.perf_counter()
+                user = scheduler.get()
+                SCHEDULER_WAIT.inc(amount=time.perf_counter() - waited)
+                if user is None:
+                    return
+                if deadline is not None and deadline.expired:
+                    try:
+                        skip(user)
+                    finally:
+                        scheduler.done(user)
+                    continue
+                WORKERS_BUSY.inc()
+                attempt = before_apply = None
+                if watchdog is not None:
+                    attempt = watchdog.begin(user.username, user)
+                    # An abandoned attempt must not send the apply request
+                    # its replacement may send too
+                    before_apply = partial(watchdog.claim_apply, attempt)
                 try:
-                    application = future.result()
-                    result.add_application(application)
-
-                    # Progress indicator
-                    status_emoji = (
-                        UIConstants.SUCCESS_EMOJI
-                        if application.is_successful
-                        else UIConstants.FAILED_EMOJI
-                    )
-                    print(
-                        f"{status_emoji} [{i:2d}/{len(users)}] {application.user_name}: {application.status}"
+                    application = self._run_attempt(
+                        user, company_id, kitta_amount, before_apply
                     )
+                except BaseException:
+                    if attempt is None or watchdog.finish(attempt):
+                        WORKERS_BUSY.dec()
+                        scheduler.done(user)
+                    raise
+                if attempt is not None and not watchdog.finish(attempt):
+                    # The watchdog released this account to a replacement
+                    # worker; this late result is discarded
+                    return
+                try:
+                    record(user, application)
+                finally:
+                    WORKERS_BUSY.dec()
+                    scheduler.done(user)
+
+        def run_worker():
+            try:
+                with deadline_scope(deadline):
+                    worker()
+            except BaseException as e:
+                errors.append(e)
+                scheduler.cancel()
+
+        def spawn() -> None:
+            """Start a worker thread; caller holds lock"""
+            thread = threading.Thread(target=run_worker, daemon=True)
+            threads.append(thread)
+            thread.start()
+
+        def on_stuck(attempt: Attempt, elapsed: float) -> None:
+            user = attempt.item
+            stage = attempt.next_stage
+            stage_deadline = self.settings.stage_deadlines[stage]
+            # A claimed apply request may still reach the server, so the
+            # account is never sent again; an unclaimed one never will be
+            in_apply = attempt.claimed
+            with lock:
+                stuck[user.username] = stuck.get(user.username, 0) + 1
+                # Reassign at least once even without in-run retries
+                requeue = not in_apply and stuck[user.username] <= max(
+                    1, self.settings.IN_RUN_RETRIES
+                )
+            if requeue and not fits(0.0):
+                requeue = False
+                DEADLINE_DROPPED.inc("retry")
+            STUCK_ATTEMPTS.inc(stage)
+            self.logger.warning(
+                "%s stuck in %s for %.1fs (deadline %.0fs); %s",
+                user.username,
+                stage,
+                elapsed,
+                stage_deadline,
+                "requeued" if requeue else "giving up",
+            )
+            result.tail_events.append(
+                {
+                    "user_name": user.username,
+                    "client_id": user.client_id,
+                    "stage": stage,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "deadline_seconds": stage_deadline,
+                    "action": "requeued" if requeue else "failed",
+                    "at": datetime.now().isoformat(),
+                }
+            )
 
-                    # Rate limiting - small delay between requests
-                    if i < len(users):
-                        time.sleep(self.settings.RATE_LIMIT_DELAY)
-
-                except Exception as e:
-                    self.logger.error(f"Error processing {user.username}: {e}")
-                    # Create failed application
-                    application = IPOApplication(
-                        user_id=str(user.client_id),
-                        user_name=user.username,
-                        company_id=company_id,
-                        kitta_amount=kitta_amount,
+            if requeue:
+                # A fresh login gives the retry its own token, so it does not
+                # coalesce onto the stuck worker's in-flight request
+                self.sessions.invalidate(user)
+                scheduler.put(user, FairScheduler.RETRY)
+                self.events.emit(
+                    EventType.RETRYING,
+                    user.username,
+                    message=f"Stuck in {stage} stage",
+                )
+            else:
+                application = previous.pop(user.username, None) or IPOApplication(
+                    user_id=str(user.client_id),
+                    user_name=user.username,
+                    company_id=company_id,
+                    kitta_amount=kitta_amount,
+                )
+                if in_apply:
+                    application.mark_failed(
+                        f"Timed out in apply stage after {elapsed:.0f}s: "
+                        "status unknown, verify with 'reconcile'"
+                    )
+                else:
+                    application.mark_failed(
+                        f"Timed out: stuck in {stage} stage for {elapsed:.0f}s"
                     )
-                    application.mark_failed(str(e))
-                    result.add_application(application)
+                result.add_application(application)
+                self._emit_outcome(application)
+
+            with lock:
+                # Replace the stuck thread before releasing its slot, so
+                # the run cannot look finished in between
+                abandoned.add(attempt.thread)
+                spawn()
+            WORKERS_BUSY.dec()
+            scheduler.done(user)
+
+        def on_event(event) -> None:
+            if event.type == EventType.STAGE_DONE:
+                watchdog.stage_done(event.user_name, event.stage)
+
+        watchdog = None
+        if self.settings.WATCHDOG:
+            watchdog = Watchdog(
+                self.settings.stage_deadlines,
+                on_stuck,
+                self.settings.WATCHDOG_INTERVAL,
+            )
+            self.events.subscribe(on_event)
+            watchdog.start()
 
-        result.mark_completed()
-        return result
+        WORKERS.inc(amount=workers)
+        try:
+            with lock:
+                for _ in range(workers):
+                    spawn()
+            # Abandoned threads are not waited for; they exit on their own
+            # once their request returns or times out
+            while True:
+                with lock:
+                    live = [
+                        thread
+                        for thread in threads
+                        if thread.is_alive() and thread not in abandoned
+                    ]
+                if not live:
+                    break
+                live[0].join(0.5)
+            if errors:
+                raise errors[0]
+        except BaseException:
+            scheduler.cancel()
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.stop()
+                self.events.unsubscribe(on_event)
+            WORKERS.dec(amount=workers)
+
+    def _run_attempt(
+        self,
+        user: User,
+        company_id: int,
+        kitta_amount: int,
+        before_apply: Optional[Callable[[], bool]] = None,
+    ) -> IPOApplication:
+        """Run one attempt of the chain, turning unexpected errors into failures"""
+        try:
+            return self._apply_ipo_for_user(
+                user, company_id, kitta_amount, before_apply
+            )
+        except Exception as e:
+            self.logger.error("Error processing %s: %s", user.username, e)
+            application = IPOApplication(
+                user_id=str(user.client_id),
+                user_name=user.username,
+                company_id=company_id,
+                kitta_amount=kitta_amount,
+            )
+            application.mark_failed(str(e))
+            application.increment_attempts()
+            return application
+
+    def _retry_delay(self, attempts: int) -> float:
+        """Backoff before the next attempt of an account"""
+        if self.settings.EXPONENTIAL_BACKOFF:
+            return self.settings.RETRY_DELAY * (2 ** (attempts - 1))
+        return self.settings.RETRY_DELAY
+
+    def _emit_outcome(self, application: IPOApplication) -> None:
+        """Publish the final outcome of an application"""
+        APPLICATIONS.inc(
+            application.status,
+            (application.error_message.split(":")[0] if application.is_failed else ""),
+        )
+        if application.is_successful:
+            self.events.emit(EventType.SUCCEEDED, application.user_name)
+        else:
+            self.events.emit(
+                EventType.FAILED,
+                application.user_name,
+                message=application.error_message,
+            )
+
+    def apply_for_user(
+        self,
+        user: User,
+        company_id: int,
+        kitta_amount: int,
+        before_apply: Optional[Callable[[], bool]] = None,
+    ) -> IPOApplication:
+        """Apply IPO for a single user outside of a bulk run"""
+        return self._apply_ipo_for_user(user, company_id, kitta_amount, before_apply)
 
     def _apply_ipo_for_user(
-        self, user: User, company_id: int, kitta_amount: int
+        self,
+        user: User,
+        company_id: int,
+        kitta_amount: int,
+        before_apply: Optional[Callable[[], bool]] = None,
     ) -> IPOApplication:
         """
         Apply IPO for a single user
@@ -105,6 +662,8 @@ class ApplicationService:
             user: User object
             company_id: Company ID
             kitta_amount: Number of kittas
+            before_apply: Optional guard called right before the apply
+                request; returning False aborts the application
 
         Returns:
             IPOApplication with result
@@ -116,61 +675,109 @@ class ApplicationService:
             kitta_amount=kitta_amount,
         )
 
-        try:
-            # Authenticate user
-            token = self.client.authenticate(user)
-            if not token:
-                application.mark_failed("Authentication failed")
-                return application
-
-            # Get personal details
-            personal_details = self.client.get_personal_details(token)
-            if not personal_details:
-                application.mark_failed("Failed to get personal details")
-                return application
-
-            # Get client BOID details
-            client_boid = self.client.get_client_boid_details(
-                token, personal_details["demat"]
-            )
-            if not client_boid:
-                application.mark_failed("Failed to get client BOID details")
-                return application
-
-            # Get bank details
-            bank_details = self.client.get_bank_details(token, client_boid["bankCode"])
-
-            # Prepare application data
-            application_data = self._prepare_application_data(
-                user,
-                personal_details,
-                client_boid,
-                bank_details,
-                company_id,
-                kitta_amount,
-                token,
-            )
+        self.events.emit(EventType.STARTED, user.username)
+        started = time.perf_counter()
 
-            if not application_data:
-                application.mark_failed("Failed to prepare application data")
-                return application
+        with account_scope(user.username):
+            try:
+                prepared = self._prepare_for_user(
+                    user, company_id, kitta_amount, application
+                )
+                if prepared is None:
+                    return application
 
-            # Apply IPO
-            result = self.client.apply_ipo(token, application_data)
+                if before_apply is not None and not before_apply():
+                    application.mark_failed("Apply aborted: claim lost before apply")
+                    return application
 
-            if result:
-                application.mark_success()
-                self.logger.info(f"Successfully applied IPO for {user.username}")
-            else:
-                application.mark_failed("IPO application failed")
+                self._submit_application(user, application, *prepared)
 
-        except Exception as e:
-            application.mark_failed(str(e))
-            self.logger.error(f"Error applying IPO for {user.username}: {e}")
+            except Exception as e:
+                application.mark_failed(str(e))
+                self.logger.error("Error applying IPO for %s: %s", user.username, e)
+            finally:
+                application.duration_seconds += time.perf_counter() - started
+                if not application.is_successful:
+                    # The cached token may be what failed; start fresh next time
+                    self.sessions.invalidate(user)
 
         application.increment_attempts()
         return application
 
+    def _prepare_for_user(
+        self,
+        user: User,
+        company_id: int,
+        kitta_amount: int,
+        application: IPOApplication,
+    ) -> Optional[Tuple[str, Dict]]:
+        """
+        Run the chain up to the apply request
+
+        Returns:
+            Tuple of (token, application data), or None after marking the
+            application failed
+        """
+        # Authenticate user (reuses a cached token when available)
+        token = self.sessions.authenticate(user)
+        if not token:
+            application.mark_failed("Authentication failed")
+            return None
+        self._stage_done(user, ApplicationStage.AUTH)
+
+        # Get personal details
+        personal_details = self.sessions.get_personal_details(user, token)
+        if not personal_details:
+            application.mark_failed("Failed to get personal details")
+            return None
+        self._stage_done(user, ApplicationStage.PROFILE)
+
+        # Get client BOID details
+        client_boid = self.sessions.get_client_boid_details(
+            user, token, personal_details["demat"]
+        )
+        if not client_boid:
+            application.mark_failed("Failed to get client BOID details")
+            return None
+        self._stage_done(user, ApplicationStage.BOID)
+
+        # Get bank details
+        bank_details = self.client.get_bank_details(token, client_boid["bankCode"])
+        self._stage_done(user, ApplicationStage.BANK)
+
+        # Prepare application data
+        application_data = self._prepare_application_data(
+            user,
+            personal_details,
+            client_boid,
+            bank_details,
+            company_id,
+            kitta_amount,
+            token,
+        )
+
+        if not application_data:
+            application.mark_failed("Failed to prepare application data")
+            return None
+        self._stage_done(user, ApplicationStage.PREPARE)
+        return token, application_data
+
+    def _submit_application(
+        self, user: User, application: IPOApplication, token: str, data: Dict
+    ) -> None:
+        """Send the apply request and record its outcome"""
+        result = self.client.apply_ipo(token, data)
+
+        if result:
+            application.mark_success()
+            self.logger.info("Successfully applied IPO for %s", user.username)
+        else:
+            application.mark_failed("IPO application failed")
+
+    def _stage_done(self, user: User, stage: str) -> None:
+        """Publish completion of one stage of the application chain"""
+        self.events.emit(EventType.STAGE_DONE, user.username, stage=stage)
+
     def _prepare_application_data(
         self,
         user: User,
@@ -223,23 +830,17 @@ class ApplicationService:
                 elif isinstance(bank_info, dict):
                     bank_id = bank_info["id"]
                 else:
-                    self.logger.error(f"Unexpected bank info format: {bank_info}")
+                    self.logger.error("Unexpected bank info format: %s", bank_info)
                     return None
 
                 # Get customer code
-                customer_code = self.client._make_authenticated_request(
-                    endpoint=f"/meroShare/bank/{bank_id}/", token=token, method="GET"
-                )
+                customer_code = self.client.get_bank_detail(token, bank_id)
 
                 if not customer_code:
                     self.logger.error("Failed to get customer code")
                     return None
 
-                customer_id = (
-                    customer_code["id"]
-                    if isinstance(customer_code, dict)
-                    else customer_code[0]["id"]
-                )
+                customer_id = customer_code["id"]
 
                 # Handle branch info
                 branch_info = bank_details["branch"]
@@ -266,7 +867,7 @@ class ApplicationService:
             return data
 
         except Exception as e:
-            self.logger.error(f"Error preparing application data: {e}")
+            self.logger.error("Error preparing application data: %s", e)
             return None
 
     def retry_failed_applications(
@@ -305,6 +906,7 @@ class ApplicationService:
             # Find the user object (this would need to be passed or stored)
             # For now, we'll just mark as retrying
             app.mark_retrying()
+            self.events.emit(EventType.RETRYING, app.user_name)
 
             time.sleep(self.settings.RETRY_DELAY)
 
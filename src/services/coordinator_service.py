@@ -0,0 +1,264 @@
+"""
+Coordinator service for distributing applications across worker processes
+"""
+
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+from ..models.user import User
+from ..models.ipo_application import IPOApplication
+from ..models.application_result import ApplicationResult
+from ..storage.work_queue import WorkQueue, QueueTask
+from ..config.settings import get_settings
+from ..config.constants import TaskState, UIConstants
+from .application_service import ApplicationService
+
+
+class CoordinatorService:
+    """Service for queue-based bulk applications across several workers"""
+
+    def __init__(self, queue_path: Optional[str] = None):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.queue_path = (
+            Path(queue_path) if queue_path is not None else self.settings.queue_path
+        )
+
+    def enqueue(self, users: List[User], company_id: int, kitta_amount: int) -> int:
+        """
+        Queue one task per account for an issue
+
+        Args:
+            users: Accounts to apply for
+            company_id: Company share ID
+            kitta_amount: Number of kittas per account
+
+        Returns:
+            Number of newly queued tasks
+        """
+        queue = WorkQueue(self.queue_path)
+        try:
+            added = queue.enqueue(users, company_id, kitta_amount)
+        finally:
+            queue.close()
+
+        self.logger.info(
+            "Queued %s of %s tasks for company %s", added, len(users), company_id
+        )
+        return added
+
+    def run_worker(self, users: List[User]) -> int:
+        """
+        Lease and process tasks until the queue is drained
+
+        Args:
+            users: Accounts this worker holds credentials for
+
+        Returns:
+            Number of tasks completed by this worker
+        """
+        queue = WorkQueue(self.queue_path)
+        accounts = {(user.client_id, user.username): user for user in users}
+        application_service = ApplicationService()
+        owner_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        lease_timeout = self.settings.LEASE_TIMEOUT
+
+        # Tasks being worked on, keyed by slot; their leases are renewed
+        # until the slot records a result so a slow apply never expires
+        held = {}
+        held_lock = threading.Lock()
+        stopped = threading.Event()
+
+        def renew_leases() -> None:
+            while not stopped.wait(lease_timeout / 3):
+                with held_lock:
+                    tasks = list(held.values())
+                if tasks:
+                    queue.renew(tasks, lease_timeout)
+
+        def worker_loop(slot: int) -> int:
+            owner = f"{owner_prefix}:{slot}"
+            completed = 0
+
+            while True:
+                task = queue.lease(owner, lease_timeout)
+                if task is None:
+                    queue.fail_abandoned(grace_period=lease_timeout)
+                    if queue.is_drained():
+                        return completed
+                    time.sleep(self.settings.WORKER_POLL_INTERVAL)
+                    continue
+
+                with held_lock:
+                    held[slot] = task
+                try:
+                    if self._process_task(queue, task, accounts, application_service):
+                        completed += 1
+                finally:
+                    with held_lock:
+                        del held[slot]
+
+                time.sleep(self.settings.RATE_LIMIT_DELAY)
+
+        renewer = threading.Thread(
+            target=renew_leases, name="lease-renewer", daemon=True
+        )
+        renewer.start()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.settings.MAX_CONCURRENT_REQUESTS
+            ) as executor:
+                futures = [
+                    executor.submit(worker_loop, slot)
+                    for slot in range(self.settings.MAX_CONCURRENT_REQUESTS)
+                ]
+                completed = sum(future.result() for future in futures)
+        finally:
+            stopped.set()
+            renewer.join()
+            queue.close()
+
+        self.logger.info("Worker %s completed %s tasks", owner_prefix, completed)
+        return completed
+
+    def _process_task(
+        self,
+        queue: WorkQueue,
+        task: QueueTask,
+        accounts: dict,
+        application_service: ApplicationService,
+    ) -> bool:
+        """Run the application for a leased task and record its outcome"""
+        user = accounts.get(task.account_key)
+
+        if user is None:
+            application = IPOApplication(
+                user_id=str(task.client_id),
+                user_name=task.username,
+                company_id=task.company_id,
+                kitta_amount=task.kitta_amount,
+            )
+            application.mark_failed("Account not found in worker accounts file")
+            return queue.complete(task, application)
+
+        claims = []
+
+        def claim_apply() -> bool:
+            claims.append(queue.begin_apply(task, self.settings.LEASE_TIMEOUT))
+            return claims[-1]
+
+        application = application_service.apply_for_user(
+            user, task.company_id, task.kitta_amount, before_apply=claim_apply
+        )
+
+        if claims == [False]:
+            # Lease expired mid-chain; the task is left for another worker
+            self.logger.warning("Lease lost for %s, task released", task.username)
+            return False
+
+        if not queue.complete(task, application):
+            self.logger.warning("Could not record result for %s", task.username)
+            return False
+
+        return True
+
+    def start_local_workers(
+        self, count: int, accounts_file: Optional[str] = None
+    ) -> List[multiprocessing.Process]:
+        """
+        Start worker processes on this machine
+
+        Args:
+            count: Number of worker processes
+            accounts_file: Accounts file the workers load credentials from
+
+        Returns:
+            List of started processes
+        """
+        context = multiprocessing.get_context("spawn")
+        processes = []
+
+        for _ in range(count):
+            process = context.Process(
+                target=run_worker_process,
+                args=(str(self.queue_path), accounts_file),
+                daemon=False,
+            )
+            process.start()
+            processes.append(process)
+
+        self.logger.info("Started %s local worker processes", count)
+        return processes
+
+    def wait_for_completion(
+        self,
+        company_id: int,
+        processes: Optional[List[multiprocessing.Process]] = None,
+    ) -> ApplicationResult:
+        """
+        Wait until the queue is drained and merge all worker results
+
+        Args:
+            company_id: Company share ID to collect results for
+            processes: Local worker processes to supervise, if any
+
+        Returns:
+            Merged ApplicationResult
+        """
+        processes = processes or []
+        queue = WorkQueue(self.queue_path)
+        last_counts = None
+
+        try:
+            while True:
+                counts = queue.counts(company_id)
+                if counts != last_counts:
+                    print(
+                        f"{UIConstants.PENDING_EMOJI} queued={counts[TaskState.QUEUED]} "
+                        f"leased={counts[TaskState.LEASED]} "
+                        f"applying={counts[TaskState.APPLYING]} "
+                        f"done={counts[TaskState.DONE]}"
+                    )
+                    last_counts = counts
+
+                if queue.is_drained(company_id):
+                    break
+
+                if processes and not any(p.is_alive() for p in processes):
+                    abandoned = queue.fail_abandoned()
+                    if abandoned:
+                        self.logger.warning(
+                            "%s tasks were lost during apply and need manual checks",
+                            abandoned,
+                        )
+                    if not queue.is_drained(company_id):
+                        self.logger.warning(
+                            "All local workers exited before the queue was drained"
+                        )
+                    break
+
+                time.sleep(self.settings.WORKER_POLL_INTERVAL)
+
+            for process in processes:
+                process.join()
+
+            return queue.collect_result(company_id)
+        finally:
+            queue.close()
+
+
+def run_worker_process(queue_path: str, accounts_file: Optional[str] = None) -> None:
+    """Entry point for a spawned local worker process"""
+    from ..utils.logger import setup_logging
+    from .account_service import AccountService
+
+    setup_logging()
+    users = AccountService().load_accounts(accounts_file)
+    CoordinatorService(queue_path).run_worker(users)
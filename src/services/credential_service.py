@@ -0,0 +1,108 @@
+"""
+Credential service that checks every account can log in
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import logging
+
+from ..models.user import User
+from ..api.meroshare_client import MeroShareClient
+from ..api.client_registry import get_client
+from ..config.settings import get_settings
+from ..config.constants import HTTPStatus
+from ..utils.transfer_stats import account_scope
+from .session_service import AccountSessionService
+
+
+class CredentialService:
+    """Service for verifying account credentials in bulk"""
+
+    OK = "ok"
+    REJECTED = "rejected"
+    QUARANTINED = "quarantined"
+    ERROR = "error"
+
+    def __init__(
+        self,
+        client: Optional[MeroShareClient] = None,
+        sessions: Optional[AccountSessionService] = None,
+    ):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.client = client or get_client()
+        self.sessions = sessions or AccountSessionService(self.client)
+
+    def verify_all(
+        self, users: List[User], include_quarantined: bool = False
+    ) -> List[Dict]:
+        """
+        Log every account in concurrently and record the outcomes
+
+        Quarantined accounts whose accounts.txt line is unchanged are not
+        tried again unless include_quarantined is set, so a bad password
+        cannot lock the account.
+
+        Args:
+            users: Accounts to verify
+            include_quarantined: Also try quarantined accounts
+
+        Returns:
+            List of dictionaries with user_name, client_id, status,
+            http_status and failure_streak, in input order
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.settings.VERIFY_CONCURRENCY
+        ) as executor:
+            checks = list(
+                executor.map(lambda user: self.verify(user, include_quarantined), users)
+            )
+
+        self.logger.info(
+            "Verified %s accounts: %s ok",
+            len(checks),
+            sum(1 for check in checks if check["status"] == self.OK),
+        )
+        return checks
+
+    def verify(self, user: User, include_quarantined: bool = False) -> Dict:
+        """Log one account in, bypassing the token cache"""
+        health = self.sessions.health
+        check = {
+            "user_name": user.username,
+            "client_id": user.client_id,
+            "status": self.QUARANTINED,
+            "http_status": None,
+            "failure_streak": 0,
+        }
+
+        if health is not None and health.is_quarantined(user):
+            check["failure_streak"] = health.get(user)["failure_streak"]
+            if not include_quarantined:
+                return check
+
+        try:
+            with account_scope(user.username):
+                token, status = self.sessions.login(user)
+                details = token and self.sessions.get_personal_details(user, token)
+            if token and not details:
+                # Logged in but the session is unusable
+                token = None
+            check["http_status"] = status
+            if token:
+                check["status"] = self.OK
+            elif status in HTTPStatus.AUTH_HARD_FAILURES:
+                check["status"] = self.REJECTED
+            else:
+                check["status"] = self.ERROR
+        except Exception as e:
+            self.logger.error("Error verifying %s: %s", user.username, e)
+            check["status"] = self.ERROR
+
+        if health is not None:
+            record = health.get(user)
+            if record is not None:
+                check["failure_streak"] = record["failure_streak"]
+                if record["quarantined"]:
+                    check["status"] = self.QUARANTINED
+        return check
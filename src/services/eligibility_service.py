@@ -0,0 +1,194 @@
+"""
+Eligibility service that prefilters accounts using share criteria
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from ..models.user import User
+from ..api.meroshare_client import MeroShareClient
+from ..config.settings import get_settings
+from ..config.constants import EligibilityStatus
+from ..utils.deadline import current_deadline, deadline_scope
+from ..utils.fair_scheduler import FairScheduler
+from ..utils.transfer_stats import account_scope
+from .session_service import AccountSessionService
+
+
+@dataclass
+class EligibilityResult:
+    """Outcome of a share criteria check for one account"""
+
+    eligible: Optional[bool]
+    reason: str = ""
+
+    @property
+    def is_ineligible(self) -> bool:
+        """Only an explicit negative answer excludes an account"""
+        return self.eligible is False
+
+
+class EligibilityService:
+    """Service for checking account eligibility before bulk submission"""
+
+    def __init__(
+        self,
+        client: MeroShareClient,
+        sessions: Optional[AccountSessionService] = None,
+    ):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.sessions = sessions or AccountSessionService(client)
+
+        self._lock = threading.Lock()
+        self._cache: Dict[Tuple[str, int], Tuple[float, EligibilityResult]] = {}
+        self._pruned_at = time.monotonic()
+
+    def partition(
+        self, users: List[User], company_id: int
+    ) -> Tuple[List[User], List[Tuple[User, str]]]:
+        """
+        Split accounts into those to apply for and those to skip
+
+        Checks run concurrently and reuse cached tokens and profiles, so the
+        apply chain does not repeat them. They are paced like the bulk run:
+        served round-robin across DPs, capped at DP_MAX_CONCURRENT each and
+        spaced by RATE_LIMIT_DELAY, so the logins do not arrive as a burst
+        ahead of it. Accounts whose check fails for any other reason
+        (network, auth) are kept.
+
+        Args:
+            users: Accounts to check
+            company_id: Company share ID
+
+        Returns:
+            Tuple of (eligible users, [(ineligible user, reason)])
+        """
+        deadline = current_deadline()
+        scheduler = FairScheduler(
+            key=lambda entry: entry[1].client_id,
+            per_key_limit=self.settings.DP_MAX_CONCURRENT,
+            min_interval=self.settings.RATE_LIMIT_DELAY,
+        )
+        for entry in enumerate(users):
+            scheduler.put(entry)
+        results: Dict[int, EligibilityResult] = {}
+
+        def worker() -> None:
+            while True:
+                entry = scheduler.get()
+                if entry is None:
+                    return
+                index, user = entry
+                try:
+                    with deadline_scope(deadline), account_scope(user.username):
+                        results[index] = self.check(user, company_id)
+                finally:
+                    scheduler.done(entry)
+
+        workers = min(self.settings.MAX_CONCURRENT_REQUESTS, len(users))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+
+        eligible, ineligible = [], []
+        for index, user in enumerate(users):
+            result = results[index]
+            if result.is_ineligible:
+                ineligible.append((user, result.reason))
+            else:
+                eligible.append(user)
+
+        self.logger.info(
+            "Eligibility prefilter: %s eligible, %s skipped for company %s",
+            len(eligible),
+            len(ineligible),
+            company_id,
+        )
+        return eligible, ineligible
+
+    def check(self, user: User, company_id: int) -> EligibilityResult:
+        """
+        Check whether one account can apply for an issue
+
+        Args:
+            user: User object
+            company_id: Company share ID
+
+        Returns:
+            EligibilityResult (eligible is None when the check could not run)
+        """
+        try:
+            token = self.sessions.authenticate(user)
+            if not token:
+                return EligibilityResult(None, "Authentication failed")
+
+            personal_details = self.sessions.get_personal_details(user, token)
+            if not personal_details:
+                return EligibilityResult(None, "Failed to get personal details")
+
+            demat = personal_details["demat"]
+            cached = self._get_cached(demat, company_id)
+            if cached is not None:
+                return cached
+
+            criteria = self.client.get_share_criteria(token, demat, company_id)
+            if criteria is None:
+                return EligibilityResult(None, "Share criteria unavailable")
+
+            result = self._evaluate(criteria)
+            self._set_cached(demat, company_id, result)
+            return result
+
+        except Exception as e:
+            self.logger.error("Error checking eligibility for %s: %s", user.username, e)
+            return EligibilityResult(None, str(e))
+
+    @staticmethod
+    def _evaluate(criteria) -> EligibilityResult:
+        """Interpret a share criteria response"""
+        if isinstance(criteria, list):
+            criteria = criteria[0] if criteria else {}
+        if not isinstance(criteria, dict):
+            return EligibilityResult(True)
+
+        message = criteria.get("message", "")
+        if criteria.get("eligible") is False:
+            return EligibilityResult(False, message or "Not eligible")
+
+        status = str(criteria.get("status", "")).upper()
+        if status in EligibilityStatus.INELIGIBLE:
+            return EligibilityResult(False, message or status)
+
+        return EligibilityResult(True, message)
+
+    def _get_cached(self, demat: str, company_id: int) -> Optional[EligibilityResult]:
+        with self._lock:
+            entry = self._cache.get((demat, company_id))
+        if entry is None:
+            return None
+        checked_at, result = entry
+        if time.monotonic() - checked_at >= self.settings.ELIGIBILITY_TTL:
+            return None
+        return result
+
+    def _set_cached(
+        self, demat: str, company_id: int, result: EligibilityResult
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._cache[(demat, company_id)] = (now, result)
+            # Every issue adds an entry per account; drop expired ones about
+            # once per TTL so a long-running watcher does not keep them all
+            if now - self._pruned_at >= self.settings.ELIGIBILITY_TTL:
+                self._cache = {
+                    key: entry
+                    for key, entry in self._cache.items()
+                    if now - entry[0] < self.settings.ELIGIBILITY_TTL
+                }
+                self._pruned_at = now
@@ -7,14 +7,18 @@ import logging
 
 from ..models.user import User
 from ..api.meroshare_client import MeroShareClient
+from ..api.client_registry import get_client
+from ..utils.deadline import Deadline
+from .issue_catalog_service import IssueCatalogService
 
 
 class IPOService:
     """Service for IPO-related operations"""
 
-    def __init__(self):
+    def __init__(self, client: Optional[MeroShareClient] = None):
         self.logger = logging.getLogger(__name__)
-        self.client = MeroShareClient()
+        self.client = client or get_client()
+        self.catalog = IssueCatalogService(self.client)
 
     def get_available_ipos(self, user: User) -> List[Dict]:
         """
@@ -26,21 +30,22 @@ class IPOService:
         Returns:
             List of available IPO dictionaries
         """
-        try:
-            token = self.client.authenticate(user)
-            if not token:
-                self.logger.error(f"Failed to authenticate user {user.username}")
-                return []
+        return self.get_available_ipos_for_accounts([user])
 
-            ipos = self.client.get_applicable_ipos(token)
-            if ipos and "object" in ipos:
-                return ipos["object"]
+    def get_available_ipos_for_accounts(
+        self, users: List[User], force_refresh: bool = False
+    ) -> List[Dict]:
+        """
+        Get available IPOs across a set of accounts
 
-            return []
+        Args:
+            users: Accounts to probe (a sample is used, see CATALOG_PROBE_ACCOUNTS)
+            force_refresh: Bypass the cached issue catalog
 
-        except Exception as e:
-            self.logger.error(f"Error getting IPOs for {user.username}: {e}")
-            return []
+        Returns:
+            List of available IPO dictionaries
+        """
+        return self.catalog.get_catalog(users, force_refresh=force_refresh)
 
     def get_ipo_details(self, user: User, company_id: int) -> Optional[Dict]:
         """
@@ -53,13 +58,7 @@ class IPOService:
         Returns:
             IPO details dictionary or None
         """
-        available_ipos = self.get_available_ipos(user)
-
-        for ipo in available_ipos:
-            if ipo.get("companyShareId") == company_id:
-                return ipo
-
-        return None
+        return self.catalog.get_by_id([user], company_id)
 
     def format_ipo_for_display(self, ipo: Dict) -> Dict:
         """
@@ -82,6 +81,10 @@ class IPOService:
             "issue_close_date": ipo.get("issueCloseDate", ""),
         }
 
+    def close_deadline(self, ipo: Dict) -> Optional[Deadline]:
+        """Deadline at the IPO's closing time, if known"""
+        return self.catalog.close_deadline(ipo)
+
     def validate_kitta_amount(self, ipo: Dict, kitta_amount: int) -> bool:
         """
         Validate kitta amount against IPO limits
@@ -97,11 +100,15 @@ class IPOService:
         max_unit = ipo.get("maxUnit", float("inf"))
 
         if kitta_amount < min_unit:
-            self.logger.warning(f"Kitta amount {kitta_amount} below minimum {min_unit}")
+            self.logger.warning(
+                "Kitta amount %s below minimum %s", kitta_amount, min_unit
+            )
             return False
 
         if kitta_amount > max_unit:
-            self.logger.warning(f"Kitta amount {kitta_amount} above maximum {max_unit}")
+            self.logger.warning(
+                "Kitta amount %s above maximum %s", kitta_amount, max_unit
+            )
             return False
 
         return True
@@ -0,0 +1,214 @@
+"""
+Issue catalog service with paged discovery and a TTL cache
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import logging
+
+from ..models.user import User
+from ..api.meroshare_client import MeroShareClient
+from ..api.client_registry import get_client
+from ..config.settings import get_settings
+from ..utils.deadline import Deadline
+from .session_service import AccountSessionService
+
+# Issue dates are the backend's wall-clock time in Nepal, which has been
+# UTC+05:45 without daylight saving since 1986; the fixed offset covers
+# systems without a time zone database
+try:
+    SERVER_TIMEZONE = ZoneInfo("Asia/Kathmandu")
+except ZoneInfoNotFoundError:
+    SERVER_TIMEZONE = timezone(timedelta(hours=5, minutes=45))
+
+
+class IssueCatalogService:
+    """Service for discovering and caching applicable issues"""
+
+    # issueCloseDate formats, and whether the value is a bare date
+    CLOSE_DATE_FORMATS = (
+        ("%b %d, %Y %I:%M:%S %p", False),
+        ("%Y-%m-%d %H:%M:%S", False),
+        ("%Y-%m-%dT%H:%M:%S", False),
+        ("%Y-%m-%d", True),
+    )
+
+    def __init__(
+        self,
+        client: Optional[MeroShareClient] = None,
+        sessions: Optional[AccountSessionService] = None,
+    ):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.client = client or get_client()
+        self.sessions = sessions or AccountSessionService(self.client)
+
+        self._lock = threading.Lock()
+        self._issues: List[Dict] = []
+        self._by_id: Dict[int, Dict] = {}
+        self._by_scrip: Dict[str, Dict] = {}
+        self._fetched_at: Optional[float] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Check whether the cached catalog is within its TTL"""
+        return (
+            self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self.settings.CATALOG_TTL
+        )
+
+    def get_catalog(self, users: List[User], force_refresh: bool = False) -> List[Dict]:
+        """
+        Get all applicable issues, refreshing the cache when stale
+
+        Args:
+            users: Accounts that may be used to probe the backend
+            force_refresh: Ignore the cached catalog
+
+        Returns:
+            List of issue dictionaries, deduplicated by companyShareId
+        """
+        if not force_refresh and self.is_fresh:
+            return list(self._issues)
+
+        with self._lock:
+            # Another thread may have refreshed while we waited
+            if not force_refresh and self.is_fresh:
+                return list(self._issues)
+
+            issues = self._discover(users, fresh=force_refresh)
+            if issues is not None:
+                self._store(issues)
+
+            return list(self._issues)
+
+    def get_by_id(self, users: List[User], company_id: int) -> Optional[Dict]:
+        """Look up an issue by companyShareId"""
+        self.get_catalog(users)
+        return self._by_id.get(company_id)
+
+    def get_by_scrip(self, users: List[User], scrip: str) -> Optional[Dict]:
+        """Look up an issue by scrip symbol"""
+        self.get_catalog(users)
+        return self._by_scrip.get(scrip.upper())
+
+    @staticmethod
+    def close_deadline(issue: Dict) -> Optional[Deadline]:
+        """
+        Deadline at the issue's closing time, if issueCloseDate parses
+
+        The value is read as Nepal time whatever this host's time zone is;
+        a bare date is taken as the end of that day.
+        """
+        value = str(issue.get("issueCloseDate") or "").strip()
+        for fmt, end_of_day in IssueCatalogService.CLOSE_DATE_FORMATS:
+            try:
+                closes = datetime.strptime(value, fmt).replace(tzinfo=SERVER_TIMEZONE)
+            except ValueError:
+                continue
+            if end_of_day:
+                closes += timedelta(days=1)
+            return Deadline.at(closes.timestamp())
+        return None
+
+    def invalidate(self) -> None:
+        """Drop the cached catalog"""
+        with self._lock:
+            self._fetched_at = None
+
+    def _store(self, issues: List[Dict]) -> None:
+        """Replace the cached catalog and rebuild its indexes"""
+        self._issues = issues
+        self._by_id = {issue["companyShareId"]: issue for issue in issues}
+        self._by_scrip = {
+            issue["scrip"].upper(): issue for issue in issues if issue.get("scrip")
+        }
+        self._fetched_at = time.monotonic()
+
+    def _discover(self, users: List[User], fresh: bool = False) -> Optional[List[Dict]]:
+        """Probe a sample of accounts in parallel and merge their issues"""
+        sample = self._select_probe_accounts(users)
+        if not sample:
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(sample)) as executor:
+            probes = list(
+                executor.map(lambda user: self._probe_account(user, fresh), sample)
+            )
+
+        if all(probe is None for probe in probes):
+            self.logger.error("Issue discovery failed for all probed accounts")
+            return None
+
+        merged: Dict[int, Dict] = {}
+        for probe in probes:
+            for issue in probe or []:
+                merged.setdefault(issue["companyShareId"], issue)
+
+        self.logger.info(
+            "Discovered %s applicable issues from %s accounts",
+            len(merged),
+            len(sample),
+        )
+        return list(merged.values())
+
+    def _select_probe_accounts(self, users: List[User]) -> List[User]:
+        """Pick probe accounts, spreading the sample across DPs first"""
+        limit = self.settings.CATALOG_PROBE_ACCOUNTS
+        sample: List[User] = []
+        seen_clients = set()
+
+        for user in users:
+            if user.client_id not in seen_clients:
+                seen_clients.add(user.client_id)
+                sample.append(user)
+                if len(sample) == limit:
+                    return sample
+
+        for user in users:
+            if user not in sample:
+                sample.append(user)
+                if len(sample) == limit:
+                    break
+
+        return sample
+
+    def _probe_account(self, user: User, fresh: bool = False) -> Optional[List[Dict]]:
+        """Fetch every page of applicable issues for one account"""
+        try:
+            token = self.sessions.authenticate(user)
+            if not token:
+                self.logger.error("Failed to authenticate user %s", user.username)
+                return None
+
+            issues: List[Dict] = []
+            page = 1
+            size = self.settings.CATALOG_PAGE_SIZE
+
+            while True:
+                response = self.client.get_applicable_ipos(
+                    token, page=page, size=size, use_cache=not fresh
+                )
+                if not response or "object" not in response:
+                    if page == 1:
+                        # Possibly a stale cached token; log in again next time
+                        self.sessions.invalidate(user)
+                        return None
+                    return issues
+
+                batch = response["object"]
+                issues.extend(batch)
+
+                total = response.get("totalCount", len(issues))
+                if len(batch) < size or len(issues) >= total:
+                    return issues
+
+                page += 1
+
+        except Exception as e:
+            self.logger.error("Error getting IPOs for %s: %s", user.username, e)
+            return None
@@ -0,0 +1,167 @@
+"""
+Reconciliation service that verifies applications against MeroShare
+"""
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import logging
+
+from ..models.user import User
+from ..models.ipo_application import IPOApplication
+from ..models.application_result import ApplicationResult
+from ..api.meroshare_client import MeroShareClient
+from ..api.client_registry import get_client
+from ..config.settings import get_settings
+from ..config.constants import ApplicantFormStatus
+from ..utils.transfer_stats import account_scope
+from .session_service import AccountSessionService
+
+
+class ReconciliationService:
+    """Service for sweeping applied-issue reports after a run"""
+
+    def __init__(
+        self,
+        client: Optional[MeroShareClient] = None,
+        sessions: Optional[AccountSessionService] = None,
+    ):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.client = client or get_client()
+        self.sessions = sessions or AccountSessionService(self.client)
+
+    def reconcile(self, result: ApplicationResult, users: List[User]) -> Dict[str, int]:
+        """
+        Verify every application in a result against the account's report
+
+        Reports are fetched concurrently, one sweep per account, reusing
+        cached tokens. Applications are updated in place: anything the
+        report shows as applied becomes successful (covering timeouts and
+        409 responses), anything missing or rejected becomes failed, and
+        disagreements with the recorded outcome are flagged as mismatches.
+        Accounts whose report cannot be fetched are left untouched.
+
+        Args:
+            result: ApplicationResult to verify
+            users: Accounts the applications belong to
+
+        Returns:
+            Dictionary with verified, mismatched and unverified counts
+        """
+        by_account: Dict[str, List[IPOApplication]] = defaultdict(list)
+        for application in result.applications:
+            by_account[application.user_name].append(application)
+
+        users_by_name = {user.username: user for user in users}
+        accounts = [
+            (users_by_name[name], applications)
+            for name, applications in by_account.items()
+            if name in users_by_name
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=self.settings.RECONCILE_CONCURRENCY
+        ) as executor:
+            list(executor.map(lambda item: self._reconcile_account(*item), accounts))
+
+        summary = {
+            "verified": len([app for app in result.applications if app.verified]),
+            "mismatched": len(result.mismatched_applications),
+        }
+        summary["unverified"] = result.total_accounts - summary["verified"]
+
+        self.logger.info(
+            "Reconciliation: %s verified, %s mismatched, %s unverified",
+            summary["verified"],
+            summary["mismatched"],
+            summary["unverified"],
+        )
+        return summary
+
+    def _reconcile_account(
+        self, user: User, applications: List[IPOApplication]
+    ) -> None:
+        """Update one account's applications from its applied-issue report"""
+        company_ids = {application.company_id for application in applications}
+        with account_scope(user.username):
+            report = self.fetch_report(user, company_ids)
+        if report is None:
+            return
+
+        for application in applications:
+            entry = report.get(application.company_id)
+            if entry is None:
+                application.mark_reconciled(False)
+                continue
+
+            status = str(entry.get("statusName", "")).upper()
+            if status in ApplicantFormStatus.REJECTED:
+                application.mark_reconciled(False, f"Report status: {status}")
+            else:
+                application.mark_reconciled(True)
+
+            if application.mismatch:
+                self.logger.warning(
+                    "Reconciled %s for company %s: now %s",
+                    user.username,
+                    application.company_id,
+                    application.status,
+                )
+
+    def fetch_report(
+        self, user: User, company_ids: Optional[set] = None
+    ) -> Optional[Dict[int, Dict]]:
+        """
+        Get an account's applied-issue report keyed by company share ID
+
+        Pages are fetched until every company in company_ids has been seen
+        or the report ends. A cached token that is rejected is dropped and
+        the sweep retried once with a fresh login.
+
+        Args:
+            user: User object
+            company_ids: Company share IDs of interest (None for all pages)
+
+        Returns:
+            Dictionary of companyShareId -> report entry, or None on failure
+        """
+        for _ in range(2):
+            token = self.sessions.authenticate(user)
+            if not token:
+                self.logger.error("Reconciliation login failed for %s", user.username)
+                return None
+
+            report = self._fetch_pages(token, company_ids)
+            if report is not None:
+                return report
+            self.sessions.invalidate(user)
+
+        self.logger.error("Could not fetch applied-issue report for %s", user.username)
+        return None
+
+    def _fetch_pages(
+        self, token: str, company_ids: Optional[set]
+    ) -> Optional[Dict[int, Dict]]:
+        report: Dict[int, Dict] = {}
+        size = self.settings.REPORT_PAGE_SIZE
+        page = 1
+
+        while True:
+            response = self.client.get_application_report(token, page, size)
+            if not isinstance(response, dict):
+                return None
+
+            entries = response.get("object") or []
+            for entry in entries:
+                company_id = entry.get("companyShareId")
+                # The report is newest first; keep the latest entry per issue
+                if company_id is not None and company_id not in report:
+                    report[company_id] = entry
+
+            total = response.get("totalCount", 0)
+            if len(entries) < size or page * size >= total:
+                return report
+            if company_ids is not None and company_ids <= report.keys():
+                return report
+            page += 1
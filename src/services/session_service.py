@@ -0,0 +1,96 @@
+"""
+Account session service that reuses cached tokens and profiles
+"""
+
+from typing import Dict, Optional, Tuple
+import logging
+
+from ..models.user import User
+from ..api.meroshare_client import MeroShareClient
+from ..config.constants import HTTPStatus
+from ..storage.credential_health import CredentialHealthStore, get_credential_health
+
+
+class AccountSessionService:
+    """Service for authenticating accounts and loading their profiles once"""
+
+    def __init__(
+        self, client: MeroShareClient, health: Optional[CredentialHealthStore] = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.tokens = client.tokens
+        self.health = health or get_credential_health()
+
+    def authenticate(self, user: User) -> Optional[str]:
+        """
+        Get a token for the user, authenticating only when none is cached
+
+        Args:
+            user: User object
+
+        Returns:
+            Authorization token or None if authentication failed or the
+            account is quarantined
+        """
+        session = self.tokens.get(user)
+        if session is not None:
+            return session.token
+
+        if self.health is not None and self.health.is_quarantined(user):
+            self.logger.debug("Skipping login for quarantined %s", user.username)
+            return None
+
+        return self.login(user)[0]
+
+    def login(self, user: User) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Log in without consulting the token cache or quarantine
+
+        Records the outcome in the credential health store, if any.
+
+        Returns:
+            Tuple of (token or None, HTTP status or None on network error)
+        """
+        token, status = self.client.authenticate_with_status(user)
+        if token:
+            self.tokens.put(user, token)
+
+        if self.health is not None:
+            hard = token is None and status in HTTPStatus.AUTH_HARD_FAILURES
+            record = self.health.record(user, bool(token), status, hard)
+            if hard and record["quarantined"]:
+                self.logger.warning(
+                    "Quarantined %s after %s rejected logins",
+                    user.username,
+                    record["failure_streak"],
+                )
+        return token, status
+
+    def get_personal_details(self, user: User, token: str) -> Optional[Dict]:
+        """Get the user's personal details, cached with the token"""
+        session = self.tokens.get(user)
+        if session is not None and session.personal_details:
+            return session.personal_details
+
+        details = self.client.get_personal_details(token)
+        if details and session is not None:
+            session.personal_details = details
+        return details
+
+    def get_client_boid_details(
+        self, user: User, token: str, demat: str
+    ) -> Optional[Dict]:
+        """Get the user's BOID details, cached with the token"""
+        session = self.tokens.get(user)
+        if session is not None and session.client_boid:
+            return session.client_boid
+
+        details = self.client.get_client_boid_details(token, demat)
+        if details and session is not None:
+            session.client_boid = details
+        return details
+
+    def invalidate(self, user: User) -> None:
+        """Drop the cached session, e.g. after a failed call"""
+        self.tokens.invalidate(user)
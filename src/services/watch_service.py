@@ -0,0 +1,317 @@
+"""
+Watch service that polls for new issues and applies to them by rule
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from ..models.user import User
+from ..models.watch_rule import WatchRule
+from ..models.application_result import ApplicationResult
+from ..config.settings import get_settings
+from ..config.constants import ApplicationStage, EventType, UIConstants
+from ..utils.events import ApplicationEvent
+from .application_service import ApplicationService
+from .issue_catalog_service import IssueCatalogService
+
+ResultCallback = Callable[[ApplicationResult, Dict, WatchRule], None]
+
+
+def load_rules(path: Path) -> Tuple[List[WatchRule], Optional[List[str]]]:
+    """
+    Load watch rules from a JSON file
+
+    The file is either a list of rules or an object with a "rules" list and
+    optional "open_times" (HH:MM strings) overriding WATCH_OPEN_TIMES.
+
+    Returns:
+        Tuple of (rules, open times or None)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        data = {"rules": data}
+
+    rules = [WatchRule.from_dict(entry) for entry in data.get("rules", [])]
+    if not rules:
+        raise ValueError(f"No watch rules in {path}")
+    return rules, data.get("open_times")
+
+
+class WatchService:
+    """
+    Long-running poller that applies to newly opened issues
+
+    Applicable issues are polled every WATCH_FAST_INTERVAL seconds within
+    WATCH_FAST_WINDOW minutes of an expected opening time and every
+    WATCH_SLOW_INTERVAL seconds otherwise. During the fast window every
+    account's token, profile and BOID are kept warm in the shared session
+    cache, so a detected issue goes straight to the apply chain.
+
+    Each account applies under the first rule that matches an issue and
+    selects it. Issues already handled are remembered in the state file, so
+    a restart does not apply again.
+    """
+
+    def __init__(
+        self,
+        rules: List[WatchRule],
+        open_times: Optional[List[str]] = None,
+        application_service: Optional[ApplicationService] = None,
+        state_path: Optional[Path] = None,
+    ):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.rules = rules
+        self.open_times = self._parse_open_times(
+            open_times or self.settings.WATCH_OPEN_TIMES.split(",")
+        )
+        self.application_service = application_service or ApplicationService()
+        self.sessions = self.application_service.sessions
+        self.catalog = IssueCatalogService(
+            self.application_service.client, self.sessions
+        )
+        self.state_path = Path(state_path or self.settings.watch_state_path)
+        self.handled: Dict[str, Dict] = self._load_state()
+        self._ignored = set()
+
+        self._stop = threading.Event()
+        self._warm_thread: Optional[threading.Thread] = None
+
+    def run(self, users: List[User], on_result: Optional[ResultCallback] = None):
+        """Poll until stop() is called"""
+        while not self._stop.is_set():
+            fast = self.in_fast_window()
+            if fast:
+                self._warm_in_background(users)
+
+            self.poll(users, on_result)
+
+            interval = (
+                self.settings.WATCH_FAST_INTERVAL
+                if fast or self.in_fast_window()
+                else self.settings.WATCH_SLOW_INTERVAL
+            )
+            self._stop.wait(interval)
+
+    def stop(self) -> None:
+        """Ask run() to return after the current poll"""
+        self._stop.set()
+
+    def poll(
+        self, users: List[User], on_result: Optional[ResultCallback] = None
+    ) -> List[Dict]:
+        """
+        Fetch applicable issues once and apply to any new matching ones
+
+        Args:
+            users: All loaded accounts
+            on_result: Called with (result, issue, rule) after each group
+
+        Returns:
+            List of latency records for the issues handled in this poll
+        """
+        issues = self.catalog.get_catalog(users, force_refresh=True)
+        detected_at = time.monotonic()
+
+        handled = []
+        for issue in issues:
+            key = str(issue["companyShareId"])
+            if key in self.handled or key in self._ignored:
+                continue
+
+            record = self._handle_issue(issue, users, detected_at, on_result)
+            if not record["rules"]:
+                # Not persisted, so a rule added before a restart still applies
+                self._ignored.add(key)
+                continue
+            self.handled[key] = record
+            self._save_state()
+            handled.append(record)
+        return handled
+
+    def in_fast_window(self, now: Optional[datetime] = None) -> bool:
+        """Check whether now is within WATCH_FAST_WINDOW of an opening time"""
+        now = now or datetime.now()
+        window = timedelta(minutes=self.settings.WATCH_FAST_WINDOW)
+        for hour, minute in self.open_times:
+            opening = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if abs(now - opening) <= window:
+                return True
+        return False
+
+    def assign(
+        self, issue: Dict, users: List[User]
+    ) -> List[Tuple[WatchRule, List[User]]]:
+        """Split accounts across the rules matching an issue, first rule wins"""
+        assigned = set()
+        groups = []
+        for rule in self.rules:
+            if not rule.matches(issue):
+                continue
+            if not self._kitta_fits(issue, rule.kitta):
+                self.logger.warning(
+                    "Rule %s: kitta %s outside %s-%s for %s",
+                    rule.name,
+                    rule.kitta,
+                    issue.get("minUnit"),
+                    issue.get("maxUnit"),
+                    issue.get("scrip"),
+                )
+                continue
+
+            group = [
+                user for user in rule.select(users) if user.username not in assigned
+            ]
+            if group:
+                assigned.update(user.username for user in group)
+                groups.append((rule, group))
+        return groups
+
+    def _handle_issue(
+        self,
+        issue: Dict,
+        users: List[User],
+        detected_at: float,
+        on_result: Optional[ResultCallback],
+    ) -> Dict:
+        """Apply to one new issue and measure detection-to-first-apply"""
+        company_id = issue["companyShareId"]
+        record = {
+            "company_id": company_id,
+            "scrip": issue.get("scrip", ""),
+            "company_name": issue.get("companyName", ""),
+            "detected_at": datetime.now().isoformat(),
+            "rules": [],
+            "first_apply_seconds": None,
+        }
+
+        groups = self.assign(issue, users)
+        if not groups:
+            self.logger.info("New issue %s matches no rule", record["scrip"])
+            return record
+
+        print(
+            f"\n👀 New issue: {record['company_name']} ({record['scrip']}), "
+            f"ID {company_id}"
+        )
+
+        first_apply: List[float] = []
+
+        def on_event(event: ApplicationEvent) -> None:
+            # PREPARE completes immediately before the apply request is sent
+            if (
+                not first_apply
+                and event.type == EventType.STAGE_DONE
+                and event.stage == ApplicationStage.PREPARE
+            ):
+                first_apply.append(event.timestamp)
+
+        events = self.application_service.events
+        events.subscribe(on_event)
+        try:
+            for rule, group in groups:
+                print(
+                    f"{UIConstants.ROCKET_EMOJI} Rule {rule.name}: "
+                    f"{len(group)} accounts x {rule.kitta} kitta"
+                )
+                result = self.application_service.process_bulk_applications(
+                    group, company_id, rule.kitta, self.catalog.close_deadline(issue)
+                )
+                stats = result.get_statistics()
+                record["rules"].append(
+                    {
+                        "rule": rule.name,
+                        "accounts": len(group),
+                        "kitta": rule.kitta,
+                        "successful": stats["successful"],
+                        "failed": stats["failed"],
+                    }
+                )
+                if on_result is not None:
+                    on_result(result, issue, rule)
+        finally:
+            events.unsubscribe(on_event)
+
+        if first_apply:
+            record["first_apply_seconds"] = round(first_apply[0] - detected_at, 3)
+            print(
+                f"⏱️ Detection to first apply for {record['scrip']}: "
+                f"{record['first_apply_seconds']}s"
+            )
+        self.logger.info(
+            "Issue %s handled: detection to first apply %ss",
+            record["scrip"],
+            record["first_apply_seconds"],
+        )
+        return record
+
+    def _warm_in_background(self, users: List[User]) -> None:
+        """Refresh expired sessions on a background thread, one pass at a time"""
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return
+        self._warm_thread = threading.Thread(
+            target=self._warm_sessions, args=(users,), name="watch-warm", daemon=True
+        )
+        self._warm_thread.start()
+
+    def _warm_sessions(self, users: List[User]) -> None:
+        """Cache token, profile and BOID for every account"""
+        with ThreadPoolExecutor(
+            max_workers=self.settings.MAX_CONCURRENT_REQUESTS
+        ) as executor:
+            warmed = sum(executor.map(self._warm_session, users))
+        self.logger.debug("Warm sessions: %s/%s", warmed, len(users))
+
+    def _warm_session(self, user: User) -> bool:
+        """Warm one account's session; cheap when it is still cached"""
+        if self._stop.is_set():
+            return False
+        try:
+            token = self.sessions.authenticate(user)
+            if not token:
+                return False
+            details = self.sessions.get_personal_details(user, token)
+            if not details:
+                return False
+            return bool(
+                self.sessions.get_client_boid_details(user, token, details["demat"])
+            )
+        except Exception as e:
+            self.logger.warning("Could not warm session for %s: %s", user.username, e)
+            return False
+
+    @staticmethod
+    def _kitta_fits(issue: Dict, kitta: int) -> bool:
+        """Same bounds as IPOService.validate_kitta_amount"""
+        return issue.get("minUnit", 0) <= kitta <= issue.get("maxUnit", float("inf"))
+
+    @staticmethod
+    def _parse_open_times(values: List[str]) -> List[Tuple[int, int]]:
+        """Parse HH:MM strings"""
+        times = []
+        for value in values:
+            value = value.strip()
+            if value:
+                hour, minute = value.split(":")
+                times.append((int(hour), int(minute)))
+        return times
+
+    def _load_state(self) -> Dict[str, Dict]:
+        """Load previously handled issues"""
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            return json.load(f).get("handled", {})
+
+    def _save_state(self) -> None:
+        """Persist handled issues and their latencies"""
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump({"handled": self.handled}, f, indent=2)
@@ -0,0 +1,13 @@
+"""Persistent storage backends"""
+
+from .work_queue import WorkQueue, QueueTask
+from .results_store import ResultsStore
+from .credential_health import CredentialHealthStore, get_credential_health
+
+__all__ = [
+    "WorkQueue",
+    "QueueTask",
+    "ResultsStore",
+    "CredentialHealthStore",
+    "get_credential_health",
+]
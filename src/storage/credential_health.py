@@ -0,0 +1,167 @@
+"""
+SQLite store of per-account login health with quarantine
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..models.user import User
+from ..config.settings import get_settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS credential_health (
+    client_id INTEGER NOT NULL,
+    user_name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    last_ok INTEGER NOT NULL,
+    last_status INTEGER,
+    failure_streak INTEGER NOT NULL DEFAULT 0,
+    quarantined INTEGER NOT NULL DEFAULT 0,
+    last_checked TEXT NOT NULL,
+    last_success TEXT,
+    PRIMARY KEY (client_id, user_name)
+);
+"""
+
+
+class CredentialHealthStore:
+    """
+    Last login outcome per account, kept across runs
+
+    Each record carries a fingerprint of the account's accounts.txt line.
+    An account is quarantined after ``quarantine_after`` consecutive hard
+    failures (the backend rejected the credentials, see
+    HTTPStatus.AUTH_HARD_FAILURES) and stays quarantined until its line
+    changes or a login succeeds. Network errors and 5xx never count. Rows
+    are read once into memory; lookups are dictionary hits and only
+    outcomes go to disk.
+    """
+
+    def __init__(self, path: Path, quarantine_after: int = 3):
+        self.path = Path(path)
+        self.quarantine_after = quarantine_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._records: Dict[Tuple[int, str], Dict] = {
+            (row["client_id"], row["user_name"]): dict(row)
+            for row in self._conn.execute("SELECT * FROM credential_health")
+        }
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _key(user: User) -> Tuple[int, str]:
+        return (user.client_id, user.username)
+
+    def get(self, user: User) -> Optional[Dict]:
+        """Health record for an account, if it has ever logged in"""
+        with self._lock:
+            record = self._records.get(self._key(user))
+            return dict(record) if record else None
+
+    def is_quarantined(self, user: User) -> bool:
+        """Check whether an account is quarantined with unchanged credentials"""
+        with self._lock:
+            record = self._records.get(self._key(user))
+        return bool(
+            record
+            and record["quarantined"]
+            and record["fingerprint"] == user.fingerprint
+        )
+
+    def partition(self, users: List[User]) -> Tuple[List[User], List[User]]:
+        """Split accounts into (usable, quarantined)"""
+        usable, quarantined = [], []
+        for user in users:
+            (quarantined if self.is_quarantined(user) else usable).append(user)
+        return usable, quarantined
+
+    def record(self, user: User, ok: bool, status: Optional[int], hard: bool) -> Dict:
+        """
+        Record one login outcome
+
+        Args:
+            user: Account that tried to log in
+            ok: Whether a token was issued
+            status: HTTP status, or None on a network error
+            hard: Whether the failure means the credentials are bad
+
+        Returns:
+            The updated health record
+        """
+        now = datetime.now().isoformat()
+        key = self._key(user)
+
+        with self._lock:
+            previous = self._records.get(key)
+            if previous is None or previous["fingerprint"] != user.fingerprint:
+                # New account or edited line: start from a clean slate
+                previous = {"failure_streak": 0, "quarantined": 0, "last_success": None}
+
+            streak = 0 if ok else previous["failure_streak"] + (1 if hard else 0)
+            quarantined = int(
+                not ok
+                and (
+                    previous["quarantined"]
+                    or bool(self.quarantine_after and streak >= self.quarantine_after)
+                )
+            )
+            record = {
+                "client_id": user.client_id,
+                "user_name": user.username,
+                "fingerprint": user.fingerprint,
+                "last_ok": int(ok),
+                "last_status": status,
+                "failure_streak": streak,
+                "quarantined": quarantined,
+                "last_checked": now,
+                "last_success": now if ok else previous["last_success"],
+            }
+            self._records[key] = record
+            self._conn.execute(
+                "INSERT OR REPLACE INTO credential_health (client_id, user_name, "
+                "fingerprint, last_ok, last_status, failure_streak, quarantined, "
+                "last_checked, last_success) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                tuple(record.values()),
+            )
+            return dict(record)
+
+    def quarantined_records(self) -> List[Dict]:
+        """All quarantined records, regardless of current credentials"""
+        with self._lock:
+            return [
+                dict(record)
+                for record in self._records.values()
+                if record["quarantined"]
+            ]
+
+
+# Shared instance, so every session service sees the same records
+_store: Optional[CredentialHealthStore] = None
+_store_lock = threading.Lock()
+
+
+def get_credential_health() -> Optional[CredentialHealthStore]:
+    """Get the process-wide health store (None when QUARANTINE_AFTER is 0)"""
+    global _store
+    settings = get_settings()
+    if not settings.QUARANTINE_AFTER:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = CredentialHealthStore(
+                settings.credential_health_path, settings.QUARANTINE_AFTER
+            )
+    return _store
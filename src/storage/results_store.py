@@ -0,0 +1,236 @@
+"""
+SQLite store of application results across runs
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models.application_result import ApplicationResult
+from ..config.constants import ApplicationStatus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    duration_seconds REAL NOT NULL,
+    total INTEGER NOT NULL,
+    successful INTEGER NOT NULL,
+    failed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    user_id TEXT NOT NULL,
+    user_name TEXT NOT NULL,
+    company_id INTEGER NOT NULL,
+    company_name TEXT NOT NULL DEFAULT '',
+    kitta_amount INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT NOT NULL DEFAULT '',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    duration_seconds REAL NOT NULL DEFAULT 0,
+    last_attempt TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_company
+    ON applications (company_id, status);
+CREATE INDEX IF NOT EXISTS idx_applications_user
+    ON applications (user_id, status);
+CREATE INDEX IF NOT EXISTS idx_applications_account
+    ON applications (user_name, status);
+CREATE INDEX IF NOT EXISTS idx_applications_status
+    ON applications (status);
+CREATE INDEX IF NOT EXISTS idx_applications_run
+    ON applications (run_id);
+"""
+
+
+class ResultsStore:
+    """
+    Historical store of every run's applications
+
+    Uses WAL so readers (reports) never block a run that is writing, and
+    indexes on company, user and status so aggregates stay index-driven as
+    the table grows.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def save_result(self, result: ApplicationResult) -> int:
+        """
+        Store a run and all of its applications
+
+        Args:
+            result: Completed ApplicationResult
+
+        Returns:
+            ID of the stored run
+        """
+        rows = [
+            (
+                app.user_id,
+                app.user_name,
+                app.company_id,
+                app.company_name,
+                app.kitta_amount,
+                app.status,
+                app.error_message,
+                app.attempts,
+                app.duration_seconds,
+                app.last_attempt.isoformat() if app.last_attempt else None,
+                app.created_at.isoformat(),
+            )
+            for app in result.applications
+        ]
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO runs (started_at, completed_at, duration_seconds, "
+                    "total, successful, failed) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        result.started_at.isoformat(),
+                        result.completed_at.isoformat(),
+                        result.duration,
+                        result.total_accounts,
+                        result.successful,
+                        result.failed,
+                    ),
+                )
+                run_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO applications (run_id, user_id, user_name, "
+                    "company_id, company_name, kitta_amount, status, error_message, "
+                    "attempts, duration_seconds, last_attempt, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(run_id,) + row for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return run_id
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def account_success_rates(
+        self,
+        user_id: Optional[str] = None,
+        user_name: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        """
+        Per-account application counts and success rate
+
+        Args:
+            user_id: Restrict to accounts of one DP (client ID)
+            user_name: Restrict to one account
+            limit: Maximum number of rows, lowest success rate first
+
+        Returns:
+            List of dictionaries with user_id, user_name, total, successful,
+            success_rate
+        """
+        clauses, params = [], ()
+        if user_id:
+            clauses.append("user_id = ?")
+            params += (user_id,)
+        if user_name:
+            clauses.append("user_name = ?")
+            params += (user_name,)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(
+            "SELECT user_id, user_name, COUNT(*) AS total, "
+            "SUM(status = ?) AS successful, "
+            "ROUND(100.0 * SUM(status = ?) / COUNT(*), 2) AS success_rate "
+            f"FROM applications {where} GROUP BY user_id, user_name "
+            "ORDER BY success_rate ASC, total DESC LIMIT ?",
+            (ApplicationStatus.SUCCESS, ApplicationStatus.SUCCESS) + params + (limit,),
+        )
+
+    def issue_summary(
+        self, company_id: Optional[int] = None, limit: int = 50
+    ) -> List[Dict]:
+        """
+        Per-issue counts, success rate and latency
+
+        Args:
+            company_id: Restrict to one issue
+            limit: Maximum number of rows, most recent issues first
+
+        Returns:
+            List of dictionaries with company_id, company_name, runs, total,
+            successful, success_rate, avg_seconds, max_seconds
+        """
+        where, params = (
+            ("WHERE company_id = ?", (company_id,)) if company_id else ("", ())
+        )
+        return self._query(
+            "SELECT company_id, MAX(company_name) AS company_name, "
+            "COUNT(DISTINCT run_id) AS runs, COUNT(*) AS total, "
+            "SUM(status = ?) AS successful, "
+            "ROUND(100.0 * SUM(status = ?) / COUNT(*), 2) AS success_rate, "
+            "ROUND(AVG(duration_seconds), 3) AS avg_seconds, "
+            "ROUND(MAX(duration_seconds), 3) AS max_seconds "
+            f"FROM applications {where} GROUP BY company_id "
+            "ORDER BY MAX(run_id) DESC LIMIT ?",
+            (ApplicationStatus.SUCCESS, ApplicationStatus.SUCCESS) + params + (limit,),
+        )
+
+    def latency_trend(self, company_id: int) -> List[Dict]:
+        """
+        Per-run latency for one issue
+
+        Returns:
+            List of dictionaries with run_id, started_at, total, avg_seconds,
+            max_seconds, in run order
+        """
+        return self._query(
+            "SELECT a.run_id, r.started_at, COUNT(*) AS total, "
+            "ROUND(AVG(a.duration_seconds), 3) AS avg_seconds, "
+            "ROUND(MAX(a.duration_seconds), 3) AS max_seconds "
+            "FROM applications a JOIN runs r ON r.id = a.run_id "
+            "WHERE a.company_id = ? GROUP BY a.run_id ORDER BY a.run_id",
+            (company_id,),
+        )
+
+    def error_summary(
+        self, company_id: Optional[int] = None, limit: int = 20
+    ) -> List[Dict]:
+        """
+        Most frequent failure messages
+
+        Returns:
+            List of dictionaries with error_message and count
+        """
+        where = "WHERE status = ?"
+        params: tuple = (ApplicationStatus.FAILED,)
+        if company_id:
+            where += " AND company_id = ?"
+            params += (company_id,)
+        return self._query(
+            "SELECT error_message, COUNT(*) AS count FROM applications "
+            f"{where} GROUP BY error_message ORDER BY count DESC LIMIT ?",
+            params + (limit,),
+        )
@@ -0,0 +1,391 @@
+"""
+SQLite-backed work queue shared by coordinator and worker processes
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..models.ipo_application import IPOApplication
+from ..models.application_result import ApplicationResult
+from ..models.user import User
+from ..config.constants import TaskState
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    client_id INTEGER NOT NULL,
+    username TEXT NOT NULL,
+    company_id INTEGER NOT NULL,
+    kitta_amount INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    leases INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (client_id, username, company_id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks (state, lease_expires_at);
+"""
+
+
+@dataclass
+class QueueTask:
+    """A leased unit of work: one account applying for one issue"""
+
+    id: int
+    client_id: int
+    username: str
+    company_id: int
+    kitta_amount: int
+    lease_owner: str
+    lease_expires_at: float
+
+    @property
+    def account_key(self) -> tuple:
+        """Key used to match the task against a loaded account"""
+        return (self.client_id, self.username)
+
+
+class WorkQueue:
+    """
+    Work queue of (account, company_id, kitta) tasks
+
+    Tasks move through queued -> leased -> applying -> done. A leased task
+    whose lease expires goes back to the pool, but once a worker has moved
+    a task to ``applying`` it is never handed out again, which gives
+    at-most-once semantics for the apply call. Live workers renew their
+    leases, so only tasks of a dead worker expire. Credentials are not
+    stored; workers resolve accounts from their own accounts file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, users: List[User], company_id: int, kitta_amount: int) -> int:
+        """
+        Add tasks for users, skipping accounts already queued for the issue
+
+        Args:
+            users: Accounts to apply for
+            company_id: Company share ID
+            kitta_amount: Number of kittas per account
+
+        Returns:
+            Number of newly queued tasks
+        """
+        now = time.time()
+        rows = [
+            (
+                user.client_id,
+                user.username,
+                company_id,
+                kitta_amount,
+                TaskState.QUEUED,
+                now,
+                now,
+            )
+            for user in users
+        ]
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO tasks (client_id, username, company_id, "
+                    "kitta_amount, state, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return self._conn.total_changes - before
+
+    def lease(self, owner: str, lease_timeout: float) -> Optional[QueueTask]:
+        """
+        Lease the next available task
+
+        Args:
+            owner: Unique worker identifier
+            lease_timeout: Seconds until the lease becomes visible again
+
+        Returns:
+            Leased task or None if nothing is available right now
+        """
+        now = time.time()
+        expires_at = now + lease_timeout
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM tasks WHERE state = ? "
+                    "OR (state = ? AND lease_expires_at < ?) ORDER BY id LIMIT 1",
+                    (TaskState.QUEUED, TaskState.LEASED, now),
+                ).fetchone()
+
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                self._conn.execute(
+                    "UPDATE tasks SET state = ?, lease_owner = ?, lease_expires_at = ?, "
+                    "leases = leases + 1, updated_at = ? WHERE id = ?",
+                    (TaskState.LEASED, owner, expires_at, now, row["id"]),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return QueueTask(
+            id=row["id"],
+            client_id=row["client_id"],
+            username=row["username"],
+            company_id=row["company_id"],
+            kitta_amount=row["kitta_amount"],
+            lease_owner=owner,
+            lease_expires_at=expires_at,
+        )
+
+    def renew(self, tasks: List[QueueTask], lease_timeout: float) -> int:
+        """
+        Extend the leases of tasks the caller is still working on
+
+        Args:
+            tasks: Tasks held by the caller
+            lease_timeout: Seconds from now until the leases expire
+
+        Returns:
+            Number of leases extended
+        """
+        now = time.time()
+        expires_at = now + lease_timeout
+        renewed = 0
+
+        with self._lock:
+            for task in tasks:
+                cursor = self._conn.execute(
+                    "UPDATE tasks SET lease_expires_at = ?, updated_at = ? "
+                    "WHERE id = ? AND lease_owner = ? AND state IN (?, ?)",
+                    (
+                        expires_at,
+                        now,
+                        task.id,
+                        task.lease_owner,
+                        TaskState.LEASED,
+                        TaskState.APPLYING,
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    task.lease_expires_at = expires_at
+                    renewed += 1
+        return renewed
+
+    def begin_apply(self, task: QueueTask, lease_timeout: float) -> bool:
+        """
+        Claim the right to send the apply request for a task
+
+        Args:
+            task: Leased task
+            lease_timeout: Seconds from now the claimed task stays leased
+
+        Returns:
+            True if the lease is still held and the task is now ``applying``
+        """
+        now = time.time()
+        if not self._transition(
+            task,
+            TaskState.APPLYING,
+            "state = ? AND lease_expires_at >= ?",
+            (TaskState.LEASED, now),
+            lease_expires_at=now + lease_timeout,
+        ):
+            return False
+        task.lease_expires_at = now + lease_timeout
+        return True
+
+    def complete(self, task: QueueTask, application: IPOApplication) -> bool:
+        """
+        Store the final application for a task
+
+        Returns:
+            True if the result was recorded by the lease owner
+        """
+        return self._transition(
+            task,
+            TaskState.DONE,
+            "state IN (?, ?)",
+            (TaskState.LEASED, TaskState.APPLYING),
+            result=json.dumps(application.to_dict()),
+        )
+
+    def _transition(
+        self,
+        task: QueueTask,
+        new_state: str,
+        condition: str,
+        params: tuple,
+        result: Optional[str] = None,
+        lease_expires_at: Optional[float] = None,
+    ) -> bool:
+        """Move a task to a new state if the caller still owns it"""
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE tasks SET state = ?, result = COALESCE(?, result), "
+                f"lease_expires_at = COALESCE(?, lease_expires_at), "
+                f"updated_at = ? WHERE id = ? AND lease_owner = ? AND {condition}",
+                (
+                    new_state,
+                    result,
+                    lease_expires_at,
+                    time.time(),
+                    task.id,
+                    task.lease_owner,
+                )
+                + params,
+            )
+            return cursor.rowcount == 1
+
+    def fail_abandoned(self, grace_period: float = 0.0) -> int:
+        """
+        Close out tasks whose worker died after claiming the apply call
+
+        Live workers keep renewing their leases, so an ``applying`` task
+        whose lease has expired belongs to a worker that is gone. The apply
+        request may or may not have reached the server, so these tasks are
+        never retried automatically; they are recorded as failed and need
+        to be verified manually.
+
+        Args:
+            grace_period: Extra seconds past lease expiry before giving up
+
+        Returns:
+            Number of tasks closed out
+        """
+        cutoff = time.time() - grace_period
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM tasks WHERE state = ? AND lease_expires_at < ?",
+                (TaskState.APPLYING, cutoff),
+            ).fetchall()
+
+            for row in rows:
+                application = IPOApplication(
+                    user_id=str(row["client_id"]),
+                    user_name=row["username"],
+                    company_id=row["company_id"],
+                    kitta_amount=row["kitta_amount"],
+                )
+                application.mark_failed(
+                    "Worker lost during apply: status unknown, verify manually"
+                )
+                application.increment_attempts()
+                self._conn.execute(
+                    "UPDATE tasks SET state = ?, result = ?, updated_at = ? "
+                    "WHERE id = ? AND state = ?",
+                    (
+                        TaskState.DONE,
+                        json.dumps(application.to_dict()),
+                        time.time(),
+                        row["id"],
+                        TaskState.APPLYING,
+                    ),
+                )
+
+            return len(rows)
+
+    def counts(self, company_id: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get number of tasks in each state
+
+        Args:
+            company_id: Optional company share ID to restrict the counts to
+        """
+        counts = {
+            TaskState.QUEUED: 0,
+            TaskState.LEASED: 0,
+            TaskState.APPLYING: 0,
+            TaskState.DONE: 0,
+        }
+        query = "SELECT state, COUNT(*) AS n FROM tasks"
+        params: tuple = ()
+        if company_id is not None:
+            query += " WHERE company_id = ?"
+            params = (company_id,)
+
+        with self._lock:
+            for row in self._conn.execute(query + " GROUP BY state", params):
+                counts[row["state"]] = row["n"]
+        return counts
+
+    def is_drained(self, company_id: Optional[int] = None) -> bool:
+        """
+        Check whether every task has reached its final state
+
+        Args:
+            company_id: Optional company share ID to restrict the check to
+        """
+        counts = self.counts(company_id)
+        return (
+            counts[TaskState.QUEUED]
+            + counts[TaskState.LEASED]
+            + counts[TaskState.APPLYING]
+            == 0
+        )
+
+    def collect_result(self, company_id: Optional[int] = None) -> ApplicationResult:
+        """
+        Build a merged ApplicationResult from finished tasks
+
+        Args:
+            company_id: Optional company share ID to restrict the result to
+
+        Returns:
+            ApplicationResult across all workers
+        """
+        query = "SELECT result, created_at, updated_at FROM tasks WHERE state = ?"
+        params: tuple = (TaskState.DONE,)
+        if company_id is not None:
+            query += " AND company_id = ?"
+            params += (company_id,)
+
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+
+        result = ApplicationResult()
+        for row in rows:
+            result.add_application(IPOApplication.from_dict(json.loads(row["result"])))
+
+        if rows:
+            result.started_at = datetime.fromtimestamp(
+                min(row["created_at"] for row in rows)
+            )
+            result.completed_at = datetime.fromtimestamp(
+                max(row["updated_at"] for row in rows)
+            )
+        return result
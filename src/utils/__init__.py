@@ -1,6 +1,13 @@
 """Utilities package"""
 
 from .exceptions import *
-from .logger import setup_logging, get_logger
+from .logger import setup_logging, shutdown_logging, get_logger
+from .events import EventBus, ApplicationEvent
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = [
+    "setup_logging",
+    "shutdown_logging",
+    "get_logger",
+    "EventBus",
+    "ApplicationEvent",
+]
@@ -0,0 +1,353 @@
+"""
+Discrete-event capacity simulator for bulk application runs
+"""
+
+import heapq
+import json
+import math
+import random
+import statistics
+from collections import Counter, OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config.constants import APIEndpoints, HTTPStatus
+
+# Call chains, in the order ApplicationService performs them. Keep these in
+# step with _prefilter_eligible / _apply_ipo_for_user.
+PREFILTER_CHAIN = [
+    APIEndpoints.AUTH,
+    APIEndpoints.OWN_DETAIL,
+    APIEndpoints.SHARE_CRITERIA,
+]
+# Token and profile are reused from the prefilter on the first attempt
+APPLY_CHAIN = [
+    APIEndpoints.MY_DETAIL,
+    APIEndpoints.BANK_REQUEST,
+    APIEndpoints.BANK_DETAIL,
+    APIEndpoints.APPLY_SHARE,
+]
+# A failed attempt drops the cached session, so a retry logs in again
+RETRY_CHAIN = [APIEndpoints.AUTH, APIEndpoints.OWN_DETAIL] + APPLY_CHAIN
+
+OK_STATUSES = (HTTPStatus.OK, HTTPStatus.CREATED, HTTPStatus.CONFLICT)
+
+
+class LatencyProfile:
+    """
+    Per-endpoint latency and error samples
+
+    Built from cassettes recorded with ``--record-cassette``; each
+    interaction contributes its elapsed time and whether it succeeded.
+    Sampling draws from the recorded values (bootstrap), so the simulated
+    distribution keeps the real tail. Endpoints with no samples fall back
+    to ``default_latency`` with no errors.
+    """
+
+    def __init__(self, default_latency: float = 0.3):
+        self.default_latency = default_latency
+        self.samples: Dict[str, List[Tuple[float, bool]]] = defaultdict(list)
+
+    @classmethod
+    def from_cassettes(
+        cls, paths: Iterable[Path], default_latency: float = 0.3
+    ) -> "LatencyProfile":
+        """Build a profile from one or more cassette files"""
+        profile = cls(default_latency)
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for interaction in data.get("interactions", []):
+                profile.add(
+                    interaction["template"],
+                    interaction["elapsed"],
+                    interaction["status"] in OK_STATUSES,
+                )
+        return profile
+
+    def add(self, template: str, elapsed: float, ok: bool = True) -> None:
+        """Record one observed call"""
+        self.samples[template].append((elapsed, ok))
+
+    def sample(self, template: str, rng: random.Random) -> Tuple[float, bool]:
+        """Draw (latency, ok) for one call"""
+        samples = self.samples.get(template)
+        if not samples:
+            return self.default_latency, True
+        return rng.choice(samples)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-endpoint sample count, median, p95 and error rate"""
+        result = {}
+        for template, samples in sorted(self.samples.items()):
+            latencies = sorted(elapsed for elapsed, _ in samples)
+            result[template] = {
+                "samples": len(samples),
+                "p50": round(percentile(latencies, 50), 4),
+                "p95": round(percentile(latencies, 95), 4),
+                "error_rate": round(
+                    sum(1 for _, ok in samples if not ok) / len(samples), 4
+                ),
+            }
+        return result
+
+
+@dataclass
+class SimulationConfig:
+    """Settings that shape a simulated run"""
+
+    accounts: int
+    concurrency: int
+    rate_limit_delay: float
+    dp_count: int = 1
+    dp_sizes: Optional[List[int]] = None  # accounts per DP, overrides the two above
+    dp_max_concurrent: int = 0
+    in_run_retries: int = 0
+    retry_delay: float = 5.0
+    exponential_backoff: bool = True
+    prefilter: bool = True
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated outcome of one or more simulated runs"""
+
+    runs: int
+    completion_seconds: float
+    completion_p95_seconds: float
+    account_p50_seconds: float
+    account_p99_seconds: float
+    success_rate: float
+    bottleneck: str
+    bounds: Dict[str, float] = field(default_factory=dict)
+    endpoint_share: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization"""
+        return {
+            "runs": self.runs,
+            "completion_seconds": self.completion_seconds,
+            "completion_p95_seconds": self.completion_p95_seconds,
+            "account_p50_seconds": self.account_p50_seconds,
+            "account_p99_seconds": self.account_p99_seconds,
+            "success_rate": self.success_rate,
+            "bottleneck": self.bottleneck,
+            "bounds": self.bounds,
+            "endpoint_share": self.endpoint_share,
+        }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class CapacitySimulator:
+    """
+    Simulate a bulk run without touching the backend
+
+    Models the eligibility prefilter (a worker pool with dispatches spaced
+    by the rate limit delay) followed by the apply phase as scheduled by FairScheduler: DP groups served
+    round-robin, optional per-DP cap, dispatches spaced by the rate limit
+    delay and a retry lane that only runs when no first attempt can. Each
+    account's attempt walks the real call chain, drawing every call's
+    latency and outcome from the profile; the first failing call ends the
+    attempt.
+    """
+
+    def __init__(self, profile: LatencyProfile, seed: Optional[int] = None):
+        self.profile = profile
+        self.rng = random.Random(seed)
+
+    def run(self, config: SimulationConfig, runs: int = 20) -> SimulationReport:
+        """
+        Simulate several runs and aggregate them
+
+        Args:
+            config: Settings to evaluate
+            runs: Number of independent runs to simulate
+
+        Returns:
+            SimulationReport with completion times and the bottleneck
+        """
+        completions, finishes, bounds_total = [], [], Counter()
+        endpoint_time: Counter = Counter()
+        succeeded = total = 0
+
+        for _ in range(runs):
+            outcome = self._simulate(config, endpoint_time)
+            completions.append(outcome["completion"])
+            finishes.extend(outcome["finishes"])
+            succeeded += outcome["succeeded"]
+            total += len(outcome["finishes"])
+            bounds_total.update(outcome["bounds"])
+
+        completions.sort()
+        finishes.sort()
+        bounds = {name: round(value / runs, 3) for name, value in bounds_total.items()}
+        busy = sum(endpoint_time.values()) or 1.0
+
+        return SimulationReport(
+            runs=runs,
+            completion_seconds=round(statistics.mean(completions), 3),
+            completion_p95_seconds=round(percentile(completions, 95), 3),
+            account_p50_seconds=round(percentile(finishes, 50), 3),
+            account_p99_seconds=round(percentile(finishes, 99), 3),
+            success_rate=round(100.0 * succeeded / max(total, 1), 2),
+            bottleneck=max(bounds, key=bounds.get),
+            bounds=bounds,
+            endpoint_share={
+                template: round(100.0 * seconds / busy, 1)
+                for template, seconds in endpoint_time.most_common()
+            },
+        )
+
+    def _attempt(self, chain: List[str], endpoint_time: Counter) -> Tuple[float, bool]:
+        """Walk a call chain; returns (duration, succeeded)"""
+        duration = 0.0
+        for template in chain:
+            elapsed, ok = self.profile.sample(template, self.rng)
+            duration += elapsed
+            endpoint_time[template] += elapsed
+            if not ok:
+                return duration, False
+        return duration, True
+
+    def _simulate(self, config: SimulationConfig, endpoint_time: Counter) -> Dict:
+        """Simulate one run"""
+        workers = config.concurrency
+        if config.dp_sizes:
+            accounts = [
+                (index, dp)
+                for dp, size in enumerate(config.dp_sizes)
+                for index in range(size)
+            ]
+        else:
+            accounts = [
+                (index, index % config.dp_count) for index in range(config.accounts)
+            ]
+
+        # Phase 1: eligibility prefilter, paced like the apply phase
+        start = 0.0
+        prefilter_work = 0.0
+        if config.prefilter:
+            pool = [0.0] * workers
+            next_check = 0.0
+            for _ in accounts:
+                begin = max(heapq.heappop(pool), next_check)
+                next_check = begin + config.rate_limit_delay
+                duration, _ = self._attempt(PREFILTER_CHAIN, endpoint_time)
+                prefilter_work += duration
+                heapq.heappush(pool, begin + duration)
+            start = max(pool)
+
+        # Phase 2: fair scheduling of the apply chain
+        lanes = {"first": OrderedDict(), "retry": OrderedDict()}
+        for account in accounts:
+            lanes["first"].setdefault(account[1], deque()).append((start, account))
+
+        now = next_dispatch = start
+        running: List[Tuple[float, int, Tuple[int, int], bool]] = []
+        in_flight: Counter = Counter()
+        tries: Counter = Counter()
+        finishes, succeeded, apply_work, dispatches = [], 0, 0.0, 0
+        dp_work: Counter = Counter()
+        sequence = 0
+
+        while True:
+            picked = None
+            if len(running) < workers and now >= next_dispatch:
+                picked = self._pick(lanes, in_flight, config.dp_max_concurrent, now)
+
+            if picked is not None:
+                account = picked
+                dp = account[1]
+                first = tries[account] == 0 and config.prefilter
+                chain = APPLY_CHAIN if first else RETRY_CHAIN
+                duration, ok = self._attempt(chain, endpoint_time)
+                tries[account] += 1
+                in_flight[dp] += 1
+                apply_work += duration
+                dp_work[dp] += duration
+                dispatches += 1
+                next_dispatch = now + config.rate_limit_delay
+                sequence += 1
+                heapq.heappush(running, (now + duration, sequence, account, ok))
+                continue
+
+            # Nothing can start now: advance to the next event
+            candidates = [running[0][0]] if running else []
+            if len(running) < workers:
+                if now < next_dispatch:
+                    candidates.append(next_dispatch)
+                ready = self._next_ready(lanes, now)
+                if ready is not None:
+                    candidates.append(ready)
+            if not candidates:
+                break
+            now = max(now, min(candidates))
+
+            while running and running[0][0] <= now:
+                finished_at, _, account, ok = heapq.heappop(running)
+                in_flight[account[1]] -= 1
+                if not ok and tries[account] <= config.in_run_retries:
+                    delay = config.retry_delay
+                    if config.exponential_backoff:
+                        delay *= 2 ** (tries[account] - 1)
+                    lanes["retry"].setdefault(account[1], deque()).append(
+                        (finished_at + delay, account)
+                    )
+                else:
+                    finishes.append(finished_at)
+                    succeeded += ok
+
+        completion = max(finishes) if finishes else start
+        bounds = {
+            "prefilter": start,
+            "workers (MAX_CONCURRENT_REQUESTS)": start + apply_work / workers,
+            "rate limit (RATE_LIMIT_DELAY)": start
+            + max(dispatches - 1, 0) * config.rate_limit_delay,
+        }
+        if config.dp_max_concurrent:
+            bounds["per-DP cap (DP_MAX_CONCURRENT)"] = start + max(
+                work / config.dp_max_concurrent for work in dp_work.values()
+            )
+        return {
+            "completion": completion,
+            "finishes": finishes,
+            "succeeded": succeeded,
+            "bounds": bounds,
+        }
+
+    @staticmethod
+    def _pick(lanes: Dict, in_flight: Counter, cap: int, now: float):
+        """Same policy as FairScheduler._pick, in simulated time"""
+        for lane in ("first", "retry"):
+            groups = lanes[lane]
+            for key in list(groups):
+                if cap and in_flight[key] >= cap:
+                    continue
+                group = groups[key]
+                if group[0][0] > now:
+                    continue
+                _, account = group.popleft()
+                del groups[key]
+                if group:
+                    groups[key] = group
+                return account
+        return None
+
+    @staticmethod
+    def _next_ready(lanes: Dict, now: float) -> Optional[float]:
+        """Earliest future time a queued item becomes ready"""
+        future = [
+            group[0][0]
+            for groups in lanes.values()
+            for group in groups.values()
+            if group[0][0] > now
+        ]
+        return min(future) if future else None
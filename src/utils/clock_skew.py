@@ -0,0 +1,99 @@
+"""
+Server clock offset estimation from HTTP Date headers
+"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Deque, Optional, Tuple
+
+
+class ClockSkewEstimator:
+    """
+    Bounds on (server clock - local clock) from response Date headers
+
+    A Date header has one-second resolution: the server stamped the
+    response at some instant in [D, D + 1), and that instant lies between
+    our send and receive times. Each response therefore bounds the offset
+    to [D - received, D + 1 - sent]. Intersecting the bounds of many
+    responses narrows the interval well below a second, since their send
+    times fall at different points within the second; its width shrinks
+    towards the smallest RTT seen. The offset is the interval's midpoint.
+
+    If a new sample contradicts the interval (a clock was stepped) or the
+    interval is older than ``max_age`` seconds (drift), the estimate starts
+    over from the new sample.
+    """
+
+    def __init__(self, max_age: float = 600.0, max_rtts: int = 256):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._low: Optional[float] = None
+        self._high: Optional[float] = None
+        self._since = 0.0
+        self.samples = 0
+        self._rtts: Deque[float] = deque(maxlen=max_rtts)
+
+    def observe(self, sent: float, received: float, date_header: str) -> None:
+        """
+        Add one response
+
+        Args:
+            sent: time.time() just before the request was sent
+            received: time.time() just after the response arrived
+            date_header: The response's Date header
+        """
+        try:
+            stamped = parsedate_to_datetime(date_header).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return
+
+        low, high = stamped - received, stamped + 1.0 - sent
+        with self._lock:
+            self._rtts.append(received - sent)
+            if (
+                self._low is None
+                or received - self._since > self.max_age
+                or low > self._high
+                or high < self._low
+            ):
+                self._low, self._high = low, high
+                self._since = received
+                self.samples = 1
+                return
+
+            self._low = max(self._low, low)
+            self._high = min(self._high, high)
+            self.samples += 1
+
+    def bounds(self) -> Optional[Tuple[float, float]]:
+        """Lower and upper bound on the offset, or None without samples"""
+        with self._lock:
+            if self._low is None:
+                return None
+            return self._low, self._high
+
+    @property
+    def offset(self) -> float:
+        """Best estimate of server minus local time, in seconds"""
+        bounds = self.bounds()
+        return 0.0 if bounds is None else (bounds[0] + bounds[1]) / 2
+
+    @property
+    def uncertainty(self) -> Optional[float]:
+        """Half-width of the offset interval"""
+        bounds = self.bounds()
+        return None if bounds is None else (bounds[1] - bounds[0]) / 2
+
+    @property
+    def rtt(self) -> Optional[float]:
+        """Median round-trip time of recent requests"""
+        with self._lock:
+            rtts = list(self._rtts)
+        return statistics.median(rtts) if rtts else None
+
+    def server_time(self, now: Optional[float] = None) -> float:
+        """Estimated server wall-clock time"""
+        return (time.time() if now is None else now) + self.offset
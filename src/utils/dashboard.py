@@ -0,0 +1,192 @@
+"""
+Throttled terminal progress dashboard fed by the event bus
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, TextIO
+
+from ..config.constants import ApplicationStage, EventType, UIConstants
+from .events import ApplicationEvent, EventBus
+from .logger import set_console_level
+
+try:
+    from termcolor import colored as _colored
+except ImportError:  # pragma: no cover - termcolor is optional
+    _colored = None
+
+
+class ProgressDashboard:
+    """
+    Live progress view for a bulk run
+
+    Event callbacks only update counters; a background thread redraws the
+    view at a fixed rate, so output volume does not grow with the number of
+    accounts. On a non-interactive stream a single status line is printed
+    per (longer) interval instead of redrawing in place. While it runs the
+    console log handler only shows warnings and errors; INFO records still
+    go to the log file.
+    """
+
+    BAR_WIDTH = 30
+    MAX_ERROR_LINES = 3
+    NON_TTY_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        bus: EventBus,
+        total: int,
+        refresh_interval: float = 0.5,
+        colored: bool = True,
+        stream: Optional[TextIO] = None,
+    ):
+        self.bus = bus
+        self.total = total
+        self.stream = stream or sys.stdout
+        self.is_tty = self.stream.isatty()
+        self.refresh_interval = (
+            refresh_interval
+            if self.is_tty
+            else max(refresh_interval, self.NON_TTY_INTERVAL)
+        )
+        self.colored = colored and self.is_tty and _colored is not None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lines_drawn = 0
+        self._last_line = ""
+        self._console_level: Optional[int] = None
+
+        self.started_at = time.monotonic()
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retrying = 0
+        self.errors: Counter = Counter()
+        self.in_flight: Dict[str, str] = {}
+
+    def __enter__(self) -> "ProgressDashboard":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Subscribe to the bus and start redrawing"""
+        self.started_at = time.monotonic()
+        self._console_level = set_console_level(logging.WARNING)
+        self.bus.subscribe(self.handle_event)
+        self._thread = threading.Thread(
+            target=self._run, name="progress-dashboard", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Unsubscribe, stop redrawing and draw the final state"""
+        self.bus.unsubscribe(self.handle_event)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._draw(final=True)
+        if self._console_level is not None:
+            set_console_level(self._console_level)
+            self._console_level = None
+
+    def handle_event(self, event: ApplicationEvent) -> None:
+        """Update counters for an event (called on the publishing thread)"""
+        with self._lock:
+            if event.type == EventType.SUBMITTED:
+                self.submitted += 1
+            elif event.type == EventType.STARTED:
+                self.in_flight[event.user_name] = ApplicationStage.ORDER[0]
+            elif event.type == EventType.STAGE_DONE:
+                self.in_flight[event.user_name] = self._next_stage(event.stage)
+            elif event.type == EventType.SUCCEEDED:
+                self.in_flight.pop(event.user_name, None)
+                self.succeeded += 1
+            elif event.type == EventType.FAILED:
+                self.in_flight.pop(event.user_name, None)
+                self.failed += 1
+                self.errors[event.message.split(":")[0] or "Unknown"] += 1
+            elif event.type == EventType.RETRYING:
+                self.in_flight.pop(event.user_name, None)
+                self.retrying += 1
+
+    @staticmethod
+    def _next_stage(stage: str) -> str:
+        """Get the stage that follows a completed stage"""
+        order = ApplicationStage.ORDER
+        if stage in order and order.index(stage) + 1 < len(order):
+            return order[order.index(stage) + 1]
+        return stage
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self._draw()
+
+    def _render(self) -> List[str]:
+        """Render the current state as lines"""
+        with self._lock:
+            done = self.succeeded + self.failed
+            stages = Counter(self.in_flight.values())
+            errors = self.errors.most_common(self.MAX_ERROR_LINES)
+            succeeded, failed, retrying = self.succeeded, self.failed, self.retrying
+
+        elapsed = time.monotonic() - self.started_at
+        throughput = done / elapsed if elapsed > 0 else 0.0
+        remaining = max(self.total - done, 0)
+        eta = f"{remaining / throughput:.0f}s" if throughput > 0 else "--"
+
+        fraction = done / self.total if self.total else 1.0
+        filled = int(self.BAR_WIDTH * fraction)
+        bar = "█" * filled + "░" * (self.BAR_WIDTH - filled)
+        stage_summary = ", ".join(
+            f"{stage} {stages[stage]}"
+            for stage in ApplicationStage.ORDER
+            if stages[stage]
+        )
+
+        lines = [
+            f"{UIConstants.ROCKET_EMOJI} [{bar}] {done}/{self.total} {fraction:.0%}",
+            f"{self._paint(f'{UIConstants.SUCCESS_EMOJI} {succeeded}', 'green')}  "
+            f"{self._paint(f'{UIConstants.FAILED_EMOJI} {failed}', 'red')}  "
+            f"{UIConstants.RETRY_EMOJI} {retrying}  "
+            f"⚙️ in flight {sum(stages.values())}"
+            + (f" ({stage_summary})" if stage_summary else ""),
+            f"⚡ {throughput:.2f} acc/s  ⏱️ {elapsed:.0f}s elapsed  ETA {eta}",
+        ]
+        lines.extend(
+            self._paint(f"{UIConstants.WARNING_EMOJI} {error}: {count}", "yellow")
+            for error, count in errors
+        )
+        return lines
+
+    def _paint(self, text: str, color: str) -> str:
+        return _colored(text, color) if self.colored else text
+
+    def _draw(self, final: bool = False) -> None:
+        lines = self._render()
+
+        if not self.is_tty:
+            line = " | ".join(lines)
+            if line != self._last_line or final:
+                self.stream.write(line + "\n")
+                self._last_line = line
+            self.stream.flush()
+            return
+
+        output = []
+        if self._lines_drawn:
+            output.append(f"\033[{self._lines_drawn}F")
+        output.extend(f"\033[K{line}\n" for line in lines)
+        # Clear lines left over from a taller previous frame
+        for _ in range(self._lines_drawn - len(lines)):
+            output.append("\033[K\n")
+        self.stream.write("".join(output))
+        self.stream.flush()
+        self._lines_drawn = max(len(lines), self._lines_drawn)
@@ -0,0 +1,88 @@
+"""
+Run-level deadline shared by every request made on behalf of a run
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+
+class DeadlineExceeded(Exception):
+    """Raised when work is started after the run's deadline"""
+
+
+class Deadline:
+    """
+    Point on the time.monotonic() clock by which a run must be finished
+
+    Build one with ``after`` (a budget in seconds) or ``at`` (a wall-clock
+    timestamp such as an issue's closing time); the wall-clock form is
+    converted once, so later clock adjustments do not move it.
+    """
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def at(cls, timestamp: float) -> "Deadline":
+        return cls(time.monotonic() + (timestamp - time.time()))
+
+    @staticmethod
+    def earliest(*deadlines: Optional["Deadline"]) -> Optional["Deadline"]:
+        """The soonest of the given deadlines, ignoring None"""
+        present = [deadline for deadline in deadlines if deadline is not None]
+        return min(present, key=lambda d: d.expires_at, default=None)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def fits(self, seconds: float) -> bool:
+        """Whether work taking this long would finish in time"""
+        return time.monotonic() + seconds <= self.expires_at
+
+    def timeout(self, connect: float, read: float) -> Tuple[float, float]:
+        """
+        Clamp a (connect, read) timeout to the time left
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        left = self.remaining()
+        if left <= 0:
+            raise DeadlineExceeded("Run deadline reached")
+        return min(connect, left), min(read, left)
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the run the calling thread is working for, if any"""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make deadline current for the calling thread
+
+    Context variables are not inherited by new threads, so every worker
+    thread of a run enters the scope itself.
+    """
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
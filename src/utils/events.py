@@ -0,0 +1,65 @@
+"""
+In-process event bus for application pipeline progress
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Tuple
+
+
+@dataclass
+class ApplicationEvent:
+    """A single progress event emitted by the application pipeline"""
+
+    type: str
+    user_name: str = ""
+    stage: str = ""
+    message: str = ""
+    timestamp: float = field(default_factory=time.monotonic)
+
+
+EventCallback = Callable[[ApplicationEvent], None]
+
+
+class EventBus:
+    """
+    Synchronous publish/subscribe bus
+
+    Subscribers are called on the publishing thread, so they must be cheap
+    (update counters, enqueue) and must not block. The subscriber list is
+    copy-on-write, which keeps ``publish`` lock-free.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._subscribers: Tuple[EventCallback, ...] = ()
+
+    def subscribe(self, callback: EventCallback) -> None:
+        """Register a callback for all events"""
+        with self._lock:
+            self._subscribers = self._subscribers + (callback,)
+
+    def unsubscribe(self, callback: EventCallback) -> None:
+        """Remove a previously registered callback"""
+        with self._lock:
+            self._subscribers = tuple(
+                subscriber for subscriber in self._subscribers if subscriber != callback
+            )
+
+    def publish(self, event: ApplicationEvent) -> None:
+        """Deliver an event to every subscriber"""
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception:
+                self.logger.exception("Event subscriber failed for %s", event.type)
+
+    def emit(self, event_type: str, user_name: str = "", **kwargs) -> None:
+        """Build and publish an event"""
+        if self._subscribers:
+            self.publish(
+                ApplicationEvent(type=event_type, user_name=user_name, **kwargs)
+            )
@@ -0,0 +1,154 @@
+"""
+Fair work scheduler partitioned by key (e.g. depository participant)
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class FairScheduler(Generic[T]):
+    """
+    Round-robin scheduler over groups of work with two priority lanes
+
+    Items are grouped by ``key(item)`` and handed out one group at a time in
+    rotation, so a large or slow group at the front of the input cannot
+    hold back the others. An optional per-group limit caps how many items
+    of one group are in flight at once, and ``min_interval`` spaces out
+    dispatches globally.
+
+    First attempts and retries live in separate lanes: a retry is only
+    handed out when no first attempt can run, and may carry a not-before
+    time for backoff. ``admit_retry``, if given, is asked with the number
+    of queued first attempts before any retry is handed out while first
+    attempts are waiting (e.g. held back by the per-group limit); returning
+    False keeps the retry lane closed until they have run.
+
+    Workers call ``get`` until it returns None and must call ``done`` for
+    every item they received; ``get`` returns None once both lanes are
+    empty and nothing is in flight.
+    """
+
+    FIRST = "first"
+    RETRY = "retry"
+
+    def __init__(
+        self,
+        key: Callable[[T], Hashable],
+        per_key_limit: int = 0,
+        min_interval: float = 0.0,
+        admit_retry: Optional[Callable[[int], bool]] = None,
+    ):
+        self.key = key
+        self.per_key_limit = per_key_limit
+        self.min_interval = min_interval
+        self.admit_retry = admit_retry
+
+        self._cond = threading.Condition()
+        self._lanes: Dict[str, "OrderedDict[Hashable, Deque[Tuple[float, T]]]"] = {
+            self.FIRST: OrderedDict(),
+            self.RETRY: OrderedDict(),
+        }
+        self._in_flight: Dict[Hashable, int] = {}
+        self._running = 0
+        self._next_dispatch = 0.0
+        self._cancelled = False
+
+    def put(self, item: T, lane: str = FIRST, delay: float = 0.0) -> None:
+        """Queue an item, optionally not before delay seconds from now"""
+        with self._cond:
+            groups = self._lanes[lane]
+            group = groups.setdefault(self.key(item), deque())
+            group.append((time.monotonic() + delay, item))
+            self._cond.notify()
+
+    def get(self) -> Optional[T]:
+        """
+        Wait for the next runnable item
+
+        Returns:
+            The next item, or None when all work is finished or cancelled
+        """
+        with self._cond:
+            while True:
+                if self._cancelled:
+                    return None
+                if self._running == 0 and not self._queued():
+                    self._cond.notify_all()
+                    return None
+
+                now = time.monotonic()
+                if now < self._next_dispatch:
+                    self._cond.wait(self._next_dispatch - now)
+                    continue
+
+                item, wake_at = self._pick(now)
+                if item is not None:
+                    self._next_dispatch = now + self.min_interval
+                    return item
+
+                timeout = None if wake_at is None else max(wake_at - now, 0.0)
+                self._cond.wait(timeout)
+
+    def done(self, item: T) -> None:
+        """Release the slot held by an item returned from get"""
+        with self._cond:
+            key = self.key(item)
+            self._in_flight[key] -= 1
+            self._running -= 1
+            self._cond.notify_all()
+
+    def cancel(self) -> None:
+        """Stop handing out work; queued items are dropped"""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def pending(self) -> int:
+        """Number of queued items across both lanes"""
+        with self._cond:
+            return self._queued()
+
+    def _queued(self) -> int:
+        return sum(
+            len(group) for lane in self._lanes.values() for group in lane.values()
+        )
+
+    def _pick(self, now: float) -> Tuple[Optional[T], Optional[float]]:
+        """
+        Take the next runnable item, first-attempt lane before retries
+
+        Returns:
+            Tuple of (item or None, earliest time a waiting item becomes
+            ready, or None if nothing is waiting on time)
+        """
+        wake_at = None
+        for lane in (self.FIRST, self.RETRY):
+            groups = self._lanes[lane]
+            if lane == self.RETRY and self.admit_retry is not None:
+                waiting = sum(len(group) for group in self._lanes[self.FIRST].values())
+                if waiting and not self.admit_retry(waiting):
+                    break
+            for key in list(groups):
+                if self.per_key_limit and (
+                    self._in_flight.get(key, 0) >= self.per_key_limit
+                ):
+                    continue
+                group = groups[key]
+                ready_at, item = group[0]
+                if ready_at > now:
+                    wake_at = ready_at if wake_at is None else min(wake_at, ready_at)
+                    continue
+
+                group.popleft()
+                # Rotate: this group goes to the back of the lane
+                del groups[key]
+                if group:
+                    groups[key] = group
+                self._in_flight[key] = self._in_flight.get(key, 0) + 1
+                self._running += 1
+                return item, wake_at
+        return None, wake_at
@@ -0,0 +1,164 @@
+"""
+Hedged requests: a second copy of a slow idempotent call, within a budget
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Hashable, Optional, TypeVar
+
+from .capacity_simulator import percentile
+from .metrics import REGISTRY
+
+T = TypeVar("T")
+
+HEDGES = REGISTRY.counter(
+    "ipo_hedged_requests",
+    "Hedge decisions for slow reads: won, lost or denied by the budget",
+    ["endpoint", "outcome"],
+)
+
+
+class LatencyWindow:
+    """Recent latencies per key, for percentile estimates"""
+
+    def __init__(self, size: int = 256, min_samples: int = 20):
+        self.size = size
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[Hashable, Deque[float]] = {}
+
+    def observe(self, key: Hashable, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.size)
+            samples.append(seconds)
+
+    def percentile(self, key: Hashable, pct: float) -> Optional[float]:
+        """Percentile of recent samples, or None until min_samples are seen"""
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return percentile(sorted(samples), pct)
+
+
+class HedgeBudget:
+    """
+    Caps hedges at a fraction of all calls
+
+    Token bucket: every call deposits ``ratio`` tokens, up to ``burst``, and
+    every hedge spends one. Over any stretch of traffic hedges stay at or
+    below ``ratio`` of the calls plus ``burst``.
+    """
+
+    def __init__(self, ratio: float, burst: float = 5.0):
+        self.ratio = ratio
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = 0.0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class Hedger:
+    """
+    Run an idempotent call, and a second copy if the first is slow
+
+    Until a key has ``min_samples`` latencies the call simply runs on the
+    caller's thread. After that it runs on a pool thread; if it has not
+    finished within the key's recent ``pct`` percentile latency and the
+    budget allows, an identical call is started and whichever succeeds
+    first is returned. The loser is left to finish in the background and
+    its result discarded. Calls keep the caller's context variables (run
+    deadline, account attribution).
+
+    Size ``max_workers`` for two calls per concurrent caller so primaries
+    do not queue behind each other. The hedge delay is counted from when
+    the primary starts running, so time spent waiting for a pool thread
+    never triggers a hedge.
+
+    Only use this for calls that are safe to repeat.
+    """
+
+    def __init__(
+        self,
+        budget: HedgeBudget,
+        pct: float = 95.0,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        self.budget = budget
+        self.pct = pct
+        self.latency = LatencyWindow(min_samples=min_samples)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+
+    def call(self, key: Hashable, fn: Callable[[], T]) -> T:
+        self.budget.deposit()
+        delay = self.latency.percentile(key, self.pct)
+        if delay is None:
+            return self._timed(key, fn)
+
+        started = threading.Event()
+        primary = self._submit(key, fn, started)
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        if not self.budget.withdraw():
+            HEDGES.inc(str(key), "denied")
+            return primary.result()
+
+        hedge = self._submit(key, fn)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    HEDGES.inc(str(key), "won" if future is hedge else "lost")
+                    return future.result()
+                error = future.exception()
+        HEDGES.inc(str(key), "lost")
+        raise error
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    def _submit(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        started: Optional[threading.Event] = None,
+    ) -> "Future[T]":
+        context = contextvars.copy_context()
+        return self._pool.submit(context.run, self._timed, key, fn, started)
+
+    def _timed(
+        self,
+        key: Hashable,
+        fn: Callable[[], T],
+        started: Optional[threading.Event] = None,
+    ) -> T:
+        if started is not None:
+            started.set()
+        began = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            self.latency.observe(key, time.perf_counter() - began)
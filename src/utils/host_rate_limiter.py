@@ -0,0 +1,270 @@
+"""
+Host-wide request budget shared by every process through an mmap'd file
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from ..config.settings import get_settings
+from .metrics import REGISTRY
+
+HOST_RATE_WAIT = REGISTRY.counter(
+    "ipo_host_rate_wait_seconds", "Time spent waiting on the host-wide rate budget"
+)
+
+MAGIC = b"IPRL"
+# magic, slot count, tokens, last refill (time.monotonic, host-wide clock)
+HEADER = struct.Struct("<4sIdd")
+# pid (0 = free), waiting flag, last seen, virtual time, tokens granted
+SLOT = struct.Struct("<iiddQ")
+
+
+class HostRateLimiter:
+    """
+    Token bucket shared by all processes on the host
+
+    State lives in a small memory-mapped file: the bucket (``rate`` tokens
+    per second, up to ``burst``) and one slot per process. Every request
+    takes one token. Updates happen under an exclusive file lock held only
+    for a few struct reads and writes; waiting happens outside it.
+
+    Fair share: each process slot has a virtual time that advances by one
+    per token taken. While several processes are waiting, a token goes only
+    to a waiter whose virtual time is the lowest, so they split the budget
+    evenly however many threads each runs; an idle process does not hold
+    others back. A new or returning process starts at the lowest active
+    virtual time, and a slot not seen for ``stale_after`` seconds (e.g. a
+    killed process) is ignored and later reused.
+
+    Args:
+        path: Shared state file (created if missing)
+        rate: Tokens per second for the whole host
+        burst: Bucket capacity (default: one second of tokens)
+        slots: Maximum number of processes tracked at once
+        stale_after: Seconds after which a silent slot is considered dead
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rate: float,
+        burst: Optional[float] = None,
+        slots: int = 64,
+        stale_after: float = 5.0,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.path = Path(path)
+        self.rate = rate
+        self.burst = max(burst or rate, 1.0)
+        self.slots = slots
+        self.stale_after = stale_after
+
+        self._thread_lock = threading.Lock()
+        self._size = HEADER.size + SLOT.size * slots
+        self._fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o666)
+        self._pid: Optional[int] = None
+        self._slot: Optional[int] = None
+
+        self._lock_file()
+        try:
+            if os.fstat(self._fd).st_size < self._size:
+                os.ftruncate(self._fd, self._size)
+                self._map = mmap.mmap(self._fd, self._size)
+                self._map[: self._size] = bytes(self._size)
+                HEADER.pack_into(
+                    self._map, 0, MAGIC, slots, self.burst, time.monotonic()
+                )
+            else:
+                self._map = mmap.mmap(self._fd, self._size)
+                magic, stored_slots, _, _ = HEADER.unpack_from(self._map, 0)
+                if magic != MAGIC or stored_slots != slots:
+                    raise ValueError(f"{self.path} is not a rate budget file")
+        finally:
+            self._unlock_file()
+
+    def acquire(self) -> float:
+        """
+        Block until this process may send one request
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = time.monotonic()
+        with self._thread_lock:
+            # One thread per process queues on the host budget at a time;
+            # the others wait here, which keeps per-process fairness simple
+            while True:
+                delay = self._try_take()
+                if delay == 0.0:
+                    break
+                time.sleep(delay)
+
+        waited = time.monotonic() - started
+        if waited > 0.001:
+            HOST_RATE_WAIT.inc(amount=waited)
+        return waited
+
+    def close(self) -> None:
+        """Release this process's slot and unmap the file"""
+        with self._thread_lock:
+            if self._slot is not None and self._pid == os.getpid():
+                self._lock_file()
+                try:
+                    SLOT.pack_into(
+                        self._map, self._offset(self._slot), 0, 0, 0.0, 0.0, 0
+                    )
+                finally:
+                    self._unlock_file()
+            self._map.close()
+            os.close(self._fd)
+
+    def snapshot(self) -> Dict:
+        """Current bucket level and live process slots"""
+        self._lock_file()
+        try:
+            now = time.monotonic()
+            _, _, tokens, _ = HEADER.unpack_from(self._map, 0)
+            processes = [
+                {
+                    "pid": pid,
+                    "waiting": bool(waiting),
+                    "vtime": vtime,
+                    "granted": granted,
+                }
+                for pid, waiting, seen, vtime, granted in self._read_slots()
+                if pid and now - seen < self.stale_after
+            ]
+        finally:
+            self._unlock_file()
+        return {"tokens": tokens, "processes": processes}
+
+    def _try_take(self) -> float:
+        """Take a token if allowed; returns 0.0 or seconds to wait before retrying"""
+        self._lock_file()
+        try:
+            now = time.monotonic()
+            slot = self._own_slot(now)
+
+            magic, slots, tokens, updated = HEADER.unpack_from(self._map, 0)
+            tokens = min(self.burst, tokens + max(now - updated, 0.0) * self.rate)
+
+            rows = self._read_slots()
+            pid, _, _, vtime, granted = rows[slot]
+            competing = [
+                row[3]
+                for index, row in enumerate(rows)
+                if index != slot
+                and row[0]
+                and row[1]
+                and now - row[2] < self.stale_after
+            ]
+            my_turn = not competing or vtime <= min(competing)
+
+            if tokens >= 1.0 and my_turn:
+                tokens -= 1.0
+                SLOT.pack_into(
+                    self._map, self._offset(slot), pid, 0, now, vtime + 1.0, granted + 1
+                )
+                HEADER.pack_into(self._map, 0, magic, slots, tokens, now)
+                return 0.0
+
+            SLOT.pack_into(self._map, self._offset(slot), pid, 1, now, vtime, granted)
+            HEADER.pack_into(self._map, 0, magic, slots, tokens, now)
+            if tokens < 1.0:
+                return (1.0 - tokens) / self.rate
+            # Tokens are there but another process is behind on its share
+            return min(0.5 / self.rate, 0.05)
+        finally:
+            self._unlock_file()
+
+    def _own_slot(self, now: float) -> int:
+        """Find or claim this process's slot; caller holds the file lock"""
+        pid = os.getpid()
+        rows = self._read_slots()
+        live = [row[3] for row in rows if row[0] and now - row[2] < self.stale_after]
+
+        if self._pid == pid and self._slot is not None and rows[self._slot][0] == pid:
+            index = self._slot
+            _, waiting, seen, vtime, granted = rows[index]
+            if now - seen >= self.stale_after:
+                # Idle for a while: rejoin at the front of the active pack
+                vtime = max(vtime, min(live, default=vtime))
+                SLOT.pack_into(
+                    self._map, self._offset(index), pid, waiting, now, vtime, granted
+                )
+            return index
+
+        free = [
+            index
+            for index, row in enumerate(rows)
+            if not row[0] or now - row[2] >= self.stale_after
+        ]
+        if not free:
+            raise RuntimeError(f"All {self.slots} rate budget slots are in use")
+
+        index = free[0]
+        SLOT.pack_into(
+            self._map, self._offset(index), pid, 0, now, min(live, default=0.0), 0
+        )
+        self._pid, self._slot = pid, index
+        return index
+
+    def _read_slots(self) -> List[tuple]:
+        return [
+            SLOT.unpack_from(self._map, self._offset(index))
+            for index in range(self.slots)
+        ]
+
+    @staticmethod
+    def _offset(index: int) -> int:
+        return HEADER.size + SLOT.size * index
+
+    def _lock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self) -> None:
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+
+# Shared instance, so every client in the process draws from one slot
+_limiter: Optional[HostRateLimiter] = None
+_limiter_pid: Optional[int] = None
+_limiter_lock = threading.Lock()
+
+
+def get_host_rate_limiter() -> Optional[HostRateLimiter]:
+    """Get the process-wide host limiter (None when HOST_RATE_LIMIT is 0)"""
+    global _limiter, _limiter_pid
+    settings = get_settings()
+    if not settings.HOST_RATE_LIMIT:
+        return None
+    with _limiter_lock:
+        # A forked child must not share the parent's file lock
+        if _limiter is None or _limiter_pid != os.getpid():
+            _limiter_pid = os.getpid()
+            _limiter = HostRateLimiter(
+                settings.host_rate_path,
+                settings.HOST_RATE_LIMIT,
+                settings.HOST_RATE_BURST or None,
+            )
+    return _limiter
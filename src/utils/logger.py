@@ -2,33 +2,100 @@
 Logging utilities
 """
 
+import atexit
+import json
 import logging
 import logging.handlers
+import queue
+import random
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from ..config.settings import get_settings
 
+# Background listener draining the log queue
+_listener: Optional[logging.handlers.QueueListener] = None
+# Terminal handler, so live views can quiet it while they draw
+_console_handler: Optional[logging.Handler] = None
+
+
+class LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates its directory and file on first write"""
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as JSON lines for structured log processing"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep only a fraction of DEBUG records; other levels always pass"""
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
 
 def setup_logging(
-    level: str = "INFO",
+    level: Optional[str] = None,
     log_file: Optional[str] = None,
     max_bytes: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
+    json_output: Optional[bool] = None,
+    debug_sample_rate: Optional[float] = None,
 ) -> None:
     """
     Setup application logging
 
+    Records are put on an in-memory queue by the calling thread and written
+    to the console and rotating file by a background listener, so worker
+    threads never wait on file I/O or rotation.
+
     Args:
-        level: Logging level
+        level: Logging level (default: settings)
         log_file: Optional log file path
         max_bytes: Maximum log file size
         backup_count: Number of backup files to keep
+        json_output: Write the log file as JSON lines (default: settings)
+        debug_sample_rate: Fraction of DEBUG records to keep (default: settings)
     """
     settings = get_settings()
 
-    # Create log directory if it doesn't exist
-    settings.log_dir_path.mkdir(exist_ok=True)
+    if level is None:
+        level = settings.LOG_LEVEL
+    if json_output is None:
+        json_output = settings.LOG_JSON
+    if debug_sample_rate is None:
+        debug_sample_rate = settings.LOG_DEBUG_SAMPLE_RATE
+
+    # Stop a listener left over from a previous setup
+    shutdown_logging()
 
     # Configure root logger
     root_logger = logging.getLogger()
@@ -47,20 +114,65 @@ def setup_logging(
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler
     if log_file is None:
-        log_file = settings.log_dir_path / "bulk_ipo.log"
+        log_file = settings.log_dir_path / (
+            "bulk_ipo.jsonl" if json_output else "bulk_ipo.log"
+        )
     else:
         log_file = Path(log_file)
 
-    file_handler = logging.handlers.RotatingFileHandler(
+    # Directory and file are only created once something is logged
+    file_handler = LazyRotatingFileHandler(
         log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.setFormatter(JsonFormatter() if json_output else formatter)
+
+    # Queue handler on the hot path, writers on the listener thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    if debug_sample_rate < 1.0:
+        queue_handler.addFilter(DebugSamplingFilter(debug_sample_rate))
+    root_logger.addHandler(queue_handler)
+
+    global _listener, _console_handler
+    _console_handler = console_handler
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def set_console_level(level: int) -> Optional[int]:
+    """
+    Change the console handler's threshold; the log file is unaffected
+
+    Live views that redraw the terminal raise it to WARNING while they
+    draw, since per-account INFO records would break the redraw.
+
+    Returns:
+        The previous level, or None if logging is not set up
+    """
+    if _console_handler is None:
+        return None
+    previous = _console_handler.level
+    _console_handler.setLevel(level)
+    return previous
 
 
 def get_logger(name: str) -> logging.Logger:
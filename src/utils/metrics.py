@@ -0,0 +1,280 @@
+"""
+Lock-light in-process metrics with an OpenMetrics HTTP exporter
+"""
+
+import bisect
+import copy
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Sharded:
+    """
+    Per-thread storage merged on read
+
+    Each thread writes only to its own dict, so updates take no lock; the
+    lock is only taken once per thread to register its shard and when a
+    scrape collects the shards. Copying a dict is atomic under the GIL,
+    which is all a scrape needs from a shard another thread is writing.
+    Shards of finished threads are folded into one retired shard, on
+    scrape and whenever a new thread registers, so short-lived workers do
+    not pile up in a process that is never scraped.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[Tuple[threading.Thread, Dict]] = []
+        self._retired: Dict = {}
+
+    def _shard(self) -> Dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._retire_finished()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _retire_finished(self) -> None:
+        """Fold shards of finished threads into the retired shard (lock held)"""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                self._merge(self._retired, shard.copy())
+        self._shards = live
+
+    def _collect(self) -> List[Dict]:
+        with self._lock:
+            self._retire_finished()
+            live = list(self._shards)
+            retired = {key: copy.copy(value) for key, value in self._retired.items()}
+        return [retired] + [shard.copy() for _, shard in live]
+
+    def _merged(self) -> Dict:
+        totals: Dict = {}
+        for shard in self._collect():
+            self._merge(totals, shard)
+        return totals
+
+    def _merge(self, into: Dict, shard: Dict) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Sharded):
+    """Monotonic counter with optional labels"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[label_values] = shard.get(label_values, 0.0) + amount
+
+    def _merge(self, into: Dict, shard: Dict) -> None:
+        for key, value in shard.items():
+            into[key] = into.get(key, 0.0) + value
+
+    def values(self) -> Dict[LabelValues, float]:
+        return self._merged()
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        return [("_total", key, value) for key, value in self.values().items()]
+
+
+class Gauge(Counter):
+    """Up/down gauge; inc and dec for one item must happen on one thread"""
+
+    type = "gauge"
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        return [("", key, value) for key, value in self.values().items()]
+
+
+class Histogram(_Sharded):
+    """Cumulative-bucket histogram with optional labels"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *label_values: str) -> None:
+        shard = self._shard()
+        entry = shard.get(label_values)
+        if entry is None:
+            # [bucket counts..., +Inf count, sum]
+            entry = shard[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        entry[bisect.bisect_left(self.buckets, value)] += 1
+        entry[-1] += value
+
+    def _merge(self, into: Dict, shard: Dict) -> None:
+        for key, entry in shard.items():
+            entry = list(entry)
+            total = into.setdefault(key, [0] * len(entry))
+            for i, value in enumerate(entry):
+                total[i] += value
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        samples = []
+        for key, entry in self._merged().items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), entry[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                samples.append(("_bucket", key + (("le", le),), cumulative))
+            samples.append(("_count", key, cumulative))
+            samples.append(("_sum", key, entry[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered in OpenMetrics text format"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels=()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self, name: str, documentation: str, labels=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        """Render all metrics as OpenMetrics text"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            for suffix, key, value in metric.samples():
+                lines.append(
+                    f"{metric.name}{suffix}{self._labels(metric.labels, key)} "
+                    f"{_format(value)}"
+                )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(names: Tuple[str, ...], key: LabelValues) -> str:
+        pairs = list(zip(names, key))
+        # Histogram buckets append ("le", bound) after the label values
+        pairs += [item for item in key[len(names) :] if isinstance(item, tuple)]
+        if not pairs:
+            return ""
+        rendered = ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs)
+        return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Process-wide registry used by the client and services
+REGISTRY = MetricsRegistry()
+
+
+class MetricsServer:
+    """
+    Background HTTP server exposing a registry at /metrics
+
+    Rendering happens on the server thread and only copies shards, so a
+    scrape never blocks the workers updating metrics.
+    """
+
+    CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+    def __init__(
+        self,
+        port: int,
+        host: str = "127.0.0.1",
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        from http.server import ThreadingHTTPServer
+
+        self.registry = registry or REGISTRY
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        """Serve on a daemon thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _make_handler(self):
+        from http.server import BaseHTTPRequestHandler
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", exporter.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
@@ -0,0 +1,355 @@
+"""
+Local stand-in for the MeroShare backend used by benchmarks and soak runs
+"""
+
+import gzip
+import hashlib
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open a hundred or more connections at once; the default
+    # listen backlog of 5 would drop SYNs and add retransmit delays
+    request_queue_size = 256
+
+
+class MockMeroShareServer:
+    """
+    Minimal threaded HTTP server implementing the endpoints the client uses
+
+    Any credentials are accepted. Each username gets a stable demat/BOID,
+    every call sleeps for the configured latency, and each account can
+    apply once per issue (a second apply returns 409 like the real
+    backend). Intended for local benchmarks only.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        issues: Optional[list] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.issues = issues or [
+            {
+                "companyShareId": 1,
+                "companyName": "Mock Hydropower Limited",
+                "scrip": "MHL",
+                "shareTypeName": "IPO",
+                "shareGroupName": "Ordinary Shares",
+                "minUnit": 10,
+                "maxUnit": 1000,
+                "issueOpenDate": "2026-01-01",
+                "issueCloseDate": "2099-12-31",
+            }
+        ]
+        self.requests: Counter = Counter()
+        self.rejected_logins: set = set()  # usernames whose login returns 401
+        self.clock_offset = 0.0  # added to the time in Date headers
+        self.opens_at: Optional[float] = None  # earlier applies get 400
+        self.apply_times: Dict[tuple, float] = {}  # server time of each apply
+        # "METHOD /path/prefix" -> number of matching requests left to hang
+        self.stalls: Counter = Counter()
+        self.stall_seconds = 60.0
+        # Fraction of requests that take tail_latency seconds longer
+        self.tail_ratio = 0.0
+        self.tail_latency = 1.0
+        # gzip bodies of at least this many bytes when the client accepts
+        # it, like a typical front-end proxy; None disables compression
+        self.compress_min_bytes: Optional[int] = 256
+        self.applied: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, str] = {}
+        self._logins = 0
+        self._thread: Optional[threading.Thread] = None
+        self._server = _Server((host, port), self._make_handler())
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to use as API_BASE_URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "MockMeroShareServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-meroshare", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockMeroShareServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @staticmethod
+    def demat_for(username: str) -> str:
+        """Stable 16-digit demat number for a username"""
+        digest = hashlib.sha1(username.encode("utf-8")).hexdigest()
+        return "1301" + str(int(digest, 16))[:12].zfill(12)
+
+    def _delay(self) -> None:
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+        if self.tail_ratio and random.random() < self.tail_ratio:
+            delay += self.tail_latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _stall(self, method: str, path: str) -> None:
+        """Hang the request if a stall is armed for it"""
+        path = path.split("?", 1)[0]
+        if path.startswith("/api"):
+            path = path[len("/api") :]
+        with self._lock:
+            armed = next(
+                (
+                    key
+                    for key, left in self.stalls.items()
+                    if left > 0 and f"{method} {path}".startswith(key)
+                ),
+                None,
+            )
+            if armed is not None:
+                self.stalls[armed] -= 1
+        if armed is not None:
+            time.sleep(self.stall_seconds)
+
+    def _route(self, method: str, path: str, headers, body: Optional[dict]):
+        """Return (status, payload, extra headers) for a request"""
+        path = path.split("?", 1)[0]
+        if path.startswith("/api"):
+            path = path[len("/api") :]
+
+        with self._lock:
+            self.requests[f"{method} {path}"] += 1
+
+        if method == "POST" and path == "/meroShare/auth/":
+            username = (body or {}).get("username", "")
+            if username in self.rejected_logins:
+                return 401, {"message": "Invalid credentials"}, {}
+            with self._lock:
+                # Each login gets a new token, like the real backend
+                self._logins += 1
+                seed = f"{username}:{self._logins}"
+                token = "mock-" + hashlib.sha1(seed.encode("utf-8")).hexdigest()[:24]
+                self._tokens[token] = username
+            return 200, {"message": "Log in successful."}, {"Authorization": token}
+
+        with self._lock:
+            username = self._tokens.get(headers.get("Authorization", ""))
+        if username is None:
+            return 401, {"message": "Invalid token"}, {}
+
+        demat = self.demat_for(username)
+
+        if method == "GET" and path == "/meroShare/ownDetail/":
+            return 200, {"demat": demat, "boid": demat[-8:], "name": username}, {}
+        if method == "GET" and path.startswith("/meroShareView/myDetail/"):
+            return 200, {"boid": demat, "bankCode": "MOCK"}, {}
+        if method == "GET" and path.startswith("/bankRequest/"):
+            return (
+                200,
+                {
+                    "bank": {"id": 11},
+                    "branch": {"id": 22},
+                    "accountNumber": "000123",
+                    "accountTypeId": 1,
+                },
+                {},
+            )
+        if method == "GET" and path == "/meroShare/bank/":
+            return 200, [{"id": 11, "name": "Mock Bank"}], {}
+        if method == "GET" and path.startswith("/meroShare/bank/"):
+            return (
+                200,
+                [{"id": 33, "accountBranchId": 22, "accountNumber": "000123"}],
+                {},
+            )
+        if method == "GET" and path.startswith("/shareCriteria/"):
+            return 200, {"status": "CAN_APPLY", "message": "Eligible"}, {}
+        if method == "POST" and path == "/meroShare/companyShare/applicableIssue/":
+            page = int((body or {}).get("page", 1))
+            size = int((body or {}).get("size", 10))
+            start = (page - 1) * size
+            return (
+                200,
+                {
+                    "object": self.issues[start : start + size],
+                    "totalCount": len(self.issues),
+                },
+                {},
+            )
+        if method == "POST" and path == "/meroShare/applicantForm/active/search/":
+            issues = {issue["companyShareId"]: issue for issue in self.issues}
+            with self._lock:
+                applied = [
+                    company_id for (owner, company_id) in self.applied if owner == demat
+                ]
+            entries = [
+                {
+                    "companyShareId": company_id,
+                    "companyName": issues.get(company_id, {}).get("companyName", ""),
+                    "scrip": issues.get(company_id, {}).get("scrip", ""),
+                    "statusName": "TRANSACTION_SUCCESS",
+                }
+                for company_id in reversed(applied)
+            ]
+            page = int((body or {}).get("page", 1))
+            size = int((body or {}).get("size", 10))
+            start = (page - 1) * size
+            return (
+                200,
+                {"object": entries[start : start + size], "totalCount": len(entries)},
+                {},
+            )
+        if method == "POST" and path == "/meroShare/applicantForm/share/apply/":
+            key = (demat, (body or {}).get("companyShareId"))
+            now = time.time() + self.clock_offset
+            if self.opens_at is not None and now < self.opens_at:
+                return 400, {"message": "Issue is not open yet"}, {}
+            with self._lock:
+                self.apply_times.setdefault(key, now)
+                if key in self.applied:
+                    return 409, {"message": "Already applied"}, {}
+                self.applied[key] = body
+            return 201, {"message": "Share has been applied successfully."}, {}
+
+        return 404, {"message": f"Unknown endpoint {method} {path}"}, {}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle on,
+            # delayed ACKs would add ~40ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def date_time_string(self, timestamp=None):
+                if timestamp is None:
+                    timestamp = time.time() + server.clock_offset
+                return super().date_time_string(timestamp)
+
+            def _handle(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+
+                server._delay()
+                server._stall(method, self.path)
+                status, payload, extra = server._route(
+                    method, self.path, self.headers, body
+                )
+
+                data = json.dumps(payload).encode("utf-8")
+                gzipped = (
+                    server.compress_min_bytes is not None
+                    and len(data) >= server.compress_min_bytes
+                    and "gzip" in self.headers.get("Accept-Encoding", "")
+                )
+                if gzipped:
+                    data = gzip.compress(data)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+        return Handler
+
+
+def _serve(conn, options: dict) -> None:
+    """Child process body for MockServerProcess"""
+    server = MockMeroShareServer(**options).start()
+    try:
+        conn.send(server.base_url)
+        conn.recv()  # parent asks to stop, or EOFError when it is gone
+    except EOFError:
+        pass
+    finally:
+        server.stop()
+
+
+class MockServerProcess:
+    """
+    MockMeroShareServer running in a child process
+
+    Keeps the server's threads, sockets and its ever-growing record of
+    logins and applications out of the calling process, so a soak run
+    measures only the client side. Takes the same keyword arguments as
+    MockMeroShareServer.
+    """
+
+    def __init__(self, **options):
+        self.options = options
+        self.base_url: Optional[str] = None
+        self._conn = None
+        self._process = None
+
+    def start(self) -> "MockServerProcess":
+        # spawn, not fork: the parent may already be running threads
+        context = multiprocessing.get_context("spawn")
+        self._conn, child = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(child, self.options),
+            name="mock-meroshare",
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+        self.base_url = self._conn.recv()
+        return self
+
+    def stop(self) -> None:
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join(5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+        self._process = None
+
+    def __enter__(self) -> "MockServerProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
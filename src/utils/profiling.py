@@ -0,0 +1,336 @@
+"""
+Opt-in profiling of the bulk phase: cProfile, stack sampling, tracemalloc
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Source files whose functions are labelled with their class in reports
+LABELLED_FILES = {
+    os.path.join("services", "application_service.py"): "ApplicationService",
+    os.path.join("api", "meroshare_client.py"): "MeroShareClient",
+}
+
+# Where a thread is, judged by the innermost frame's file
+CATEGORIES = (
+    ("network", ("socket.py", "ssl.py", "selectors.py", "http/client.py")),
+    ("json", ("json/decoder.py", "json/encoder.py", "json/__init__.py")),
+    ("logging", ("logging/__init__.py", "logging/handlers.py")),
+    ("waiting", ("threading.py", "queue.py", "concurrent/futures")),
+)
+
+_active: Optional["ProfileSession"] = None
+
+
+def install(session: Optional["ProfileSession"]) -> None:
+    """Install the session that profile_phase reports to (None to remove)"""
+    global _active
+    _active = session
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Profile a block if a session is installed, otherwise do nothing"""
+    if _active is None:
+        yield
+        return
+    with _active.phase(name):
+        yield
+
+
+def label_for(filename: str, function: str) -> Optional[str]:
+    """Label a function in one of the hot-path modules, e.g. Class.method"""
+    for suffix, owner in LABELLED_FILES.items():
+        if filename.endswith(suffix):
+            return f"{owner}.{function}"
+    return None
+
+
+def category_for(filename: str) -> str:
+    """Classify a frame by the module it is executing"""
+    normalized = filename.replace(os.sep, "/")
+    for category, markers in CATEGORIES:
+        if any(
+            normalized.endswith(marker) or marker in normalized for marker in markers
+        ):
+            return category
+    return "python"
+
+
+class StackSampler:
+    """
+    Low-overhead wall-clock sampler for all threads
+
+    A daemon thread reads ``sys._current_frames()`` every ``interval``
+    seconds and counts, per sample, the innermost frame (self time), every
+    labelled ApplicationService/MeroShareClient function on the stack and
+    what the thread was doing (network, json, logging, waiting, python).
+    Cost is independent of call volume, unlike cProfile.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = 0
+        self.self_time: Counter = Counter()
+        self.hot_paths: Counter = Counter()
+        self.hot_path_categories: Dict[str, Counter] = {}
+        self.categories: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own:
+                    self._record(frame)
+
+    def _record(self, frame) -> None:
+        code = frame.f_code
+        category = category_for(code.co_filename)
+        self.samples += 1
+        self.categories[category] += 1
+        self.self_time[(code.co_filename, frame.f_lineno, code.co_name)] += 1
+
+        seen = set()
+        while frame is not None:
+            label = label_for(frame.f_code.co_filename, frame.f_code.co_name)
+            if label is not None and label not in seen:
+                seen.add(label)
+                self.hot_paths[label] += 1
+                self.hot_path_categories.setdefault(label, Counter())[category] += 1
+            frame = frame.f_back
+
+    def report(self, top: int = 25) -> str:
+        """Render the collected samples as text"""
+        total = self.samples or 1
+        lines = [
+            f"Samples: {self.samples} (every {self.interval * 1000:.1f} ms, all threads)",
+            "",
+            "Thread time by activity:",
+        ]
+        for category, count in self.categories.most_common():
+            lines.append(f"  {category:<10} {100.0 * count / total:6.1f}%")
+
+        lines += ["", "Hot paths (share of samples on stack, by activity):"]
+        for label, count in self.hot_paths.most_common(top):
+            split = ", ".join(
+                f"{category} {100.0 * n / count:.0f}%"
+                for category, n in self.hot_path_categories[label].most_common(3)
+            )
+            lines.append(f"  {100.0 * count / total:6.1f}%  {label}  [{split}]")
+
+        lines += ["", "Top frames (self):"]
+        for (filename, lineno, function), count in self.self_time.most_common(top):
+            lines.append(
+                f"  {100.0 * count / total:6.1f}%  {function} "
+                f"({_short_path(filename)}:{lineno})"
+            )
+        return "\n".join(lines)
+
+
+class ThreadedProfile:
+    """
+    cProfile across every thread started while it is enabled
+
+    Before Python 3.12 cProfile only sees the thread that enables it, so a
+    profile hook is installed for new threads that switches each one over
+    to its own cProfile.Profile on its first event; stats are merged at
+    the end. From 3.12 cProfile is built on sys.monitoring, which sees all
+    threads but allows one profiler per process, so a single profile is
+    used instead.
+    """
+
+    PER_THREAD = sys.version_info < (3, 12)
+
+    def __init__(self):
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def _bootstrap(self, frame, event, arg) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def start(self) -> None:
+        if self.PER_THREAD:
+            threading.setprofile(self._bootstrap)
+        self._bootstrap(None, "call", None)
+
+    def stop(self) -> None:
+        if self.PER_THREAD:
+            threading.setprofile(None)
+        with self._lock:
+            profiles = list(self._profiles)
+        # A profile can only unhook the thread calling disable(); for the
+        # others this flushes their open calls and marks them disabled.
+        # Bulk workers have exited by now, so none are still recording.
+        for profile in profiles:
+            profile.disable()
+
+    def stats(self) -> pstats.Stats:
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+
+class ProfileSession:
+    """
+    Profiling requested on the command line for one process
+
+    Args:
+        output_dir: Directory for reports (next to the results file)
+        mode: "cprofile", "sample" or None
+        trace_memory: Take tracemalloc snapshots before and after each phase
+        interval: Sampling interval for the "sample" mode
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        mode: Optional[str] = None,
+        trace_memory: bool = False,
+        interval: float = 0.005,
+    ):
+        if mode not in (None, "cprofile", "sample"):
+            raise ValueError("mode must be 'cprofile' or 'sample'")
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.trace_memory = trace_memory
+        self.interval = interval
+        self.reports: List[Path] = []
+        self.logger = logging.getLogger(__name__)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Profile one phase and write its reports when it ends"""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        base = self.output_dir / f"profile-{name}-{stamp}"
+
+        snapshot = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(25)
+            snapshot = tracemalloc.take_snapshot()
+
+        profiler = None
+        if self.mode == "cprofile":
+            profiler = ThreadedProfile()
+        elif self.mode == "sample":
+            profiler = StackSampler(self.interval)
+
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.start()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.stop()
+            elapsed = time.perf_counter() - started
+            # Snapshot before building reports so their allocations don't count
+            after = tracemalloc.take_snapshot() if snapshot is not None else None
+
+            if isinstance(profiler, ThreadedProfile):
+                self._write_cprofile(profiler, base, name, elapsed)
+            elif isinstance(profiler, StackSampler):
+                self._write(
+                    base.with_suffix(".txt"),
+                    f"Phase: {name} ({elapsed:.2f}s wall)\n\n{profiler.report()}\n",
+                )
+            if snapshot is not None:
+                self._write_memory(snapshot, after, base, name)
+
+    def _write_cprofile(
+        self, profiler: ThreadedProfile, base: Path, name: str, elapsed: float
+    ) -> None:
+        stats = profiler.stats()
+        base.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(str(base.with_suffix(".prof")))
+        self.reports.append(base.with_suffix(".prof"))
+
+        hot_paths: List[Tuple[float, str]] = []
+        for (filename, lineno, function), row in stats.stats.items():
+            label = label_for(filename, function)
+            if label is not None:
+                calls, cumulative = row[1], row[3]
+                hot_paths.append((cumulative, f"{label}  ({calls} calls)"))
+        hot_paths.sort(reverse=True)
+
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats("cumulative").print_stats(30)
+        stats.sort_stats("tottime").print_stats(20)
+
+        lines = [
+            f"Phase: {name} ({elapsed:.2f}s wall, all threads)",
+            "",
+            "Hot paths (cumulative seconds summed over threads):",
+        ]
+        lines += [f"  {seconds:9.3f}s  {label}" for seconds, label in hot_paths[:25]]
+        lines += ["", stream.getvalue()]
+        self._write(base.with_suffix(".txt"), "\n".join(lines))
+
+    def _write_memory(self, before, after, base: Path, name: str) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        filters = [
+            tracemalloc.Filter(False, module.__file__)
+            for module in (tracemalloc, cProfile, pstats)
+        ] + [tracemalloc.Filter(False, __file__)]
+        diff = after.filter_traces(filters).compare_to(
+            before.filter_traces(filters), "lineno"
+        )
+
+        lines = [
+            f"Phase: {name}",
+            f"Traced memory: {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak",
+            "",
+            "Top allocation growth by line:",
+        ]
+        lines += [f"  {stat}" for stat in diff[:25]]
+        self._write(Path(f"{base}-memory.txt"), "\n".join(lines) + "\n")
+
+    def _write(self, path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        self.reports.append(path)
+        self.logger.info("Profile report written to %s", path)
+
+
+def _short_path(filename: str) -> str:
+    """Trim site-packages / repo prefixes from a file path"""
+    parts = Path(filename).parts
+    for marker in ("site-packages", "src", "lib"):
+        if marker in parts:
+            index = len(parts) - 1 - parts[::-1].index(marker)
+            return os.path.join(*parts[index:])
+    return filename
@@ -0,0 +1,237 @@
+"""
+Release of prepared requests at a target server time
+"""
+
+import contextvars
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from .clock_skew import ClockSkewEstimator
+from .capacity_simulator import percentile
+from .metrics import REGISTRY
+
+T = TypeVar("T")
+
+RELEASE_JITTER = REGISTRY.histogram(
+    "ipo_release_jitter_seconds",
+    "Delay between the scheduled release time and each first-wave send",
+    buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+_on_send: contextvars.ContextVar[Optional[Callable[[], None]]] = contextvars.ContextVar(
+    "release_on_send", default=None
+)
+
+
+def mark_send() -> None:
+    """Called by the client just before a request is handed to the network"""
+    callback = _on_send.get()
+    if callback is not None:
+        callback()
+
+
+@dataclass
+class ReleaseReport:
+    """How closely a scheduled release hit its target"""
+
+    target_server_time: float
+    offset_seconds: float
+    offset_uncertainty: Optional[float]
+    clock_samples: int
+    rtt_seconds: Optional[float]
+    released: int = 0
+    # Send time minus release time, for the first request of each worker
+    first_wave: List[float] = field(default_factory=list)
+    # Send time minus release time of the last request
+    last_release: float = 0.0
+
+    @property
+    def jitter_p50(self) -> float:
+        return percentile(sorted(self.first_wave), 50)
+
+    @property
+    def jitter_p95(self) -> float:
+        return percentile(sorted(self.first_wave), 95)
+
+    @property
+    def jitter_max(self) -> float:
+        return max(self.first_wave, default=0.0)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization"""
+        return {
+            "target_server_time": self.target_server_time,
+            "offset_seconds": round(self.offset_seconds, 4),
+            "offset_uncertainty": (
+                None
+                if self.offset_uncertainty is None
+                else round(self.offset_uncertainty, 4)
+            ),
+            "clock_samples": self.clock_samples,
+            "rtt_seconds": (
+                None if self.rtt_seconds is None else round(self.rtt_seconds, 4)
+            ),
+            "released": self.released,
+            "jitter_p50_ms": round(self.jitter_p50 * 1000, 3),
+            "jitter_p95_ms": round(self.jitter_p95 * 1000, 3),
+            "jitter_max_ms": round(self.jitter_max * 1000, 3),
+            "last_release_ms": round(self.last_release * 1000, 3),
+        }
+
+
+class ReleaseScheduler:
+    """
+    Fire prepared work at a target time on the server's clock
+
+    The target is converted once to a time.monotonic() deadline using the
+    clock estimator, so wall-clock adjustments while waiting do not move
+    it. To avoid being early, the conversion uses the lower bound of the
+    offset interval: at release the server's clock has reached the target
+    even in the worst case. ``lead`` moves the release earlier by a fixed
+    amount, e.g. part of the one-way network delay.
+
+    The calling thread sleeps until just before the deadline and spins for
+    the rest, then opens a gate that ``workers`` pre-started threads are
+    blocked on. Each worker sends items from a shared queue until it is
+    empty, so the first ``workers`` items go out together.
+
+    ``warm``, if given, is called on every worker thread ``warm_lead``
+    seconds before the deadline, e.g. to open the connection that thread's
+    first request will use. Jitter is taken when the request is handed to
+    the network (see ``mark_send``), so time spent in ``fire`` before that
+    point counts against the release.
+    """
+
+    def __init__(
+        self,
+        clock: ClockSkewEstimator,
+        workers: int,
+        lead: float = 0.0,
+        spin: float = 0.02,
+        warm: Optional[Callable[[], None]] = None,
+        warm_lead: float = 0.0,
+    ):
+        self.clock = clock
+        self.workers = workers
+        self.lead = lead
+        self.spin = spin
+        self.warm = warm
+        self.warm_lead = warm_lead
+        self.logger = logging.getLogger(__name__)
+
+    def deadline_for(self, target_server_time: float) -> float:
+        """time.monotonic() value at which to release"""
+        bounds = self.clock.bounds()
+        low = bounds[0] if bounds is not None else 0.0
+        local_target = target_server_time - low - self.lead
+        return time.monotonic() + (local_target - time.time())
+
+    def run(
+        self,
+        target_server_time: float,
+        items: Iterable[T],
+        fire: Callable[[T], None],
+    ) -> ReleaseReport:
+        """
+        Wait for the target and call fire(item) for every item
+
+        Args:
+            target_server_time: Release time as a server epoch timestamp
+            items: Prepared work
+            fire: Sends one item; exceptions are logged and swallowed
+
+        Returns:
+            ReleaseReport with the achieved jitter
+        """
+        pending: "queue.SimpleQueue[T]" = queue.SimpleQueue()
+        count = 0
+        for item in items:
+            pending.put(item)
+            count += 1
+
+        report = ReleaseReport(
+            target_server_time=target_server_time,
+            offset_seconds=self.clock.offset,
+            offset_uncertainty=self.clock.uncertainty,
+            clock_samples=self.clock.samples,
+            rtt_seconds=self.clock.rtt,
+            released=count,
+        )
+        if not count:
+            return report
+
+        warm_gate = threading.Event()
+        gate = threading.Event()
+        deadline = [0.0]
+        lock = threading.Lock()
+
+        def worker():
+            if self.warm is not None:
+                warm_gate.wait()
+                try:
+                    self.warm()
+                except Exception:
+                    self.logger.exception("Connection warm-up failed")
+            gate.wait()
+            first = True
+            while True:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    return
+                sent: List[float] = []
+
+                def on_send() -> None:
+                    if not sent:
+                        sent.append(time.monotonic() - deadline[0])
+
+                token = _on_send.set(on_send)
+                try:
+                    fire(item)
+                except Exception:
+                    self.logger.exception("Scheduled release failed")
+                finally:
+                    _on_send.reset(token)
+                if not sent:
+                    # Failed before reaching the network; nothing to time
+                    continue
+                with lock:
+                    if first:
+                        report.first_wave.append(sent[0])
+                    report.last_release = max(report.last_release, sent[0])
+                if first:
+                    RELEASE_JITTER.observe(max(sent[0], 0.0))
+                    first = False
+
+        threads = [
+            threading.Thread(target=worker, name=f"release-{index}", daemon=True)
+            for index in range(min(self.workers, count))
+        ]
+        for thread in threads:
+            thread.start()
+
+        deadline[0] = self.deadline_for(target_server_time)
+        if self.warm is not None:
+            self._wait_until(deadline[0] - self.warm_lead)
+            warm_gate.set()
+        self._wait_until(deadline[0])
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        self.logger.info("Scheduled release: %s", report.to_dict())
+        return report
+
+    def _wait_until(self, deadline: float) -> None:
+        """Sleep until shortly before the deadline, then spin"""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= self.spin:
+                break
+            time.sleep(min(remaining - self.spin, 1.0))
+        while time.monotonic() < deadline:
+            pass
@@ -0,0 +1,260 @@
+"""
+Soak testing: run the bulk pipeline for hours and watch process resources
+"""
+
+import contextlib
+import gc
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from ..models.user import User
+
+
+@dataclass
+class ResourceSample:
+    """Process resources at one point of a soak run"""
+
+    elapsed: float
+    applications: int
+    rss_bytes: Optional[int]  # None where /proc is unavailable
+    open_fds: Optional[int]
+    threads: int
+    gc_objects: int  # tracked objects left after a full collection
+    gc_collections: List[int]  # per generation, since interpreter start
+    gc_uncollectable: int
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def read_rss() -> Optional[int]:
+    """Resident set size of this process in bytes"""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def count_open_fds() -> Optional[int]:
+    """Open file descriptors of this process"""
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            continue
+    return None
+
+
+def sample_resources(elapsed: float, applications: int) -> ResourceSample:
+    """
+    Take one sample
+
+    Runs a full collection first, so object counts show what is retained
+    rather than garbage waiting for the next collection.
+    """
+    gc.collect()
+    return ResourceSample(
+        elapsed=round(elapsed, 3),
+        applications=applications,
+        rss_bytes=read_rss(),
+        open_fds=count_open_fds(),
+        threads=threading.active_count(),
+        gc_objects=len(gc.get_objects()),
+        gc_collections=[stats["collections"] for stats in gc.get_stats()],
+        gc_uncollectable=len(gc.garbage),
+    )
+
+
+@dataclass
+class SoakThresholds:
+    """Largest growth allowed between the end of warm-up and the end of the run"""
+
+    rss_mb: float = 64.0
+    fds: int = 8
+    threads: int = 4
+    objects: int = 50000
+
+    @classmethod
+    def from_settings(cls, settings) -> "SoakThresholds":
+        return cls(
+            rss_mb=settings.SOAK_MAX_RSS_GROWTH_MB,
+            fds=settings.SOAK_MAX_FD_GROWTH,
+            threads=settings.SOAK_MAX_THREAD_GROWTH,
+            objects=settings.SOAK_MAX_OBJECT_GROWTH,
+        )
+
+
+class SoakReport:
+    """
+    Growth of each resource over a soak run
+
+    Caches, connection pools and worker threads fill up during the first
+    runs, so growth is measured from the first sample taken after
+    ``warmup`` applications to the last sample.
+    """
+
+    def __init__(self, samples: List[ResourceSample], warmup: int, failures: int = 0):
+        self.samples = samples
+        self.warmup = warmup
+        self.failures = failures
+
+    @property
+    def baseline(self) -> Optional[ResourceSample]:
+        return next(
+            (sample for sample in self.samples if sample.applications >= self.warmup),
+            None,
+        )
+
+    @property
+    def final(self) -> Optional[ResourceSample]:
+        return self.samples[-1] if self.samples else None
+
+    def growth(self) -> Dict[str, Optional[float]]:
+        """Change of each resource since the baseline (None if not measured)"""
+        baseline, final = self.baseline, self.final
+        if baseline is None or baseline is final:
+            return {}
+
+        def delta(field: str) -> Optional[float]:
+            before, after = getattr(baseline, field), getattr(final, field)
+            if before is None or after is None:
+                return None
+            return after - before
+
+        rss = delta("rss_bytes")
+        return {
+            "rss_mb": round(rss / (1024 * 1024), 1) if rss is not None else None,
+            "fds": delta("open_fds"),
+            "threads": delta("threads"),
+            "objects": delta("gc_objects"),
+            "uncollectable": delta("gc_uncollectable"),
+        }
+
+    def violations(self, thresholds: SoakThresholds) -> List[str]:
+        """Resources that grew past their threshold"""
+        growth = self.growth()
+        if not growth:
+            return [
+                f"Run too short: no samples after the {self.warmup}-application warm-up"
+            ]
+
+        found = []
+        if self.failures:
+            # The stand-in accepts everything; failures mean the runs did
+            # not exercise the full chain
+            found.append(f"{self.failures} applications failed")
+        for field, limit in asdict(thresholds).items():
+            value = growth.get(field)
+            if value is not None and value > limit:
+                found.append(f"{field} grew by {value} (limit {limit})")
+        if growth["uncollectable"]:
+            found.append(
+                f"{growth['uncollectable']} uncollectable objects in gc.garbage"
+            )
+        return found
+
+    def to_dict(self) -> Dict:
+        return {
+            "warmup": self.warmup,
+            "applications": self.final.applications if self.final else 0,
+            "failures": self.failures,
+            "growth": self.growth(),
+            "baseline": self.baseline.to_dict() if self.baseline else None,
+            "final": self.final.to_dict() if self.final else None,
+        }
+
+
+def synthetic_users(count: int, dps: int = 1) -> List[User]:
+    """Accounts for a local stand-in backend, spread over ``dps`` client IDs"""
+    return [
+        User(100 + index % dps, f"soak{index:05d}", "soak-password", "SOAK0000", 1234)
+        for index in range(count)
+    ]
+
+
+class SoakTest:
+    """
+    Apply for issue after issue with one long-lived ApplicationService
+
+    Mirrors a daemon: the same service, client and caches serve every
+    bulk run, each run on a new company ID so every account applies again.
+    A sample is taken after every ``sample_every`` runs. Output of the bulk
+    runs is discarded; pass ``on_sample`` to report progress.
+    """
+
+    def __init__(
+        self,
+        service,
+        users: List[User],
+        kitta_amount: int = 10,
+        sample_every: int = 1,
+        output: Optional[str] = None,
+    ):
+        self.service = service
+        self.users = users
+        self.kitta_amount = kitta_amount
+        self.sample_every = sample_every
+        self.output = output
+
+    def run(
+        self,
+        applications: int,
+        duration: Optional[float] = None,
+        warmup: Optional[int] = None,
+        on_sample: Optional[Callable[[ResourceSample], None]] = None,
+    ) -> SoakReport:
+        """
+        Run until ``applications`` have been attempted or ``duration`` seconds
+        have passed, whichever comes first
+
+        Args:
+            applications: Applications to attempt
+            duration: Optional time limit in seconds
+            warmup: Applications before the baseline sample (default 10%)
+            on_sample: Called with each sample
+
+        Returns:
+            SoakReport over all samples
+        """
+        if warmup is None:
+            warmup = applications // 10
+
+        samples: List[ResourceSample] = []
+        done = failures = runs = 0
+        started = time.monotonic()
+
+        def take() -> None:
+            sample = sample_resources(time.monotonic() - started, done)
+            samples.append(sample)
+            if self.output:
+                with open(self.output, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(sample.to_dict()) + "\n")
+            if on_sample is not None:
+                on_sample(sample)
+
+        take()
+        with open(os.devnull, "w") as devnull:
+            while done < applications:
+                if duration is not None and time.monotonic() - started >= duration:
+                    break
+                runs += 1
+                with contextlib.redirect_stdout(devnull):
+                    result = self.service.process_bulk_applications(
+                        self.users, runs, self.kitta_amount
+                    )
+                done += result.total_accounts
+                failures += result.failed
+                if runs % self.sample_every == 0:
+                    take()
+
+        if samples[-1].applications != done:
+            take()
+        return SoakReport(samples, warmup, failures)
@@ -0,0 +1,122 @@
+"""
+Bytes-on-wire accounting per endpoint and per account
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from .metrics import REGISTRY
+
+HTTP_SENT_BYTES = REGISTRY.counter(
+    "ipo_http_sent_bytes", "Request bytes sent, headers included", ["endpoint"]
+)
+HTTP_RECEIVED_BYTES = REGISTRY.counter(
+    "ipo_http_received_bytes",
+    "Response bytes received on the wire (compressed), headers included",
+    ["endpoint"],
+)
+HTTP_DECODED_BYTES = REGISTRY.counter(
+    "ipo_http_decoded_bytes", "Response body bytes after decompression", ["endpoint"]
+)
+
+SHARED = "(shared)"  # requests made outside any account's work
+
+_account: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "transfer_account", default=SHARED
+)
+
+
+@contextmanager
+def account_scope(username: str) -> Iterator[None]:
+    """Attribute requests made by the calling thread to an account"""
+    token = _account.set(username)
+    try:
+        yield
+    finally:
+        _account.reset(token)
+
+
+def _empty() -> Dict[str, int]:
+    return {"requests": 0, "sent": 0, "received": 0, "decoded": 0}
+
+
+class TransferStats:
+    """
+    Running byte totals per endpoint template and per account
+
+    ``received`` counts what crossed the wire, so it shows the effect of
+    compression; ``decoded`` is the body after decompression. Totals only
+    grow; ``snapshot`` and ``since`` give the share of a single run.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, int]] = {}
+        self._accounts: Dict[str, Dict[str, int]] = {}
+
+    def record(self, template: str, sent: int, received: int, decoded: int) -> None:
+        """Add one request/response exchange"""
+        HTTP_SENT_BYTES.inc(template, amount=sent)
+        HTTP_RECEIVED_BYTES.inc(template, amount=received)
+        HTTP_DECODED_BYTES.inc(template, amount=decoded)
+        account = _account.get()
+        with self._lock:
+            for totals in (
+                self._endpoints.setdefault(template, _empty()),
+                self._accounts.setdefault(account, _empty()),
+            ):
+                totals["requests"] += 1
+                totals["sent"] += sent
+                totals["received"] += received
+                totals["decoded"] += decoded
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Copy of the current totals"""
+        with self._lock:
+            return {
+                "endpoints": {k: dict(v) for k, v in self._endpoints.items()},
+                "accounts": {k: dict(v) for k, v in self._accounts.items()},
+            }
+
+    def since(self, before: Dict) -> Dict:
+        """
+        Report of the traffic since an earlier snapshot
+
+        Returns:
+            Dictionary with per-endpoint and per-account totals, the overall
+            total, and the average and largest account
+        """
+        now = self.snapshot()
+        report = {}
+        for section in ("endpoints", "accounts"):
+            earlier = before.get(section, {})
+            report[section] = {}
+            for name, totals in now[section].items():
+                delta = {
+                    field: value - earlier.get(name, {}).get(field, 0)
+                    for field, value in totals.items()
+                }
+                if delta["requests"]:
+                    report[section][name] = delta
+
+        total = _empty()
+        for totals in report["endpoints"].values():
+            for field, value in totals.items():
+                total[field] += value
+        report["total"] = total
+
+        accounts = {
+            name: totals["sent"] + totals["received"]
+            for name, totals in report["accounts"].items()
+            if name != SHARED
+        }
+        report["per_account"] = {
+            "accounts": len(accounts),
+            "average_bytes": (
+                round(sum(accounts.values()) / len(accounts)) if accounts else 0
+            ),
+            "max_bytes": max(accounts.values(), default=0),
+        }
+        return report
@@ -0,0 +1,157 @@
+"""
+Watchdog for worker attempts stuck past their stage deadline
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from ..config.constants import ApplicationStage
+
+
+class Attempt:
+    """One worker's in-flight attempt for an account"""
+
+    RUNNING = "running"
+    APPLYING = "applying"  # claimed the apply request
+    FINISHED = "finished"
+    ABANDONED = "abandoned"
+
+    def __init__(self, key: str, item=None):
+        self.key = key
+        self.item = item
+        self.thread = threading.current_thread()
+        self.started = time.monotonic()
+        self.stage: Optional[str] = None  # last completed stage
+        self.stage_started = self.started
+        self.state = self.RUNNING
+        self.claimed = False  # set once the apply request was claimed
+        self._lock = threading.Lock()
+
+    @property
+    def next_stage(self) -> str:
+        """Stage the attempt is working on"""
+        if self.stage is None:
+            return ApplicationStage.ORDER[0]
+        index = ApplicationStage.ORDER.index(self.stage)
+        return ApplicationStage.ORDER[min(index + 1, len(ApplicationStage.ORDER) - 1)]
+
+    def claim_apply(self) -> bool:
+        """Move from RUNNING to APPLYING; False if already abandoned"""
+        with self._lock:
+            if self.state != self.RUNNING:
+                return False
+            self.state = self.APPLYING
+            self.claimed = True
+            return True
+
+    def transition(self, state: str) -> bool:
+        """Move out of RUNNING or APPLYING; only the first caller succeeds"""
+        with self._lock:
+            if self.state not in (self.RUNNING, self.APPLYING):
+                return False
+            self.state = state
+            return True
+
+
+class Watchdog:
+    """
+    Detects attempts that overrun the deadline of the stage they are in
+
+    Workers call ``begin`` before an attempt and ``finish`` after it;
+    ``stage_done``, called on the worker's thread, moves an attempt to its
+    next stage and restarts the clock. A background thread checks every
+    ``interval`` seconds, and the first attempt found past
+    ``deadlines[next_stage]`` is marked abandoned and passed to
+    ``on_stuck``. A worker whose ``finish`` returns False was abandoned
+    and must discard its result and stop: ``on_stuck`` has already
+    released its slot and arranged for the work to continue. Python
+    threads cannot be killed, so the stuck one is left to unwind when its
+    request finally returns or times out.
+
+    Right before the apply request the worker calls ``claim_apply``. It
+    returns False once the attempt has been abandoned, so a late thread
+    never sends the apply its replacement may also send; an attempt
+    abandoned after a successful claim has ``claimed`` set, and its apply
+    may or may not have reached the server.
+    """
+
+    def __init__(
+        self,
+        deadlines: Dict[str, float],
+        on_stuck: Callable[[Attempt, float], None],
+        interval: float = 1.0,
+    ):
+        self.deadlines = deadlines
+        self.on_stuck = on_stuck
+        self.interval = interval
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._running: Dict[str, Attempt] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Watchdog":
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def begin(self, key: str, item=None) -> Attempt:
+        """Register an attempt started on the calling thread"""
+        attempt = Attempt(key, item)
+        with self._lock:
+            self._running[key] = attempt
+        return attempt
+
+    def stage_done(self, key: str, stage: str) -> None:
+        """Record that the attempt for key completed a stage"""
+        with self._lock:
+            attempt = self._running.get(key)
+        # An abandoned worker still running the same account must not move
+        # its replacement's clock
+        if (
+            attempt is not None
+            and attempt.state == Attempt.RUNNING
+            and attempt.thread is threading.current_thread()
+        ):
+            attempt.stage = stage
+            attempt.stage_started = time.monotonic()
+
+    def claim_apply(self, attempt: Attempt) -> bool:
+        """Claim the apply request for an attempt; False if it was abandoned"""
+        return attempt.claim_apply()
+
+    def finish(self, attempt: Attempt) -> bool:
+        """End an attempt; False if the watchdog abandoned it first"""
+        with self._lock:
+            if self._running.get(attempt.key) is attempt:
+                del self._running[attempt.key]
+        return attempt.transition(Attempt.FINISHED)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            for attempt, overrun in self._overdue():
+                if attempt.transition(Attempt.ABANDONED):
+                    try:
+                        self.on_stuck(attempt, overrun)
+                    except Exception:
+                        self.logger.exception("Watchdog handler failed")
+
+    def _overdue(self) -> List:
+        now = time.monotonic()
+        overdue = []
+        with self._lock:
+            for key, attempt in list(self._running.items()):
+                deadline = self.deadlines.get(attempt.next_stage)
+                elapsed = now - attempt.stage_started
+                if deadline is not None and elapsed > deadline:
+                    del self._running[key]
+                    overdue.append((attempt, elapsed))
+        return overdue
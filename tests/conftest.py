@@ -0,0 +1,33 @@
+"""
+Shared fixtures: a local stand-in backend and settings pointed at it
+"""
+
+import pytest
+
+from src.api.client_registry import reset_client
+from src.config.settings import get_settings
+from src.utils.mock_server import MockMeroShareServer
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    """Process settings with files kept in a scratch directory"""
+    settings = get_settings()
+    monkeypatch.setattr(
+        settings, "CREDENTIAL_HEALTH_FILE", str(tmp_path / "credential_health.db")
+    )
+    monkeypatch.setattr(settings, "SHOW_PROGRESS_BAR", False)
+    monkeypatch.setattr(settings, "RATE_LIMIT_DELAY", 0.0)
+    return settings
+
+
+@pytest.fixture
+def backend(settings, monkeypatch):
+    """Stand-in MeroShare backend the shared client talks to"""
+    with MockMeroShareServer() as server:
+        monkeypatch.setattr(settings, "API_BASE_URL", server.base_url)
+        reset_client()
+        try:
+            yield server
+        finally:
+            reset_client()
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from src.config.constants import ApplicationStage
+from src.config.settings import Settings
+from src.models.user import User
+from src.services.application_service import ApplicationService
+
+APPLY = "POST /meroShare/applicantForm/share/apply/"
+STALL_SECONDS = 3.0
+
+
+@pytest.fixture
+def stalling_backend(backend, settings, monkeypatch):
+    """Backend whose bank lookups can hang past a 1s stage deadline"""
+    backend.stall_seconds = STALL_SECONDS
+    monkeypatch.setattr(settings, "ELIGIBILITY_PREFILTER", False)
+    monkeypatch.setattr(settings, "MAX_CONCURRENT_REQUESTS", 2)
+    monkeypatch.setattr(settings, "WATCHDOG_INTERVAL", 0.2)
+    monkeypatch.setattr(settings, "IN_RUN_RETRIES", 0)
+    deadlines = {stage: 10.0 for stage in ApplicationStage.ORDER}
+    deadlines[ApplicationStage.BANK] = 1.0
+    monkeypatch.setattr(Settings, "stage_deadlines", property(lambda self: deadlines))
+    return backend
+
+
+def run_bulk(users):
+    result = ApplicationService().process_bulk_applications(users, 1, 10)
+    # The abandoned worker is not waited for; let its stalled read return
+    time.sleep(STALL_SECONDS + 1.0)
+    return result
+
+
+def test_stuck_attempt_does_not_apply_after_requeue(stalling_backend):
+    stalling_backend.stalls["GET /bankRequest/"] = 1
+    users = [User(1, "u1", "pw", "CRN1", 1111), User(1, "u2", "pw", "CRN2", 2222)]
+
+    result = run_bulk(users)
+
+    assert [event["action"] for event in result.tail_events] == ["requeued"]
+    assert stalling_backend.requests[APPLY] == len(users)
+    assert result.successful == len(users)
+
+
+def test_stuck_attempt_does_not_apply_after_giving_up(stalling_backend):
+    stalling_backend.stalls["GET /bankRequest/"] = 2
+    users = [User(1, "u1", "pw", "CRN1", 1111)]
+
+    result = run_bulk(users)
+
+    assert [event["action"] for event in result.tail_events] == [
+        "requeued",
+        "failed",
+    ]
+    assert stalling_backend.requests[APPLY] == 0
+    assert "stuck in bank" in result.applications[0].error_message
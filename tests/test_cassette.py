@@ -0,0 +1,49 @@
+import json
+
+from src.api.cassette import Cassette
+from src.api.meroshare_client import MeroShareClient
+from src.models.user import User
+from src.services.application_service import ApplicationService
+
+
+def test_recorded_cassette_holds_no_account_identifiers(backend, tmp_path, monkeypatch):
+    path = tmp_path / "run.json"
+    cassette = Cassette(path, mode="record")
+    monkeypatch.setattr(MeroShareClient, "transport", cassette)
+
+    user = User(101, "ram.sharma", "s3cret-pass", "CRN998877", 4321)
+    application = ApplicationService().apply_for_user(user, 1, 10)
+    assert application.is_successful
+    cassette.save()
+
+    recorded = path.read_text(encoding="utf-8")
+    demat = backend.demat_for(user.username)
+    for secret in (
+        user.username,
+        user.password,
+        user.crn,
+        str(user.pin),
+        demat,
+        demat[-8:],  # BOID
+        "000123",  # bank account number
+    ):
+        assert secret not in recorded
+
+    paths = [entry["path"] for entry in json.loads(recorded)["interactions"]]
+    assert "/api/meroShareView/myDetail/demat-1" in paths
+
+
+def test_replay_of_scrubbed_cassette_applies(backend, tmp_path, monkeypatch):
+    path = tmp_path / "run.json"
+    recorder = Cassette(path, mode="record")
+    monkeypatch.setattr(MeroShareClient, "transport", recorder)
+    ApplicationService().apply_for_user(User(101, "sita", "pw", "CRN1", 1234), 1, 10)
+    recorder.save()
+
+    player = Cassette(path, mode="replay", latency_scale=0)
+    monkeypatch.setattr(MeroShareClient, "transport", player)
+    (user,) = player.replay_users()
+    application = ApplicationService().apply_for_user(user, 1, 10)
+
+    assert application.is_successful
+    player.assert_calls_per_account()
@@ -0,0 +1,45 @@
+import threading
+import time
+
+from src.utils.hedging import HedgeBudget, Hedger
+
+
+def test_time_queued_for_a_pool_thread_does_not_trigger_a_hedge():
+    hedger = Hedger(HedgeBudget(ratio=1.0), min_samples=1, max_workers=1)
+    hedger.latency.observe("read", 0.05)
+    calls = []
+
+    def read():
+        calls.append(time.perf_counter())
+        time.sleep(0.01)
+        return "ok"
+
+    # Hold the only pool thread well past the hedge delay
+    release = threading.Event()
+    hedger._pool.submit(release.wait, 0.3)
+    try:
+        assert hedger.call("read", read) == "ok"
+    finally:
+        release.set()
+        time.sleep(0.05)
+        hedger.close()
+
+    assert len(calls) == 1
+
+
+def test_slow_primary_is_hedged():
+    hedger = Hedger(HedgeBudget(ratio=1.0), min_samples=1, max_workers=2)
+    hedger.latency.observe("read", 0.02)
+    calls = []
+
+    def read():
+        calls.append(None)
+        time.sleep(0.5 if len(calls) == 1 else 0.01)
+        return len(calls)
+
+    try:
+        started = time.perf_counter()
+        assert hedger.call("read", read) == 2
+        assert time.perf_counter() - started < 0.3
+    finally:
+        hedger.close()
@@ -0,0 +1,44 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.services.issue_catalog_service import IssueCatalogService
+
+NEPAL = timezone(timedelta(hours=5, minutes=45))
+
+
+@pytest.fixture(params=["America/New_York", "UTC", "Asia/Tokyo"])
+def host_timezone(request, monkeypatch):
+    """Run with the host clock in a time zone other than Nepal's"""
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.mark.parametrize(
+    "fmt", ["%b %d, %Y %I:%M:%S %p", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]
+)
+def test_close_deadline_is_read_as_nepal_time(host_timezone, fmt):
+    closes = datetime.now(NEPAL) + timedelta(hours=2)
+    issue = {"issueCloseDate": closes.strftime(fmt)}
+
+    deadline = IssueCatalogService.close_deadline(issue)
+
+    assert deadline.remaining() == pytest.approx(2 * 3600, abs=5)
+
+
+def test_bare_close_date_ends_at_nepal_midnight(host_timezone):
+    today = datetime.now(NEPAL)
+    midnight = (today + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    issue = {"issueCloseDate": today.strftime("%Y-%m-%d")}
+
+    deadline = IssueCatalogService.close_deadline(issue)
+
+    assert deadline.remaining() == pytest.approx(
+        (midnight - today).total_seconds(), abs=5
+    )